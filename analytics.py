@@ -0,0 +1,252 @@
+"""
+Exact score distributions, computed instead of estimated by playing.
+
+Every shot independently misses or hits the animal that appeared, so a
+session's final score is the sum of n independent draws from the per-shot
+points distribution. Its exact distribution is the n-fold convolution of that
+distribution with itself, computed here by repeated squaring: each power is a
+memoized convolution of two smaller ones, done with an FFT once the supports
+are large. Points are divided by their greatest common divisor first, so the
+default game (0, 10 or 20 points per shot) needs 2n + 1 bins, not 20n + 1.
+
+Probabilities are exact up to floating point rounding of about 1e-15.
+"""
+import functools
+import math
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from shooting_game import Animal, Gun
+from simulation import hit_probability, points_table
+
+# Below this many bins in the shorter operand, np.convolve beats the FFT
+_DIRECT_CONVOLVE: int = 64
+
+
+class PairStatistics(NamedTuple):
+    """
+    The points of one shot with a gun at an animal that has appeared.
+
+    Attributes:
+        gun (str): The name of the gun.
+        animal (str): The name of the animal.
+        spawn_probability (float): The probability that the animal appears.
+        hit_probability (float): The probability that the shot hits.
+        mean (float): The expected points of the shot.
+        variance (float): The variance of the points of the shot.
+    """
+    gun: str
+    animal: str
+    spawn_probability: float
+    hit_probability: float
+    mean: float
+    variance: float
+
+
+class ScoreDistribution:
+    """
+    The exact distribution of the total points of a number of shots.
+
+    Scores are offset + step * i for i in range(len(probabilities)).
+
+    Attributes:
+        shots (int): The number of shots.
+        offset (int): The lowest possible score.
+        step (int): The distance between consecutive possible scores.
+        probabilities (np.ndarray): The probability of each score, lowest first.
+        mean (float): The expected score.
+        variance (float): The variance of the score.
+    """
+    def __init__(self, shots: int, offset: int, step: int, probabilities: np.ndarray, mean: float, variance: float):
+        """Initializes a ScoreDistribution instance."""
+        self.shots: int = shots
+        self.offset: int = offset
+        self.step: int = step
+        self.probabilities: np.ndarray = probabilities
+        self.mean: float = mean
+        self.variance: float = variance
+
+    @property
+    def stdev(self) -> float:
+        """The standard deviation of the score."""
+        return math.sqrt(self.variance)
+
+    @property
+    def scores(self) -> np.ndarray:
+        """The score of each entry of probabilities."""
+        return self.offset + self.step * np.arange(len(self.probabilities), dtype=np.int64)
+
+    def _index(self, score: int) -> float:
+        """Returns the position of a score in probabilities, fractional if it cannot occur."""
+        return (score - self.offset) / self.step
+
+    def probability(self, score: int) -> float:
+        """
+        Returns the probability of finishing with exactly this score.
+
+        Args:
+            score: The final score.
+        """
+        index: float = self._index(score)
+        if index != int(index) or not 0 <= index < len(self.probabilities):
+            return 0.0
+        return float(self.probabilities[int(index)])
+
+    def cdf(self, score: int) -> float:
+        """
+        Returns the probability of finishing with at most this score.
+
+        Args:
+            score: The final score.
+        """
+        index: int = math.floor(self._index(score))
+        if index < 0:
+            return 0.0
+        return min(1.0, float(self.probabilities[:index + 1].sum()))
+
+    def quantile(self, fraction: float) -> int:
+        """
+        Returns the lowest score reached with at least the given probability.
+
+        Args:
+            fraction: The cumulative probability, between 0 and 1.
+
+        Raises:
+            ValueError: If fraction is outside [0, 1].
+        """
+        if not 0.0 <= fraction <= 1.0:
+            raise ValueError(f"Quantile fraction must be between 0 and 1, got {fraction}")
+        cumulative: np.ndarray = np.cumsum(self.probabilities)
+        index: int = int(np.searchsorted(cumulative, fraction - 1e-12))
+        return self.offset + self.step * min(index, len(self.probabilities) - 1)
+
+
+def _spawn_probabilities(animals: Sequence[Animal], weights: Optional[Sequence[float]]) -> np.ndarray:
+    """Normalizes spawn weights, defaulting to the uniform spawns of Game.random_animal."""
+    if weights is None:
+        return np.full(len(animals), 1.0 / len(animals))
+    spawn: np.ndarray = np.asarray(weights, dtype=np.float64)
+    if spawn.shape != (len(animals),) or np.any(spawn < 0) or spawn.sum() <= 0:
+        raise ValueError("Spawn weights must be one non-negative weight per animal, not all zero.")
+    return spawn / spawn.sum()
+
+
+def _convolve(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Convolves two probability vectors, through an FFT when both are long."""
+    if min(len(a), len(b)) <= _DIRECT_CONVOLVE:
+        return np.convolve(a, b)
+    length: int = len(a) + len(b) - 1
+    size: int = 1 << (length - 1).bit_length()
+    result: np.ndarray = np.fft.irfft(np.fft.rfft(a, size) * np.fft.rfft(b, size), size)[:length]
+    # Rounding leaves tiny negative values where the probability is zero
+    np.maximum(result, 0.0, out=result)
+    return result
+
+
+@functools.lru_cache(maxsize=128)
+def _power(shot: Tuple[float, ...], shots: int) -> np.ndarray:
+    """The distribution of the sum of several shots, memoized across calls and sessions."""
+    if shots == 0:
+        result: np.ndarray = np.ones(1)
+    elif shots == 1:
+        result = np.array(shot)
+    else:
+        half: np.ndarray = _power(shot, shots // 2)
+        result = _convolve(half, half)
+        if shots % 2:
+            result = _convolve(result, _power(shot, 1))
+        result /= result.sum()
+    result.flags.writeable = False # Shared by the cache
+    return result
+
+
+def shot_distribution(gun: Gun, animals: Sequence[Animal], weights: Optional[Sequence[float]] = None) -> ScoreDistribution:
+    """
+    Computes the distribution of the points of a single shot.
+
+    Args:
+        gun: The gun fired.
+        animals: The animals that can appear.
+        weights: The relative spawn weight of each animal, e.g. SpawnTable.weights.
+            Defaults to uniform spawns.
+
+    Raises:
+        ValueError: If there are no animals, or the weights or accuracy are invalid.
+
+    Returns:
+        The distribution of the points of one shot.
+    """
+    return score_distribution(gun, animals, 1, weights)
+
+
+def score_distribution(
+    gun: Gun,
+    animals: Sequence[Animal],
+    shots: int,
+    weights: Optional[Sequence[float]] = None,
+) -> ScoreDistribution:
+    """
+    Computes the exact distribution of a session's final score.
+
+    Args:
+        gun: The gun used for every shot.
+        animals: The animals that can appear.
+        shots: The number of shots fired in the session.
+        weights: The relative spawn weight of each animal, e.g. SpawnTable.weights.
+            Defaults to uniform spawns.
+
+    Raises:
+        ValueError: If shots is negative, there are no animals, or the weights or
+            accuracy are invalid.
+
+    Returns:
+        The distribution of the total points of the session.
+    """
+    if shots < 0:
+        raise ValueError("The number of shots must not be negative.")
+    values: np.ndarray = points_table(animals)
+    spawn: np.ndarray = _spawn_probabilities(animals, weights)
+    accuracy: float = hit_probability(gun)
+
+    offset: int = min(0, int(values.min()))
+    step: int = math.gcd(*(int(value) - offset for value in values), -offset) or 1
+    shot: np.ndarray = np.zeros((int(values.max()) - offset) // step + 1)
+    shot[-offset // step] += 1.0 - accuracy # A miss scores 0
+    np.add.at(shot, (values - offset) // step, accuracy * spawn)
+
+    shot_mean: float = float(accuracy * (spawn * values).sum())
+    shot_variance: float = float(accuracy * (spawn * values * values).sum()) - shot_mean * shot_mean
+    return ScoreDistribution(
+        shots, offset * shots, step, _power(tuple(shot.tolist()), shots),
+        shot_mean * shots, max(0.0, shot_variance) * shots,
+    )
+
+
+def pair_statistics(
+    guns: Sequence[Gun],
+    animals: Sequence[Animal],
+    weights: Optional[Sequence[float]] = None,
+) -> List[PairStatistics]:
+    """
+    Reports the expected points and variance of a shot for every (gun, animal) pair.
+
+    Args:
+        guns: The guns.
+        animals: The animals.
+        weights: The relative spawn weight of each animal. Defaults to uniform spawns.
+
+    Returns:
+        One entry per pair, grouped by gun in the order given.
+    """
+    spawn: np.ndarray = _spawn_probabilities(animals, weights)
+    rows: List[PairStatistics] = []
+    for gun in guns:
+        accuracy: float = hit_probability(gun)
+        for animal, spawn_probability in zip(animals, spawn.tolist()):
+            points: int = animal.points_value
+            rows.append(PairStatistics(
+                gun.name, animal.name, spawn_probability, accuracy,
+                accuracy * points, accuracy * (1.0 - accuracy) * points * points,
+            ))
+    return rows
@@ -0,0 +1,191 @@
+"""
+Non-interactive batch mode for scripted command streams.
+
+A script holds the commands a player would type, one per line: the gun choice,
+then "1" to shoot or "2" to end the game. run_batch() reads the script in large
+chunks and pushes every command through the game's state machine
+(Game.handle_input, then Game.handle_action once a gun is chosen), so there are
+no prompts and no text is formatted. Only a summary is produced, plus, if asked
+for, a compact log with one line per command:
+
+    gun Rifle
+    Deer +10
+    Bear miss
+    invalid
+    end 10
+
+As in tournaments, a script that runs out before ending the game ends it.
+"""
+import random
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, TextIO, TYPE_CHECKING
+
+from output import OutputSink
+from shooting_game import Game
+
+if TYPE_CHECKING:
+    from catalog import Catalog
+    from score_log import ScoreLog
+
+DEFAULT_CHUNK_SIZE: int = 1 << 20 # Characters read per chunk
+
+# Events written to the action log as "invalid"
+_INVALID_EVENTS = frozenset(("invalid_gun", "invalid_input", "invalid_action", "error"))
+
+
+def read_commands(stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Yields the lines of a command stream, reading it in large chunks.
+
+    Args:
+        stream: A text stream such as an open script file or sys.stdin.
+        chunk_size: The number of characters read at a time.
+
+    Yields:
+        Each line, without surrounding whitespace.
+    """
+    pending: str = ""
+    while True:
+        chunk: str = stream.read(chunk_size)
+        if not chunk:
+            break
+        *lines, pending = (pending + chunk).split("\n")
+        for line in lines:
+            yield line.strip()
+    if pending.strip():
+        yield pending.strip()
+
+
+class ActionLog(OutputSink):
+    """
+    Counts what happens in a batch and optionally logs one compact line per command.
+
+    Attributes:
+        shots (int): The number of shots fired.
+        hits (int): The number of shots that hit.
+        invalid (int): The number of commands that were rejected.
+        stream (Optional[TextIO]): Where the compact log is written, if anywhere.
+        batch_size (int): The number of log lines buffered before they are written out.
+    """
+    def __init__(self, stream: Optional[TextIO] = None, batch_size: int = 4096):
+        """
+        Initializes an ActionLog instance.
+
+        Args:
+            stream: Where the compact log is written. None only counts.
+            batch_size: The number of log lines buffered before they are written out.
+        """
+        self.shots: int = 0
+        self.hits: int = 0
+        self.invalid: int = 0
+        self.stream: Optional[TextIO] = stream
+        self.batch_size: int = batch_size
+        self._lines: List[str] = []
+        self._animal: str = ""
+
+    def emit(self, event: str, template: str, **fields: Any) -> None:
+        """Counts shots, hits and rejected commands, logging them if there is a stream."""
+        # Most events are ignored, so the counting-only path returns as early as possible
+        if event == "shot_hit":
+            self.shots += 1
+            self.hits += 1
+            if self.stream is None:
+                return
+            line: str = f"{self._animal} +{fields['points']}"
+        elif event == "shot_miss":
+            self.shots += 1
+            if self.stream is None:
+                return
+            line = f"{self._animal} miss"
+        elif event == "animal_appear":
+            self._animal = fields["animal"]
+            return
+        elif event in _INVALID_EVENTS:
+            self.invalid += 1
+            line = "invalid"
+        elif event == "gun_selected":
+            line = f"gun {fields['gun']}"
+        elif event == "final_score":
+            line = f"end {fields['score']}"
+        else:
+            return
+        if self.stream is not None:
+            self._lines.append(line)
+            if len(self._lines) >= self.batch_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered log lines in a single write."""
+        if self.stream is not None and self._lines:
+            self.stream.write("\n".join(self._lines) + "\n")
+            self.stream.flush()
+            self._lines.clear()
+
+
+class BatchReport(NamedTuple):
+    """The outcome of a batch run."""
+    commands: int
+    gun: Optional[str]
+    shots: int
+    hits: int
+    invalid: int
+    points: int
+
+    def summary(self) -> str:
+        """Formats the report for display."""
+        hit_rate: float = self.hits / self.shots if self.shots else 0.0
+        return (
+            f"Commands: {self.commands}\n"
+            f"Gun: {self.gun or 'none'}\n"
+            f"Shots: {self.shots} (hit rate {hit_rate:.1%})\n"
+            f"Invalid commands: {self.invalid}\n"
+            f"Final Score: {self.points}"
+        )
+
+
+def run_batch(
+    commands: Iterable[str],
+    rng: Optional[random.Random] = None,
+    log_stream: Optional[TextIO] = None,
+    score_log: Optional["ScoreLog"] = None,
+    player_id: int = 0,
+    catalog: Optional["Catalog"] = None,
+) -> BatchReport:
+    """
+    Plays one game from a command stream, without prompts.
+
+    Commands after the one ending the game are not read.
+
+    Args:
+        commands: The commands, starting with the gun choice, e.g. read_commands(stream).
+        rng: The random number generator for shots and spawns.
+        log_stream: Where the compact per-command log is written, if anywhere.
+        score_log: A persistent log the scoreboard appends the finished game to.
+        player_id: The id of the player in the score log.
+        catalog: The guns and animals to play with.
+
+    Returns:
+        The report of the game.
+    """
+    actions = ActionLog(stream=log_stream)
+    game = Game(sink=actions, rng=rng, score_log=score_log, player_id=player_id, catalog=catalog)
+    game.begin()
+    commands = iter(commands)
+    count: int = 0
+    # Choose the gun through the state machine, then run actions without redisplaying the options menu
+    for command in commands:
+        count += 1
+        game.handle_input(command)
+        if not game.awaiting_gun:
+            break
+    handle_action = game.handle_action
+    if game.is_game_running:
+        for command in commands:
+            count += 1
+            handle_action(command)
+            if not game.is_game_running:
+                break
+    if game.is_game_running:
+        game.end_game() # The script ran out before ending the game
+    actions.flush()
+    gun = game.player.selected_gun
+    return BatchReport(count, gun.name if gun is not None else None, actions.shots, actions.hits, actions.invalid, game.player.points)
@@ -0,0 +1,262 @@
+"""
+Benchmarks for the game's hot paths, with regression checks against a baseline.
+
+Usage:
+    python benchmarks.py run --output results.json
+    python benchmarks.py compare baseline.json results.json --threshold 0.10
+
+Each benchmark reports throughput (operations per second, best of several
+repeats) and per-call latency percentiles. Benchmarks that write output run
+once per output mode, and the scripted game loop once per session length.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from output import BufferedSink, ConsoleSink, EventSink, NullSink, OutputSink
+from rng import RandomService
+from shooting_game import Deer, Game, Player, Rifle, ScoreBoard
+
+OUTPUT_MODES: Tuple[str, ...] = ("null", "buffered", "event", "console")
+SESSION_LENGTHS: Tuple[int, ...] = (10, 100, 1000)
+
+# A benchmark case: name, the operation to time, iterations per repeat, and what
+# to run before each repeat so state from earlier repeats does not skew it, if anything
+Case = Tuple[str, Callable[[], Any], int, Optional[Callable[[], None]]]
+
+
+@contextlib.contextmanager
+def _quiet_stdout() -> Iterator[None]:
+    """Sends everything printed to the null device while benchmarks run."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def _make_sink(mode: str, devnull) -> OutputSink:
+    """Creates the sink for an output mode."""
+    if mode == "null":
+        return NullSink()
+    if mode == "buffered":
+        return BufferedSink(stream=devnull)
+    if mode == "event":
+        return EventSink()
+    if mode == "console":
+        return ConsoleSink()
+    raise ValueError(f"Unknown output mode: {mode}")
+
+
+def _sink_reset(sink: OutputSink) -> Optional[Callable[[], None]]:
+    """Returns what empties a sink between repeats, or None if it keeps nothing."""
+    if isinstance(sink, EventSink):
+        return sink.events.clear
+    return None
+
+
+def _scripted_session(shots: int, sink: OutputSink, rng: RandomService) -> Callable[[], None]:
+    """Returns a function playing one full scripted session through Game.game_loop."""
+    script: List[str] = ["1"] + ["1"] * shots + ["2"]
+
+    def play() -> None:
+        commands = iter(script)
+        game = Game(sink=sink, rng=rng, input_func=lambda prompt: next(commands))
+        game.start_game()
+    return play
+
+
+def build_cases(devnull, scale: float = 1.0) -> List[Case]:
+    """
+    Builds every benchmark case.
+
+    Args:
+        devnull: A text stream discarding its input, used by the buffered sink.
+        scale: Multiplies the number of iterations of each case.
+
+    Returns:
+        The benchmark cases.
+    """
+    def iterations(base: int) -> int:
+        return max(1, int(base * scale))
+
+    rng = RandomService(0)
+    cases: List[Case] = []
+    rifle = Rifle(rng=rng)
+    cases.append(("gun.fire", rifle.fire, iterations(200_000), None))
+    spawn_game = Game(sink=NullSink(), rng=rng)
+    cases.append(("game.random_animal", spawn_game.random_animal, iterations(200_000), None))
+    volley_player = Player(sink=NullSink())
+    volley_player.selected_gun = Rifle(rng=rng)
+    volley: List[Deer] = [Deer(sink=NullSink())] * 100
+    cases.append(("player_volley[shots=100]", lambda: volley_player.shoot_many(volley), iterations(5_000), None))
+
+    # Every case gets its own sink, so no case measures the events collected by another
+    for mode in OUTPUT_MODES:
+        sink: OutputSink = _make_sink(mode, devnull)
+        player = Player(sink=sink)
+        player.selected_gun = Rifle(rng=rng)
+        target = Deer(sink=sink)
+        cases.append((
+            f"player.shoot[{mode}]", lambda player=player, target=target: player.shoot(target),
+            iterations(50_000), _sink_reset(sink),
+        ))
+        sink = _make_sink(mode, devnull)
+        scoreboard = ScoreBoard(sink=sink, max_history=1024)
+        cases.append((
+            f"scoreboard.update_score[{mode}]", lambda scoreboard=scoreboard: scoreboard.update_score(10),
+            iterations(50_000), _sink_reset(sink),
+        ))
+        for shots in SESSION_LENGTHS:
+            sink = _make_sink(mode, devnull)
+            cases.append((
+                f"game_loop[{mode},shots={shots}]",
+                _scripted_session(shots, sink, rng),
+                iterations(50_000 // shots),
+                _sink_reset(sink),
+            ))
+    return cases
+
+
+def measure(
+    func: Callable[[], Any],
+    iterations: int,
+    repeat: int = 3,
+    latency_samples: int = 1000,
+    reset: Optional[Callable[[], None]] = None,
+) -> Dict[str, float]:
+    """
+    Measures the throughput and latency of an operation.
+
+    Args:
+        func: The operation to time.
+        iterations: The number of calls per throughput repeat.
+        repeat: The number of throughput repeats; the fastest one is reported.
+        latency_samples: The number of individually timed calls for the percentiles.
+        reset: Called, untimed, before each repeat and before the latency samples.
+
+    Returns:
+        The operations per second and the p50/p99 latency in nanoseconds.
+    """
+    best: float = float("inf")
+    for _ in range(repeat):
+        if reset is not None:
+            reset()
+        start: float = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, time.perf_counter() - start)
+
+    if reset is not None:
+        reset()
+    clock = time.perf_counter_ns
+    latencies: List[int] = []
+    for _ in range(min(latency_samples, iterations)):
+        start_ns: int = clock()
+        func()
+        latencies.append(clock() - start_ns)
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "ops_per_sec": iterations / best if best > 0 else float("inf"),
+        "p50_ns": latencies[len(latencies) // 2],
+        "p99_ns": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    }
+
+
+def run_benchmarks(scale: float = 1.0, repeat: int = 3, select: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Runs the benchmark suite.
+
+    Args:
+        scale: Multiplies the number of iterations of each case.
+        repeat: The number of throughput repeats per case.
+        select: If given, only cases whose name contains this text are run.
+
+    Returns:
+        The results, keyed by case name, together with metadata about the run.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    with _quiet_stdout(), open(os.devnull, "w") as devnull:
+        for name, func, iterations, reset in build_cases(devnull, scale):
+            if select is None or select in name:
+                results[name] = measure(func, iterations, repeat=repeat, reset=reset)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "scale": scale,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    Compares two benchmark runs.
+
+    Args:
+        baseline: The results of the reference run.
+        current: The results of the run being checked.
+        threshold: The relative throughput drop that counts as a regression.
+
+    Returns:
+        One entry per case present in both runs, with the throughput ratio
+        (current / baseline) and whether it is a regression.
+    """
+    rows: List[Dict[str, Any]] = []
+    for name, base in sorted(baseline["results"].items()):
+        if name not in current["results"]:
+            continue
+        ratio: float = current["results"][name]["ops_per_sec"] / base["ops_per_sec"]
+        rows.append({"name": name, "ratio": ratio, "regression": ratio < 1.0 - threshold})
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the benchmark command line.
+
+    Args:
+        argv: Command-line arguments.
+
+    Returns:
+        The exit status: 1 if compare found a regression, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description="Shooting Game benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="Run the benchmarks and save the results as JSON")
+    run.add_argument("--output", default="benchmark_results.json", help="Where to save the results")
+    run.add_argument("--scale", type=float, default=1.0, help="Multiplier for the number of iterations")
+    run.add_argument("--repeat", type=int, default=3, help="Throughput repeats per benchmark")
+    run.add_argument("--select", default=None, help="Only run benchmarks whose name contains this text")
+    check = commands.add_parser("compare", help="Flag regressions against a baseline")
+    check.add_argument("baseline", help="Results of the reference run")
+    check.add_argument("current", help="Results of the run being checked")
+    check.add_argument("--threshold", type=float, default=0.10, help="Relative throughput drop treated as a regression")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run_benchmarks(scale=args.scale, repeat=args.repeat, select=args.select)
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+        for name, result in results["results"].items():
+            print(f"{name:45} {result['ops_per_sec']:>14,.0f} ops/s  p50 {result['p50_ns']:>8} ns  p99 {result['p99_ns']:>8} ns")
+        return 0
+
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    with open(args.current) as handle:
+        current = json.load(handle)
+    rows = compare(baseline, current, args.threshold)
+    for row in rows:
+        flag: str = "REGRESSION" if row["regression"] else "ok"
+        print(f"{row['name']:45} {row['ratio']:>7.2f}x  {flag}")
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,343 @@
+"""
+Data-driven gun and animal catalogs.
+
+A catalog file lists the guns and animals a Game is played with, in TOML or
+JSON (chosen by the file extension):
+
+    [[guns]]
+    name = "Rifle"
+    accuracy = 0.8
+
+    [[animals]]
+    name = "Deer"
+    points = 10
+    weight = 1.0                                  # optional relative spawn weight
+    behavior = "The deer looks around cautiously." # optional message after appearing
+
+Parsing and validating a large catalog is far slower than reading it back, so
+load_catalog() caches the validated entries in a compact marshal file per
+catalog file, stamped with the SHA-256 of the catalog it was built from. An
+unchanged catalog is then loaded with one hash and one unmarshal, and editing
+the file invalidates the cache by itself; the rebuilt cache replaces the stale
+one, so the cache directory holds one file per catalog however often it changes.
+"""
+import contextlib
+import hashlib
+import json
+import marshal
+import math
+import os
+import random
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, TYPE_CHECKING
+
+try:
+    import tomllib
+except ModuleNotFoundError: # Before Python 3.11 only JSON catalogs can be read
+    tomllib = None
+
+from output import OutputSink
+from shooting_game import Animal, Gun
+
+if TYPE_CHECKING:
+    from spawn_table import SpawnTable
+
+CACHE_MAGIC: bytes = b"SGCC"
+FORMAT_VERSION: int = 1
+CACHE_DIRECTORY: str = "__catalog_cache__"
+
+
+class CatalogError(Exception):
+    """Raised when a catalog file cannot be parsed or contains invalid entries."""
+
+
+class GunSpec(NamedTuple):
+    """A gun entry of a catalog."""
+    name: str
+    accuracy: float
+
+
+class AnimalSpec(NamedTuple):
+    """An animal entry of a catalog."""
+    name: str
+    points: int
+    weight: float = 1.0
+    behavior: Optional[str] = None
+
+
+class CatalogGun(Gun):
+    """A Gun whose name and accuracy come from a catalog entry."""
+    def __init__(self, accuracy: float, rng: Optional[random.Random] = None, name: Optional[str] = None):
+        """
+        Initializes a CatalogGun instance.
+
+        Args:
+            accuracy: The probability, between 0 and 1, that a shot hits.
+            rng: The random number generator used to resolve shots.
+            name: The name shown in messages.
+        """
+        super().__init__(rng=rng, name=name)
+        self.accuracy: float = accuracy
+
+    def fire(self) -> bool:
+        """
+        Fires the gun, hitting with the probability given by its accuracy.
+
+        Returns:
+            True if the shot hits, False otherwise.
+        """
+        return self.rng.random() < self.accuracy
+
+
+class CatalogAnimal(Animal):
+    """An Animal whose name, points and behavior come from a catalog entry."""
+    def __init__(self, points_value: int, sink: Optional[OutputSink] = None, name: Optional[str] = None, behavior: Optional[str] = None):
+        """
+        Initializes a CatalogAnimal instance.
+
+        Args:
+            points_value: The points value for the animal.
+            sink: Where messages are written.
+            name: The name shown in messages.
+            behavior: A message written after the animal appears, if any.
+        """
+        super().__init__(points_value, sink=sink, name=name)
+        self.behavior: Optional[str] = behavior
+
+    def appear(self) -> None:
+        """Prints the appearance message, followed by the animal's behavior if it has one."""
+        super().appear()
+        if self.behavior is not None:
+            self.sink.emit("animal_behavior", "{behavior}", behavior=self.behavior, animal=self.name)
+
+
+class Catalog:
+    """
+    The validated guns and animals of a catalog file.
+
+    Attributes:
+        guns (List[GunSpec]): The guns, in menu order.
+        animals (List[AnimalSpec]): The animals, in spawn table order.
+    """
+    def __init__(self, guns: Sequence[GunSpec], animals: Sequence[AnimalSpec]):
+        """
+        Initializes a Catalog instance.
+
+        Args:
+            guns: The guns, in menu order.
+            animals: The animals, in spawn table order.
+        """
+        self.guns: List[GunSpec] = list(guns)
+        self.animals: List[AnimalSpec] = list(animals)
+
+    @property
+    def has_weights(self) -> bool:
+        """Whether the animals spawn with different weights rather than uniformly."""
+        return len({animal.weight for animal in self.animals}) > 1
+
+    def build_guns(self, rng: Optional[random.Random] = None) -> List[Gun]:
+        """
+        Creates one Gun per gun entry.
+
+        Args:
+            rng: The random number generator shared by the guns.
+
+        Returns:
+            The guns, in menu order.
+        """
+        return [CatalogGun(spec.accuracy, rng=rng, name=spec.name) for spec in self.guns]
+
+    def build_animals(self, sink: Optional[OutputSink] = None) -> List[Animal]:
+        """
+        Creates one Animal per animal entry.
+
+        Args:
+            sink: Where the animals' messages are written.
+
+        Returns:
+            The animals, in catalog order.
+        """
+        return [CatalogAnimal(spec.points, sink=sink, name=spec.name, behavior=spec.behavior) for spec in self.animals]
+
+    def spawn_table(self, animals: Sequence[Animal]) -> "SpawnTable":
+        """
+        Builds a spawn table drawing animals with the catalog's weights.
+
+        Args:
+            animals: The animals built by build_animals().
+
+        Returns:
+            The spawn table.
+        """
+        from spawn_table import SpawnTable
+        return SpawnTable(animals, [spec.weight for spec in self.animals])
+
+    def to_bytes(self) -> bytes:
+        """Encodes the catalog in the cache format."""
+        payload = (tuple(tuple(spec) for spec in self.guns), tuple(tuple(spec) for spec in self.animals))
+        return CACHE_MAGIC + bytes([FORMAT_VERSION]) + marshal.dumps(payload)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Catalog":
+        """
+        Decodes a catalog written by to_bytes().
+
+        Raises:
+            CatalogError: If the data is not a catalog cache of this version.
+        """
+        if data[:4] != CACHE_MAGIC or data[4:5] != bytes([FORMAT_VERSION]):
+            raise CatalogError("Not a catalog cache of this version")
+        try:
+            guns, animals = marshal.loads(data[5:])
+            return cls([GunSpec(*gun) for gun in guns], [AnimalSpec(*animal) for animal in animals])
+        except (EOFError, ValueError, TypeError) as e:
+            raise CatalogError(f"Corrupt catalog cache: {e}") from None
+
+
+def _require(entry: Dict[str, Any], key: str, types: tuple, where: str) -> Any:
+    """Returns a required field of an entry, checking its type."""
+    if key not in entry:
+        raise CatalogError(f"{where} is missing '{key}'")
+    value = entry[key]
+    # bool is an int subclass, but never a valid number here
+    if isinstance(value, bool) or not isinstance(value, types):
+        raise CatalogError(f"{where} has an invalid '{key}': {value!r}")
+    return value
+
+
+def _unique_names(entries: Sequence[NamedTuple], kind: str) -> None:
+    """Rejects duplicate names, which would make menus and spawn counts ambiguous."""
+    seen: set = set()
+    for entry in entries:
+        if entry.name in seen:
+            raise CatalogError(f"Duplicate {kind} name: {entry.name}")
+        seen.add(entry.name)
+
+
+def parse_catalog(data: Dict[str, Any]) -> Catalog:
+    """
+    Validates the parsed content of a catalog file.
+
+    Args:
+        data: The decoded TOML or JSON document.
+
+    Raises:
+        CatalogError: If an entry is missing a field, has a field of the wrong type
+            or out of range, or there are no guns or no animals.
+
+    Returns:
+        The catalog.
+    """
+    if not isinstance(data, dict):
+        raise CatalogError("A catalog must be a table with 'guns' and 'animals' lists")
+    guns: List[GunSpec] = []
+    for number, entry in enumerate(data.get("guns", []), start=1):
+        where: str = f"Gun {number}"
+        if not isinstance(entry, dict):
+            raise CatalogError(f"{where} is not a table")
+        accuracy: float = float(_require(entry, "accuracy", (int, float), where))
+        if not 0.0 <= accuracy <= 1.0:
+            raise CatalogError(f"{where} has an accuracy outside [0, 1]: {accuracy}")
+        guns.append(GunSpec(_require(entry, "name", (str,), where), accuracy))
+    animals: List[AnimalSpec] = []
+    for number, entry in enumerate(data.get("animals", []), start=1):
+        where = f"Animal {number}"
+        if not isinstance(entry, dict):
+            raise CatalogError(f"{where} is not a table")
+        weight: float = float(_require(entry, "weight", (int, float), where)) if "weight" in entry else 1.0
+        if not (weight >= 0 and math.isfinite(weight)):
+            raise CatalogError(f"{where} has an invalid 'weight': {weight}")
+        behavior = entry.get("behavior")
+        if behavior is not None and not isinstance(behavior, str):
+            raise CatalogError(f"{where} has an invalid 'behavior': {behavior!r}")
+        animals.append(AnimalSpec(
+            _require(entry, "name", (str,), where), _require(entry, "points", (int,), where), weight, behavior,
+        ))
+    if not guns:
+        raise CatalogError("A catalog needs at least one gun")
+    if not animals:
+        raise CatalogError("A catalog needs at least one animal")
+    if not any(animal.weight > 0 for animal in animals):
+        raise CatalogError("At least one animal needs a positive spawn weight")
+    _unique_names(guns, "gun")
+    _unique_names(animals, "animal")
+    return Catalog(guns, animals)
+
+
+def _decode(raw: bytes, path: str) -> Dict[str, Any]:
+    """Decodes a catalog file as TOML or JSON, depending on its extension."""
+    if path.endswith(".toml") and tomllib is None:
+        raise CatalogError(f"Cannot parse {path}: TOML catalogs need Python 3.11 or later; use JSON instead")
+    try:
+        if path.endswith(".toml"):
+            return tomllib.loads(raw.decode())
+        return json.loads(raw)
+    except (UnicodeDecodeError, ValueError) as e: # TOMLDecodeError and JSONDecodeError are ValueErrors
+        raise CatalogError(f"Cannot parse {path}: {e}") from None
+
+
+def cache_path(path: str, cache_dir: Optional[str] = None) -> str:
+    """
+    Returns where the compiled form of a catalog file is cached.
+
+    The name is derived from the catalog's path, not its content, so each
+    rebuild replaces the previous cache of the same catalog.
+
+    Args:
+        path: The catalog file.
+        cache_dir: The cache directory. Defaults to __catalog_cache__ next to the file.
+    """
+    path = os.path.abspath(path)
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(path), CACHE_DIRECTORY)
+    # Catalogs of the same name from different directories may share a cache directory
+    path_hash: str = hashlib.sha256(path.encode(errors="surrogateescape")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{os.path.basename(path)}.{path_hash}.bin")
+
+
+def load_catalog(path: str, cache_dir: Optional[str] = None, use_cache: bool = True) -> Catalog:
+    """
+    Loads a catalog file, from its cached compiled form when the file is unchanged.
+
+    A missing, stale or unreadable cache is rebuilt from the file, replacing
+    the previous one. Failing to write the cache (e.g. a read-only directory)
+    is not an error.
+
+    Args:
+        path: The catalog file, TOML if it ends in ".toml" and JSON otherwise.
+        cache_dir: The cache directory. Defaults to __catalog_cache__ next to the file.
+        use_cache: Whether to read and write the cache at all.
+
+    Raises:
+        OSError: If the catalog file cannot be read.
+        CatalogError: If the catalog file is malformed or invalid.
+
+    Returns:
+        The catalog.
+    """
+    with open(path, "rb") as handle:
+        raw: bytes = handle.read()
+    if not use_cache:
+        return parse_catalog(_decode(raw, path))
+
+    # The cache file is the digest of the catalog it was built from, then Catalog.to_bytes()
+    digest: bytes = hashlib.sha256(raw).digest()
+    cached: str = cache_path(path, cache_dir)
+    try:
+        with open(cached, "rb") as handle:
+            data: bytes = handle.read()
+        if data[:len(digest)] == digest:
+            return Catalog.from_bytes(data[len(digest):])
+    except (OSError, CatalogError):
+        pass
+
+    catalog: Catalog = parse_catalog(_decode(raw, path))
+    temp_path: str = f"{cached}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        with open(temp_path, "wb") as handle:
+            handle.write(digest + catalog.to_bytes())
+        os.replace(temp_path, cached)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+    return catalog
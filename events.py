@@ -0,0 +1,173 @@
+"""
+A batched event bus for the hits, misses and scores of players.
+
+Players publish an event for every shot and every change to their points, but
+subscribers are not called per event: publishing only appends to a pending
+list, and flush() hands every subscriber the whole list at once as one
+EventBatch. Games flush once per tick (before each prompt or command, and when
+the game ends), and the bus flushes itself once max_pending events are waiting,
+so a subscriber costs one call per tick however many shots were fired in it.
+
+A batch is read through its coalesced views, e.g. the number of hits or the
+list of scores, which are computed once per batch and shared by every
+subscriber.
+"""
+import functools
+from typing import Any, Callable, Dict, List, Tuple
+
+# Event kinds
+HIT = "hit" # A shot hit: the points it earned
+MISS = "miss" # A shot missed: 0
+SCORE = "score" # Points were added to a player: the points added
+VOLLEY = "volley" # Many shots at once: (hits, misses)
+
+# kind, source, value; a plain tuple, as publishing is on the hot path of every shot
+Event = Tuple[str, Any, Any]
+
+
+class EventBatch:
+    """
+    The events published between two flushes, oldest first.
+
+    Attributes:
+        events (List[Event]): The events, as (kind, source, value) tuples.
+    """
+    def __init__(self, events: List[Event]):
+        """
+        Initializes an EventBatch instance.
+
+        Args:
+            events: The events, oldest first.
+        """
+        self.events: List[Event] = events
+
+    def __len__(self) -> int:
+        """Returns the number of events."""
+        return len(self.events)
+
+    @functools.cached_property
+    def _shots(self) -> Tuple[int, int]:
+        """The number of shots that hit and missed, counted in one pass."""
+        hits: int = 0
+        misses: int = 0
+        for kind, _, value in self.events:
+            if kind == HIT:
+                hits += 1
+            elif kind == MISS:
+                misses += 1
+            elif kind == VOLLEY:
+                hits += value[0]
+                misses += value[1]
+        return hits, misses
+
+    @property
+    def hits(self) -> int:
+        """The number of shots that hit, including those of volleys."""
+        return self._shots[0]
+
+    @property
+    def misses(self) -> int:
+        """The number of shots that missed, including those of volleys."""
+        return self._shots[1]
+
+    @functools.cached_property
+    def scores(self) -> List[int]:
+        """The points of every score event, oldest first."""
+        return [value for kind, _, value in self.events if kind == SCORE]
+
+    @property
+    def points(self) -> int:
+        """The total of every score event."""
+        return sum(self.scores)
+
+    def by_source(self) -> Dict[Any, "EventBatch"]:
+        """
+        Splits the batch by the object that published each event.
+
+        Returns:
+            A batch per source, in the order the sources first published.
+        """
+        grouped: Dict[Any, List[Event]] = {}
+        for event in self.events:
+            grouped.setdefault(event[1], []).append(event)
+        return {source: EventBatch(events) for source, events in grouped.items()}
+
+
+class EventBus:
+    """
+    Collects published events and delivers them to subscribers in batches.
+
+    Attributes:
+        max_pending (int): The number of pending events that triggers a flush.
+        subscribers (List[Callable[[EventBatch], None]]): Called with every batch, in subscription order.
+    """
+    def __init__(self, max_pending: int = 1024):
+        """
+        Initializes an EventBus instance without subscribers.
+
+        Args:
+            max_pending: The number of pending events that triggers a flush.
+
+        Raises:
+            ValueError: If max_pending is not positive.
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be positive.")
+        self.max_pending: int = max_pending
+        self.subscribers: List[Callable[[EventBatch], None]] = []
+        self._pending: List[Event] = []
+
+    @property
+    def pending(self) -> int:
+        """The number of events waiting for the next flush."""
+        return len(self._pending)
+
+    def subscribe(self, handler: Callable[[EventBatch], None]) -> Callable[[EventBatch], None]:
+        """
+        Adds a subscriber.
+
+        Args:
+            handler: Called with every batch flushed from now on.
+
+        Returns:
+            The handler, for unsubscribe().
+        """
+        self.subscribers.append(handler)
+        return handler
+
+    def unsubscribe(self, handler: Callable[[EventBatch], None]) -> None:
+        """
+        Removes a subscriber.
+
+        Raises:
+            ValueError: If the handler is not subscribed.
+        """
+        self.subscribers.remove(handler)
+
+    def publish(self, kind: str, source: Any, value: Any = 0) -> None:
+        """
+        Queues an event for the next flush, flushing if max_pending events are waiting.
+
+        Args:
+            kind: HIT, MISS, SCORE, VOLLEY or a kind of the caller's own.
+            source: The object the event is about, e.g. a Player.
+            value: The event's points, or (hits, misses) for a VOLLEY.
+        """
+        pending: List[Event] = self._pending
+        pending.append((kind, source, value))
+        if len(pending) >= self.max_pending:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Delivers the pending events to every subscriber as one batch.
+
+        Events published by the subscribers go into the next batch. Nothing is
+        delivered if no events are pending.
+        """
+        if not self._pending:
+            return
+        batch = EventBatch(self._pending)
+        self._pending = []
+        for handler in list(self.subscribers):
+            handler(batch)
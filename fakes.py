@@ -0,0 +1,31 @@
+"""
+Test doubles shared by the test modules.
+"""
+from typing import Optional
+
+
+class FakeClock:
+    """
+    A clock that only moves when told to.
+
+    Attributes:
+        now (float): The current time, in seconds.
+        frame (Optional[float]): If set, every sleep() advances by this much instead of the time asked for.
+    """
+    def __init__(self, frame: Optional[float] = None):
+        """
+        Initializes a FakeClock instance at time 0.
+
+        Args:
+            frame: If set, the fixed time every sleep() advances by, as if each frame took that long.
+        """
+        self.now: float = 0.0
+        self.frame: Optional[float] = frame
+
+    def __call__(self) -> float:
+        """Returns the current time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Advances the clock by seconds, or by frame if one was given."""
+        self.now += seconds if self.frame is None else self.frame
@@ -0,0 +1,307 @@
+"""
+Live leaderboard of many players, kept ranked as their scores change.
+
+Players are kept in a bucketed sorted list ordered by score (best first), with a
+Fenwick tree over the bucket sizes. Updating a score, looking up a player's
+rank and reading the top K are all logarithmic in the number of players (plus K
+for the top K), so nothing is re-sorted when a single player scores.
+"""
+from bisect import bisect_left, insort
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from shooting_game import Player
+
+_ID_BITS: int = 32
+_ID_MASK: int = (1 << _ID_BITS) - 1
+
+
+def _key(score: int, player_id: int) -> int:
+    """
+    Packs a score and player id into one int that sorts best first.
+
+    Plain ints keep comparisons cheap and, unlike tuples, are not tracked by
+    the garbage collector.
+    """
+    return (-score << _ID_BITS) | player_id
+
+
+class _SortedList:
+    """
+    A sorted list of distinct ints split into buckets of bounded size.
+
+    Invariants:
+        - Every bucket is non-empty and sorted, and every key of a bucket is
+          smaller than every key of the buckets after it.
+        - _maxes[i] is the last (largest) key of bucket i, so bisecting
+          _maxes finds the only bucket a key can be in.
+        - A bucket holds at most 2 * _LOAD keys; a larger one is split in half.
+        - _tree is either None or a Fenwick tree over the bucket sizes, so the
+          rank of a key is the size of the buckets before it plus its offset.
+          Adding or removing a key within a bucket updates the tree in place,
+          while creating or deleting a bucket drops it until the next rank query.
+    """
+    _LOAD: int = 512
+
+    def __init__(self):
+        """Initializes an empty _SortedList instance."""
+        self._lists: List[List[int]] = []
+        self._maxes: List[int] = []
+        self._tree: Optional[List[int]] = None # Fenwick tree over bucket sizes, rebuilt lazily
+        self._len: int = 0
+
+    def __len__(self) -> int:
+        """Returns the number of keys."""
+        return self._len
+
+    def _build_tree(self) -> List[int]:
+        """
+        Rebuilds the Fenwick tree from the bucket sizes in O(number of buckets).
+
+        Returns:
+            The new tree, which is also stored in _tree.
+        """
+        tree: List[int] = [len(bucket) for bucket in self._lists]
+        for i in range(len(tree)):
+            parent: int = i | (i + 1)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+        return tree
+
+    def _tree_add(self, pos: int, delta: int) -> None:
+        """
+        Records a change in the size of one bucket, if the tree is built.
+
+        Args:
+            pos: The index of the bucket that changed.
+            delta: The change in its size.
+        """
+        tree: Optional[List[int]] = self._tree
+        if tree is None:
+            return
+        while pos < len(tree):
+            tree[pos] += delta
+            pos |= pos + 1
+
+    def _prefix(self, pos: int) -> int:
+        """Returns the number of items in the buckets before pos."""
+        tree: List[int] = self._tree if self._tree is not None else self._build_tree()
+        total: int = 0
+        pos -= 1
+        while pos >= 0:
+            total += tree[pos]
+            pos = (pos & (pos + 1)) - 1
+        return total
+
+    def add(self, key: int) -> None:
+        """
+        Inserts a key in sorted position.
+
+        The key goes into the first bucket whose largest key is not smaller,
+        or the last bucket if it is larger than every key. A bucket that grows
+        beyond 2 * _LOAD keys is split in two.
+
+        Args:
+            key: The key to insert, which must not already be in the list.
+        """
+        self._len += 1
+        if not self._lists:
+            self._lists.append([key])
+            self._maxes.append(key)
+            self._tree = None
+            return
+        pos: int = min(bisect_left(self._maxes, key), len(self._lists) - 1)
+        bucket: List[int] = self._lists[pos]
+        insort(bucket, key)
+        self._maxes[pos] = bucket[-1]
+        if len(bucket) > 2 * self._LOAD:
+            self._lists.insert(pos + 1, bucket[self._LOAD:])
+            del bucket[self._LOAD:]
+            self._maxes.insert(pos, bucket[-1])
+            self._tree = None
+        else:
+            self._tree_add(pos, 1)
+
+    def _locate(self, key: int) -> Tuple[int, int]:
+        """
+        Finds a key.
+
+        Args:
+            key: The key to find.
+
+        Returns:
+            The (bucket, offset) of the key: the index of its bucket in _lists
+            and its index within that bucket.
+
+        Raises:
+            ValueError: If the key is not in the list.
+        """
+        pos: int = bisect_left(self._maxes, key)
+        if pos < len(self._lists):
+            bucket: List[int] = self._lists[pos]
+            index: int = bisect_left(bucket, key)
+            if index < len(bucket) and bucket[index] == key:
+                return pos, index
+        raise ValueError(f"{key!r} is not in the list")
+
+    def remove(self, key: int) -> None:
+        """
+        Removes a key, deleting its bucket if that leaves it empty.
+
+        Args:
+            key: The key to remove.
+
+        Raises:
+            ValueError: If the key is not in the list.
+        """
+        pos, index = self._locate(key)
+        bucket: List[int] = self._lists[pos]
+        del bucket[index]
+        self._len -= 1
+        if bucket:
+            self._maxes[pos] = bucket[-1]
+            self._tree_add(pos, -1)
+        else:
+            del self._lists[pos]
+            del self._maxes[pos]
+            self._tree = None
+
+    def index(self, key: int) -> int:
+        """
+        Returns the position of a key in sorted order.
+
+        Args:
+            key: The key to find.
+
+        Returns:
+            The 0-based rank of the key: the number of smaller keys.
+
+        Raises:
+            ValueError: If the key is not in the list.
+        """
+        pos, index = self._locate(key)
+        return self._prefix(pos) + index
+
+    def __iter__(self) -> Iterator[int]:
+        """Yields every key in ascending order."""
+        for bucket in self._lists:
+            yield from bucket
+
+
+class Leaderboard:
+    """
+    Ranks players by score, updated incrementally.
+
+    Players with equal scores are ranked by ascending player id. Player ids
+    must fit in 32 bits.
+    """
+    def __init__(self):
+        """Initializes an empty Leaderboard instance."""
+        self._scores: Dict[int, int] = {}
+        self._ranking: _SortedList = _SortedList()
+
+    def __len__(self) -> int:
+        """Returns the number of ranked players."""
+        return len(self._scores)
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self._scores
+
+    def update(self, player_id: int, score: int) -> None:
+        """
+        Sets a player's score, adding the player if needed.
+
+        Args:
+            player_id: The player to update.
+            score: The player's new score.
+
+        Raises:
+            ValueError: If the player id is negative or does not fit in 32 bits.
+        """
+        if not 0 <= player_id <= _ID_MASK:
+            raise ValueError(f"Player id {player_id} does not fit in {_ID_BITS} bits.")
+        old_score: Optional[int] = self._scores.get(player_id)
+        if old_score == score:
+            return
+        if old_score is not None:
+            self._ranking.remove(_key(old_score, player_id))
+        self._scores[player_id] = score
+        self._ranking.add(_key(score, player_id))
+
+    def add_points(self, player_id: int, points: int) -> None:
+        """
+        Adds points to a player's score, adding the player if needed.
+
+        Args:
+            player_id: The player who scored.
+            points: The points to add.
+        """
+        self.update(player_id, self._scores.get(player_id, 0) + points)
+
+    def remove(self, player_id: int) -> None:
+        """
+        Removes a player from the leaderboard.
+
+        Args:
+            player_id: The player to remove.
+
+        Raises:
+            KeyError: If the player is not ranked.
+        """
+        score: int = self._scores.pop(player_id)
+        self._ranking.remove(_key(score, player_id))
+
+    def score(self, player_id: int) -> int:
+        """
+        Returns a player's score.
+
+        Raises:
+            KeyError: If the player is not ranked.
+        """
+        return self._scores[player_id]
+
+    def rank(self, player_id: int) -> int:
+        """
+        Returns a player's rank, where 1 is the best.
+
+        Args:
+            player_id: The player to look up.
+
+        Raises:
+            KeyError: If the player is not ranked.
+
+        Returns:
+            The 1-based rank of the player.
+        """
+        return self._ranking.index(_key(self._scores[player_id], player_id)) + 1
+
+    def top(self, k: int = 10) -> List[Tuple[int, int]]:
+        """
+        Returns the best players.
+
+        Args:
+            k: The number of players to return.
+
+        Returns:
+            Up to k (player_id, score) pairs, best first.
+        """
+        result: List[Tuple[int, int]] = []
+        for key in self._ranking:
+            if len(result) >= k:
+                break
+            result.append((key & _ID_MASK, -(key >> _ID_BITS)))
+        return result
+
+    def attach(self, player: Player, player_id: int) -> None:
+        """
+        Keeps a player's entry in sync with their points.
+
+        The player's current points are ranked immediately, and every later
+        Player.add_points call updates the leaderboard.
+
+        Args:
+            player: The player to follow.
+            player_id: The id under which the player is ranked.
+        """
+        self.update(player_id, player.points)
+        player.score_listeners.append(lambda scorer: self.update(player_id, scorer.points))
@@ -0,0 +1,323 @@
+"""
+Opt-in counters and latency histograms for the core game actions.
+
+instrument() wraps Player.shoot, Player.shoot_many, Gun.fire, Gun.fire_many,
+Animal.appear, Animal.get_shot, ScoreBoard.update_score, ScoreBoard.update_scores
+and Game._read_command (only the time spent waiting on input, not the flushes
+before each prompt) on their classes, including subclasses that override them.
+uninstrument() restores the original methods, so with metrics disabled the game
+runs its plain methods with no extra cost at all.
+
+Metrics.handle_events also counts the hits, misses and points of a game's
+event bus, one call per batch of events; instrument() subscribes it to the bus
+of every Game created while the game is instrumented.
+
+Snapshots can be exported in the Prometheus text format or as JSON.
+"""
+import contextlib
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from events import EventBatch
+from shooting_game import Animal, Game, Gun, Player, ScoreBoard
+
+# Bucket i covers latencies below 2 ** (i + _MIN_EXPONENT) nanoseconds
+_MIN_EXPONENT: int = 7 # 128 ns
+_BUCKETS: int = 28 # Up to 2 ** 34 ns, about 17 seconds
+
+# (class, method name, metric name, count truthy results as hits)
+INSTRUMENTED: List[Tuple[Type, str, str, bool]] = [
+    (Player, "shoot", "player_shoot", False),
+    (Player, "shoot_many", "player_shoot_many", False),
+    (Gun, "fire", "gun_fire", True),
+    (Gun, "fire_many", "gun_fire_many", False),
+    (Animal, "appear", "animal_appear", False),
+    (Animal, "get_shot", "animal_get_shot", False),
+    (ScoreBoard, "update_score", "scoreboard_update_score", False),
+    (ScoreBoard, "update_scores", "scoreboard_update_scores", False),
+    (Game, "_read_command", "game_input_wait", False),
+]
+
+
+class Histogram:
+    """
+    A latency histogram with power-of-two nanosecond buckets.
+
+    Attributes:
+        counts (List[int]): The number of observations per bucket; the last one
+            collects everything above the largest bound.
+        total_ns (int): The sum of all observed latencies.
+        count (int): The number of observations.
+    """
+    def __init__(self):
+        """Initializes an empty Histogram instance."""
+        self.counts: List[int] = [0] * (_BUCKETS + 1)
+        self.total_ns: int = 0
+        self.count: int = 0
+
+    def observe(self, nanoseconds: int) -> None:
+        """
+        Records one latency.
+
+        Args:
+            nanoseconds: The latency to record.
+        """
+        index: int = nanoseconds.bit_length() - _MIN_EXPONENT
+        if index < 0:
+            index = 0
+        elif index > _BUCKETS:
+            index = _BUCKETS
+        self.counts[index] += 1
+        self.total_ns += nanoseconds
+        self.count += 1
+
+    @staticmethod
+    def upper_bound_ns(index: int) -> float:
+        """Returns the exclusive upper bound of a bucket, infinite for the last one."""
+        return float(2 ** (index + _MIN_EXPONENT)) if index < _BUCKETS else float("inf")
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimates a latency percentile.
+
+        Args:
+            fraction: The percentile as a fraction, e.g. 0.99.
+
+        Returns:
+            The upper bound in nanoseconds of the bucket holding the percentile,
+            or 0.0 without observations.
+        """
+        if self.count == 0:
+            return 0.0
+        target: float = fraction * self.count
+        seen: int = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return self.upper_bound_ns(index)
+        return self.upper_bound_ns(_BUCKETS)
+
+
+class Metrics:
+    """
+    A registry of counters and latency histograms.
+
+    Attributes:
+        counters (Dict[str, int]): Counter values by name.
+        histograms (Dict[str, Histogram]): Latency histograms by name.
+    """
+    def __init__(self, prefix: str = "shooting_game"):
+        """
+        Initializes an empty Metrics instance.
+
+        Args:
+            prefix: Prepended to every metric name on export.
+        """
+        self.prefix: str = prefix
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[str, Histogram] = {}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Adds to a counter, creating it at zero if needed."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def handle_events(self, batch: EventBatch) -> None:
+        """
+        Counts the hits, misses and points of a batch of events, as an EventBus subscriber.
+
+        Args:
+            batch: The events.
+        """
+        self.increment("shots_hit", batch.hits)
+        self.increment("shots_missed", batch.misses)
+        self.increment("points_scored", batch.points)
+
+    def histogram(self, name: str) -> Histogram:
+        """Returns a histogram, creating it if needed."""
+        histogram: Optional[Histogram] = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        return histogram
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Captures the current values.
+
+        Returns:
+            A JSON-serializable dict of counters and histogram summaries.
+        """
+        return {
+            "timestamp": time.time(),
+            "counters": dict(self.counters),
+            "histograms": {
+                name: {
+                    "count": histogram.count,
+                    "sum_ns": histogram.total_ns,
+                    "p50_ns": histogram.percentile(0.50),
+                    "p99_ns": histogram.percentile(0.99),
+                    "buckets": {
+                        ("+Inf" if index == _BUCKETS else str(int(Histogram.upper_bound_ns(index)))): bucket_count
+                        for index, bucket_count in enumerate(histogram.counts) if bucket_count
+                    },
+                }
+                for name, histogram in self.histograms.items()
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """
+        Formats the current values in the Prometheus text exposition format.
+
+        Returns:
+            The exposition text, with latencies in seconds.
+        """
+        lines: List[str] = []
+        for name, value in sorted(self.counters.items()):
+            metric: str = f"{self.prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        for name, histogram in sorted(self.histograms.items()):
+            metric = f"{self.prefix}_{name}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            cumulative: int = 0
+            for index, bucket_count in enumerate(histogram.counts):
+                cumulative += bucket_count
+                bound: str = "+Inf" if index == _BUCKETS else repr(Histogram.upper_bound_ns(index) / 1e9)
+                lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+            lines.append(f"{metric}_sum {histogram.total_ns / 1e9!r}")
+            lines.append(f"{metric}_count {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str, fmt: Optional[str] = None) -> None:
+        """
+        Writes a snapshot to a file, replacing it atomically.
+
+        Args:
+            path: The file to write.
+            fmt: "json" or "prometheus". Defaults to JSON for paths ending in
+                ".json" and Prometheus otherwise.
+
+        Raises:
+            ValueError: If the format is unknown.
+        """
+        fmt = fmt or ("json" if path.endswith(".json") else "prometheus")
+        if fmt == "json":
+            content: str = json.dumps(self.snapshot(), indent=2)
+        elif fmt == "prometheus":
+            content = self.to_prometheus()
+        else:
+            raise ValueError(f"Unknown metrics format: {fmt}")
+        temp_path: str = path + ".tmp"
+        with open(temp_path, "w") as handle:
+            handle.write(content)
+        os.replace(temp_path, path)
+
+
+class _CallState:
+    """Marks a metric as being timed so nested calls (e.g. super()) are not counted twice."""
+    __slots__ = ("active",)
+
+    def __init__(self):
+        self.active: bool = False
+
+
+# Original methods replaced by instrument(), as (class, method name, original)
+_originals: List[Tuple[Type, str, Callable]] = []
+
+
+def _classes_defining(base: Type, method_name: str) -> Iterator[Type]:
+    """Yields base and every subclass that defines method_name itself."""
+    pending: List[Type] = [base]
+    seen: set = set()
+    while pending:
+        cls: Type = pending.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        if method_name in cls.__dict__:
+            yield cls
+        pending.extend(cls.__subclasses__())
+
+
+def _wrap(original: Callable, metrics: Metrics, name: str, count_hits: bool, state: _CallState) -> Callable:
+    """Creates the timing wrapper for one method."""
+    histogram: Histogram = metrics.histogram(name)
+    clock = time.perf_counter_ns
+
+    def timed(self, *args, **kwargs):
+        if state.active:
+            return original(self, *args, **kwargs)
+        state.active = True
+        start: int = clock()
+        try:
+            result = original(self, *args, **kwargs)
+        finally:
+            histogram.observe(clock() - start)
+            state.active = False
+        metrics.increment(name)
+        if count_hits and result:
+            metrics.increment(name + "_hits")
+        return result
+    timed.__wrapped__ = original
+    timed.__doc__ = original.__doc__
+    timed.__name__ = original.__name__
+    return timed
+
+
+def instrument(metrics: Metrics) -> None:
+    """
+    Starts recording the core game actions into metrics.
+
+    Games created from now on also count their bus events into metrics. Classes
+    defined after this call are not instrumented.
+
+    Args:
+        metrics: The registry the counters and histograms are recorded in.
+
+    Raises:
+        RuntimeError: If the game is already instrumented.
+    """
+    if _originals:
+        raise RuntimeError("The game is already instrumented; call uninstrument() first.")
+    for base, method_name, metric_name, count_hits in INSTRUMENTED:
+        state = _CallState()
+        for cls in list(_classes_defining(base, method_name)):
+            original: Callable = cls.__dict__[method_name]
+            _originals.append((cls, method_name, original))
+            setattr(cls, method_name, _wrap(original, metrics, metric_name, count_hits, state))
+    original_init: Callable = Game.__dict__["__init__"]
+
+    def subscribing_init(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        self.bus.subscribe(metrics.handle_events)
+    subscribing_init.__wrapped__ = original_init
+    subscribing_init.__doc__ = original_init.__doc__
+    _originals.append((Game, "__init__", original_init))
+    Game.__init__ = subscribing_init
+
+
+def uninstrument() -> None:
+    """Restores the original, uninstrumented methods."""
+    while _originals:
+        cls, method_name, original = _originals.pop()
+        setattr(cls, method_name, original)
+
+
+@contextlib.contextmanager
+def instrumented(metrics: Metrics) -> Iterator[Metrics]:
+    """
+    Instruments the game for the duration of a with block.
+
+    Args:
+        metrics: The registry the counters and histograms are recorded in.
+
+    Yields:
+        The same registry.
+    """
+    instrument(metrics)
+    try:
+        yield metrics
+    finally:
+        uninstrument()
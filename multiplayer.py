@@ -0,0 +1,267 @@
+"""
+Multiplayer games with struct-of-arrays player state.
+
+PlayerTable keeps every player's gun index, points, shots and hits in NumPy
+columns instead of one Player object per player, so MultiplayerGame plays a
+round for the whole lobby with a handful of vectorized operations: one spawn
+draw, one hit draw and a few column updates, whether there are ten players or
+a hundred thousand.
+
+PlayerView is a Player backed by one row of the table. MultiplayerGame.player
+is the view of player 0, so every single-player code path of Game (start_game,
+begin/handle_input, end_game) keeps working and plays as that player.
+"""
+from typing import Callable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from events import EventBus
+from output import CONSOLE, OutputSink
+from rng import RandomService
+from shooting_game import Animal, Game, Gun, Player, ScoreBoard
+from simulation import hit_probability, points_table
+
+if TYPE_CHECKING:
+    from catalog import Catalog
+    from spawn_table import SpawnTable
+
+NO_GUN: int = -1
+
+
+class PlayerTable:
+    """
+    The state of many players, one NumPy column per field.
+
+    Attributes:
+        guns (List[Gun]): The guns players can select; gun holds indices into it.
+        gun (np.ndarray): Each player's selected gun index, or NO_GUN.
+        points (np.ndarray): Each player's points.
+        shots (np.ndarray): The number of shots each player has fired.
+        hits (np.ndarray): The number of shots each player has hit.
+    """
+    def __init__(self, size: int, guns: Sequence[Gun]):
+        """
+        Initializes a PlayerTable instance with no guns selected and zero points.
+
+        Args:
+            size: The number of players.
+            guns: The guns players can select.
+
+        Raises:
+            ValueError: If size is negative.
+        """
+        if size < 0:
+            raise ValueError("The number of players must not be negative.")
+        self.guns: List[Gun] = list(guns)
+        self.gun: np.ndarray = np.full(size, NO_GUN, dtype=np.int32)
+        self.points: np.ndarray = np.zeros(size, dtype=np.int64)
+        self.shots: np.ndarray = np.zeros(size, dtype=np.int64)
+        self.hits: np.ndarray = np.zeros(size, dtype=np.int64)
+
+    def __len__(self) -> int:
+        """Returns the number of players."""
+        return len(self.points)
+
+    def gun_index(self, gun: Optional[Gun]) -> int:
+        """
+        Returns the column value for a gun.
+
+        Raises:
+            ValueError: If the gun is not one of the table's guns.
+        """
+        if gun is None:
+            return NO_GUN
+        for index, candidate in enumerate(self.guns):
+            if candidate is gun:
+                return index
+        raise ValueError(f"{gun.name} is not one of this table's guns")
+
+    def view(self, index: int, sink: Optional[OutputSink] = None) -> "PlayerView":
+        """
+        Returns a Player backed by one row of the table.
+
+        Args:
+            index: The player's row.
+            sink: Where the view's messages are written.
+        """
+        return PlayerView(self, index, sink=sink)
+
+
+class PlayerView(Player):
+    """
+    A Player whose gun, points, shots and hits live in a row of a PlayerTable.
+
+    Attributes:
+        table (PlayerTable): The table holding the player's state.
+        index (int): The player's row.
+    """
+    def __init__(self, table: PlayerTable, index: int, sink: Optional[OutputSink] = None):
+        """
+        Initializes a PlayerView instance over an existing row, leaving its state as it is.
+
+        Args:
+            table: The table holding the player's state.
+            index: The player's row.
+            sink: Where messages are written. Defaults to the console.
+        """
+        if not 0 <= index < len(table):
+            raise IndexError("player index out of range")
+        self.table: PlayerTable = table
+        self.index: int = index
+        # Player.__init__ is not called, as it would reset the row's gun and points
+        self.sink: OutputSink = sink if sink is not None else CONSOLE
+        self.score_listeners: List[Callable[[Player], None]] = []
+        self.bus: Optional[EventBus] = None
+
+    @property
+    def selected_gun(self) -> Optional[Gun]:
+        """The gun selected by the player."""
+        gun: int = int(self.table.gun[self.index])
+        return self.table.guns[gun] if gun != NO_GUN else None
+
+    @selected_gun.setter
+    def selected_gun(self, gun: Optional[Gun]) -> None:
+        self.table.gun[self.index] = self.table.gun_index(gun)
+
+    @property
+    def points(self) -> int:
+        """The player's current score."""
+        return int(self.table.points[self.index])
+
+    @points.setter
+    def points(self, points: int) -> None:
+        self.table.points[self.index] = points
+
+    @property
+    def shots(self) -> int:
+        """The number of shots the player has fired."""
+        return int(self.table.shots[self.index])
+
+    @property
+    def hits(self) -> int:
+        """The number of shots the player has hit."""
+        return int(self.table.hits[self.index])
+
+    def shoot(self, target: Optional[Animal]) -> bool:
+        """Shoots like Player.shoot, also counting the shot and hit in the table."""
+        if self.selected_gun is None:
+            return super().shoot(target)
+        hit: bool = super().shoot(target)
+        self.table.shots[self.index] += 1
+        self.table.hits[self.index] += hit
+        return hit
+
+    def shoot_many(self, targets: Sequence[Animal], scoreboard: Optional[ScoreBoard] = None) -> List[int]:
+        """Fires a volley like Player.shoot_many, also counting the shots and hits in the table."""
+        earned: List[int] = super().shoot_many(targets, scoreboard=scoreboard)
+        if self.selected_gun is not None:
+            self.table.shots[self.index] += len(targets)
+            self.table.hits[self.index] += len(earned)
+        return earned
+
+
+class MultiplayerGame(Game):
+    """
+    A Game played by a whole lobby of players at once.
+
+    Attributes:
+        players (PlayerTable): The state of every player.
+        player (PlayerView): Player 0, used by the single-player code paths.
+        rounds (int): The number of rounds played.
+    """
+    def __init__(
+        self,
+        n_players: int,
+        sink: Optional[OutputSink] = None,
+        rng: Optional[RandomService] = None,
+        catalog: Optional["Catalog"] = None,
+        spawn_table: Optional["SpawnTable"] = None,
+    ):
+        """
+        Initializes a MultiplayerGame instance.
+
+        Args:
+            n_players: The number of players in the lobby.
+            sink: Where messages are written. Defaults to the console.
+            rng: The random number service for shots and spawns. Defaults to one
+                seeded from the operating system.
+            catalog: The guns and animals to play with, in place of the default ones.
+            spawn_table: Draws animals with per-species weights.
+
+        Raises:
+            ValueError: If n_players is not positive.
+        """
+        if n_players < 1:
+            raise ValueError("A multiplayer game needs at least one player.")
+        super().__init__(sink=sink, rng=rng if rng is not None else RandomService(), catalog=catalog, spawn_table=spawn_table)
+        self.players: PlayerTable = PlayerTable(n_players, self.guns)
+        self.player = self.players.view(0, sink=self.sink)
+        self.player.bus = self.bus
+        self.rounds: int = 0
+        self._accuracy: np.ndarray = np.array([hit_probability(gun) for gun in self.guns] + [0.0])
+        self._values: np.ndarray = points_table(self.animals)
+
+    def choose_guns(self, choices: np.ndarray) -> None:
+        """
+        Selects every player's gun at once.
+
+        Args:
+            choices: One gun menu number (1-based, as in the gun menu) per player,
+                or 0 to leave a player without a gun.
+
+        Raises:
+            ValueError: If a choice is not a valid menu number or 0.
+        """
+        choices = np.asarray(choices)
+        if choices.shape != (len(self.players),) or np.any((choices < 0) | (choices > len(self.guns))):
+            raise ValueError("Each player needs a gun menu number or 0.")
+        self.players.gun[:] = choices - 1
+
+    def _spawn(self, n: int) -> np.ndarray:
+        """Draws the animal each of n shots is fired at."""
+        if self.spawn_table is not None:
+            return self.spawn_table.sample(n, self.rng)
+        return self.rng.integers_many(len(self.animals), n)
+
+    def play_round(self) -> np.ndarray:
+        """
+        Lets every player with a gun shoot once at an animal of their own.
+
+        Returns:
+            The points each player earned this round.
+        """
+        table: PlayerTable = self.players
+        n: int = len(table)
+        # NO_GUN is -1, which picks the 0.0 accuracy appended after the real guns
+        armed: np.ndarray = table.gun != NO_GUN
+        hits: np.ndarray = self.rng.random_many(n) < self._accuracy[table.gun]
+        earned: np.ndarray = np.where(hits, self._values[self._spawn(n)], 0)
+        table.points += earned
+        table.shots += armed
+        table.hits += hits
+        self.rounds += 1
+        self.sink.emit(
+            "round", "Round {round}: {hits} of {shots} shots hit for {points} points.",
+            round=self.rounds, shots=int(armed.sum()), hits=int(hits.sum()), points=int(earned.sum()),
+        )
+        return earned
+
+    def leaderboard(self, k: int = 10) -> List[Tuple[int, int]]:
+        """
+        Returns the k players with the most points.
+
+        Args:
+            k: The number of players to return.
+
+        Returns:
+            (player index, points) pairs, best first; ties go to the lower index.
+        """
+        points: np.ndarray = self.players.points
+        k = min(k, len(points))
+        if k <= 0:
+            return []
+        # Sort by points descending, then index ascending, among the top-k candidates
+        threshold: int = int(np.partition(points, len(points) - k)[len(points) - k])
+        candidates: np.ndarray = np.nonzero(points >= threshold)[0]
+        order: np.ndarray = np.lexsort((candidates, -points[candidates]))[:k]
+        return [(int(candidates[i]), int(points[candidates[i]])) for i in order]
@@ -0,0 +1,293 @@
+"""
+Offline search for the best playing policy.
+
+A Policy fixes the three decisions a player makes: which gun to choose from the
+menu, how many shots of the budget to spend at most, and the score at which to
+end the game early. optimize() plays candidate policies through the real Game
+rules and finds the best one by successive halving: every round all surviving
+policies play more sessions across a pool of worker processes, then the worse
+half is dropped. Policies that are clearly beaten (their confidence interval
+lies entirely below the leader's) are dropped at once, and the search stops as
+soon as a single policy is left, so bad policies use up little of the budget.
+
+Session j of every policy draws from substream j of the master seed, so
+policies are compared on the same random numbers and the result does not
+depend on the number of workers.
+"""
+import contextlib
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from output import NullSink
+from rng import RandomService
+from score_history import RunningStats
+from shooting_game import Game
+
+if TYPE_CHECKING:
+    from catalog import Catalog
+
+
+class Policy(NamedTuple):
+    """
+    A way of playing one session.
+
+    Attributes:
+        gun_choice (int): The gun menu number entered when choosing a gun.
+        shots (int): The most shots fired before ending the game.
+        stop_at (Optional[int]): End the game as soon as the score reaches this, or None to use every shot.
+    """
+    gun_choice: int
+    shots: int
+    stop_at: Optional[int] = None
+
+    def describe(self) -> str:
+        """Returns the policy in words, e.g. "gun 1, 20 shots, stop at 100"."""
+        stop: str = f", stop at {self.stop_at}" if self.stop_at is not None else ""
+        return f"gun {self.gun_choice}, {self.shots} shots{stop}"
+
+
+def candidate_policies(
+    n_guns: int, shot_budgets: Iterable[int], stop_targets: Iterable[Optional[int]] = (None,),
+) -> List[Policy]:
+    """
+    Builds every combination of gun, shot budget and stop target.
+
+    Args:
+        n_guns: The number of guns on the menu.
+        shot_budgets: The shot budgets to try.
+        stop_targets: The scores to stop at; None uses the whole budget.
+
+    Returns:
+        The candidate policies.
+    """
+    budgets: List[int] = list(shot_budgets)
+    targets: List[Optional[int]] = list(stop_targets)
+    return [
+        Policy(gun, shots, target)
+        for gun in range(1, n_guns + 1) for shots in budgets for target in targets
+    ]
+
+
+def play_policy(
+    policy: Policy, master_seed: int, index: int, shot_cost: float = 0.0, catalog: Optional["Catalog"] = None,
+) -> float:
+    """
+    Plays one headless session with a policy.
+
+    Args:
+        policy: The policy to play.
+        master_seed: The non-negative seed of the whole search.
+        index: The index of the session; the same index gives the same random numbers.
+        shot_cost: The points a shot is worth spending, subtracted from the final score.
+        catalog: The guns and animals to play with.
+
+    Returns:
+        The session's utility: its final score less shot_cost per shot fired.
+    """
+    game = Game(sink=NullSink(), rng=RandomService(master_seed).substream(index), catalog=catalog)
+    game.begin()
+    game.handle_input(str(policy.gun_choice))
+    if game.awaiting_gun:
+        raise ValueError(f"{policy.gun_choice} is not a gun menu number")
+    player = game.player
+    shots: int = 0
+    while shots < policy.shots and (policy.stop_at is None or player.points < policy.stop_at):
+        game.handle_action("1")
+        shots += 1
+    game.handle_action("2")
+    return player.points - shot_cost * shots
+
+
+def _play_block(
+    policy: Policy, master_seed: int, start: int, stop: int, shot_cost: float, catalog: Optional["Catalog"],
+) -> List[float]:
+    """Plays the sessions with indices in [start, stop) in the calling process."""
+    return [play_policy(policy, master_seed, index, shot_cost, catalog) for index in range(start, stop)]
+
+
+class Arm:
+    """
+    A candidate policy and what is known about it so far.
+
+    Attributes:
+        policy (Policy): The policy.
+        stats (RunningStats): The utilities of the sessions it has played.
+        eliminated (Optional[int]): The round it was dropped in, or None if it survived.
+    """
+    def __init__(self, policy: Policy):
+        """
+        Initializes an Arm instance with no sessions played.
+
+        Args:
+            policy: The policy.
+        """
+        self.policy: Policy = policy
+        self.stats: RunningStats = RunningStats()
+        self.eliminated: Optional[int] = None
+
+    @property
+    def sessions(self) -> int:
+        """The number of sessions played."""
+        return self.stats.count
+
+    @property
+    def mean(self) -> float:
+        """The mean utility of the sessions played."""
+        return self.stats.mean
+
+    def interval(self, z: float) -> Tuple[float, float]:
+        """
+        Returns the confidence interval of the mean utility.
+
+        Args:
+            z: The interval's half-width in standard errors.
+        """
+        if self.sessions < 2:
+            return -math.inf, math.inf
+        margin: float = z * self.stats.stdev / math.sqrt(self.sessions - 1)
+        return self.mean - margin, self.mean + margin
+
+
+class OptimizerReport:
+    """
+    The outcome of a policy search.
+
+    Attributes:
+        arms (List[Arm]): Every candidate, best first: survivors by mean, then by the round they were dropped in.
+        rounds (int): The number of rounds played.
+    """
+    def __init__(self, arms: Sequence[Arm], rounds: int):
+        """
+        Initializes an OptimizerReport instance.
+
+        Args:
+            arms: Every candidate, in any order.
+            rounds: The number of rounds played.
+        """
+        self.arms: List[Arm] = sorted(
+            arms, key=lambda arm: (arm.eliminated is not None, -(arm.eliminated or 0), -arm.mean),
+        )
+        self.rounds: int = rounds
+
+    @property
+    def best(self) -> Policy:
+        """The best policy found."""
+        return self.arms[0].policy
+
+    @property
+    def sessions(self) -> int:
+        """The number of sessions played across all candidates."""
+        return sum(arm.sessions for arm in self.arms)
+
+    def summary(self, top: int = 10) -> str:
+        """
+        Formats the report for the console.
+
+        Args:
+            top: The number of candidates listed.
+
+        Returns:
+            A multi-line, human-readable summary.
+        """
+        lines: List[str] = [
+            f"Best Policy: {self.best.describe()}",
+            f"Candidates: {len(self.arms)}",
+            f"Rounds: {self.rounds}",
+            f"Sessions: {self.sessions}",
+        ]
+        for arm in self.arms[:top]:
+            fate: str = f"dropped in round {arm.eliminated}" if arm.eliminated is not None else "kept"
+            lines.append(f"  {arm.policy.describe()}: {arm.mean:.2f} over {arm.sessions} sessions, {fate}")
+        return "\n".join(lines)
+
+
+def _evaluate(
+    arms: Sequence[Arm], sessions: int, master_seed: int, shot_cost: float,
+    catalog: Optional["Catalog"], pool: Optional[Executor], chunk_size: int,
+) -> None:
+    """Plays the next sessions of every arm, in the pool if there is one."""
+    tasks = []
+    for arm in arms:
+        start: int = arm.sessions
+        for chunk in range(start, start + sessions, chunk_size):
+            tasks.append((arm, chunk, min(chunk + chunk_size, start + sessions)))
+    if pool is None:
+        blocks = (_play_block(arm.policy, master_seed, start, stop, shot_cost, catalog) for arm, start, stop in tasks)
+    else:
+        blocks = pool.map(
+            _play_block, [arm.policy for arm, _, _ in tasks], [master_seed] * len(tasks),
+            [start for _, start, _ in tasks], [stop for _, _, stop in tasks],
+            [shot_cost] * len(tasks), [catalog] * len(tasks),
+        )
+    # Blocks arrive in task order, so every arm records its sessions in index order
+    for (arm, _, _), utilities in zip(tasks, blocks):
+        arm.stats.update_many(utilities)
+
+
+def optimize(
+    policies: Sequence[Policy],
+    budget: int,
+    master_seed: int = 0,
+    shot_cost: float = 0.0,
+    catalog: Optional["Catalog"] = None,
+    eta: int = 2,
+    z: float = 3.0,
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+) -> OptimizerReport:
+    """
+    Finds the policy with the highest mean utility by successive halving.
+
+    Args:
+        policies: The candidate policies.
+        budget: The most sessions played in total; the search may stop earlier.
+        master_seed: The non-negative seed every session's substream is derived from.
+        shot_cost: The points a shot is worth spending, subtracted from each final score.
+        catalog: The guns and animals to play with. Must be picklable.
+        eta: The factor the candidates are cut by each round; 2 keeps the better half.
+        z: How many standard errors apart a policy must be from the leader to be dropped early.
+        workers: The number of worker processes. Defaults to the number of cores;
+            1 plays every session in the calling process.
+        chunk_size: The number of sessions handed to a worker at a time.
+
+    Raises:
+        ValueError: If there are no policies, eta is below 2 or the budget cannot
+            give every policy a session.
+
+    Returns:
+        The report, identical for any number of workers.
+    """
+    if not policies:
+        raise ValueError("There are no policies to compare.")
+    if eta < 2:
+        raise ValueError("eta must be at least 2.")
+    if budget < len(policies):
+        raise ValueError("The budget must allow at least one session per policy.")
+    arms: List[Arm] = [Arm(policy) for policy in policies]
+    total_rounds: int = max(1, math.ceil(math.log(len(arms), eta)))
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    remaining: int = budget
+    survivors: List[Arm] = arms
+    rounds: int = 0
+    with ProcessPoolExecutor(max_workers=workers) if workers > 1 else contextlib.nullcontext() as pool:
+        while len(survivors) > 1 and remaining >= len(survivors):
+            rounds += 1
+            rounds_left: int = max(1, total_rounds - rounds + 1)
+            sessions: int = max(1, remaining // (rounds_left * len(survivors)))
+            _evaluate(survivors, sessions, master_seed, shot_cost, catalog, pool, chunk_size)
+            remaining -= sessions * len(survivors)
+
+            survivors.sort(key=lambda arm: -arm.mean)
+            leader_low, _ = survivors[0].interval(z)
+            keep: int = max(1, math.ceil(len(survivors) / eta))
+            kept: List[Arm] = [
+                arm for position, arm in enumerate(survivors)
+                if position < keep and arm.interval(z)[1] >= leader_low
+            ]
+            for arm in survivors:
+                if arm not in kept:
+                    arm.eliminated = rounds
+            survivors = kept
+    return OptimizerReport(arms, rounds)
@@ -0,0 +1,122 @@
+"""
+Output sinks used by the game classes in place of direct ``print`` calls.
+
+Every message is emitted as an event name, a message template and the fields
+that fill the template. Sinks decide what to do with it: the console sink
+prints it straight away, the buffered sink batches the formatted lines, the
+null sink drops it without formatting and the event sink keeps the raw fields.
+"""
+import sys
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+
+class OutputSink:
+    """Receives the messages produced by the game."""
+    def emit(self, event: str, template: str, **fields: Any) -> None:
+        """
+        Handles a single message.
+
+        This method should be implemented by subclasses.
+
+        Args:
+            event: A short name identifying the kind of message, e.g. "shot_hit".
+            template: A str.format template for the human-readable message.
+            **fields: The values used to fill the template.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement this method.
+        """
+        raise NotImplementedError("Subclass must implement this method")
+
+    def flush(self) -> None:
+        """Writes out any pending messages. Does nothing by default."""
+
+
+class ConsoleSink(OutputSink):
+    """Prints every message immediately, matching the game's original behavior."""
+    def emit(self, event: str, template: str, **fields: Any) -> None:
+        """Prints the formatted message."""
+        print(template.format(**fields))
+
+
+class NullSink(OutputSink):
+    """Discards every message without formatting it, for headless runs."""
+    def emit(self, event: str, template: str, **fields: Any) -> None:
+        """Ignores the message."""
+
+
+class BufferedSink(OutputSink):
+    """
+    Collects formatted lines and writes them to a stream in batches.
+
+    Attributes:
+        batch_size (int): The number of lines buffered before they are written out.
+        stream (Optional[TextIO]): The stream written to, or None for sys.stdout.
+    """
+    def __init__(self, batch_size: int = 1024, stream: Optional[TextIO] = None):
+        """
+        Initializes a BufferedSink instance.
+
+        Args:
+            batch_size: The number of lines buffered before they are written out.
+            stream: The stream written to. Defaults to sys.stdout at flush time.
+
+        Raises:
+            ValueError: If batch_size is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        self.batch_size: int = batch_size
+        self.stream: Optional[TextIO] = stream
+        self._lines: List[str] = []
+
+    def emit(self, event: str, template: str, **fields: Any) -> None:
+        """Buffers the formatted message, flushing once the batch is full."""
+        self._lines.append(template.format(**fields))
+        if len(self._lines) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes all buffered lines to the stream in a single write."""
+        if not self._lines:
+            return
+        stream: TextIO = self.stream if self.stream is not None else sys.stdout
+        stream.write("\n".join(self._lines) + "\n")
+        stream.flush()
+        self._lines.clear()
+
+
+class EventSink(OutputSink):
+    """
+    Records structured events instead of text.
+
+    Attributes:
+        events (List[Dict[str, Any]]): The recorded events, each holding the event
+            name under "event" together with its fields.
+        callback (Optional[Callable[[Dict[str, Any]], None]]): Called with each event
+            as it is recorded, if given.
+    """
+    def __init__(self, callback: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Initializes an EventSink instance.
+
+        Args:
+            callback: An optional function called with each recorded event.
+        """
+        self.events: List[Dict[str, Any]] = []
+        self.callback: Optional[Callable[[Dict[str, Any]], None]] = callback
+
+    def emit(self, event: str, template: str, **fields: Any) -> None:
+        """Records the event name and its fields."""
+        record: Dict[str, Any] = {"event": event, **fields}
+        self.events.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+    def clear(self) -> None:
+        """Removes all recorded events."""
+        self.events.clear()
+
+
+# Shared default used when no sink is given
+CONSOLE: OutputSink = ConsoleSink()
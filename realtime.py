@@ -0,0 +1,514 @@
+"""
+Real-time mode: many animals moving on a 2D field at a fixed tick rate.
+
+Field keeps the animals' positions, velocities and hit radii in NumPy columns
+next to the Animal objects themselves, so a tick moves every animal with a few
+vectorized operations. The columns grow by doubling their capacity, so animals
+can also be spawned one at a time cheaply. After moving, the animals are
+bucketed into a uniform grid (SpatialHash) and a shot at a position only tests
+the animals in the grid cells around it. Both stay near-linear in the number of animals, so tens of
+thousands of them can share the field.
+
+TickScheduler runs updates at a fixed timestep regardless of the frame rate,
+and RealTimeGame ties a Field, a Player and a scheduler together: shots are
+queued with aim() and resolved on the next tick through Player.shoot.
+"""
+import math
+import time
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from output import OutputSink
+from shooting_game import Animal, Gun, Player
+from spawn_table import RngLike, _generator
+
+DEFAULT_RADIUS: float = 1.0
+
+# Rows of Field._columns
+_X, _Y, _VX, _VY, _RADIUS = range(5)
+
+
+class SpatialHash:
+    """
+    A uniform grid over the field, rebuilt from scratch every tick.
+
+    Points are sorted by cell, so each cell is a contiguous run of indices and a
+    row of neighbouring cells is a single slice.
+
+    Attributes:
+        cell_size (float): The side length of a cell.
+        columns (int): The number of cells across the field.
+        rows (int): The number of cells down the field.
+    """
+    def __init__(self, width: float, height: float, cell_size: float):
+        """
+        Initializes an empty SpatialHash instance.
+
+        Args:
+            width: The width of the field.
+            height: The height of the field.
+            cell_size: The side length of a cell, ideally about twice the largest hit radius.
+
+        Raises:
+            ValueError: If a dimension or the cell size is not positive.
+        """
+        if width <= 0 or height <= 0 or cell_size <= 0:
+            raise ValueError("The field dimensions and cell size must be positive.")
+        self.cell_size: float = cell_size
+        self._inverse_size: float = 1.0 / cell_size
+        self.columns: int = max(1, math.ceil(width / cell_size))
+        self.rows: int = max(1, math.ceil(height / cell_size))
+        self._order: np.ndarray = np.empty(0, dtype=np.int64)
+        self._starts: np.ndarray = np.zeros(self.columns * self.rows + 1, dtype=np.int64)
+
+    def _cell(self, coordinates: np.ndarray, cells: int) -> np.ndarray:
+        """Maps coordinates to cell indices along one axis, clamped to the grid."""
+        return np.clip((coordinates * self._inverse_size).astype(np.int64), 0, cells - 1)
+
+    def rebuild(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        Buckets points into their cells.
+
+        Args:
+            x: The x coordinate of each point.
+            y: The y coordinate of each point.
+        """
+        cells: np.ndarray = self._cell(y, self.rows) * self.columns + self._cell(x, self.columns)
+        self._order = np.argsort(cells) # Order within a cell does not matter
+        counts: np.ndarray = np.bincount(cells, minlength=self.columns * self.rows)
+        self._starts[1:] = np.cumsum(counts)
+
+    def candidates(self, x: float, y: float, radius: float) -> np.ndarray:
+        """
+        Returns the points in every cell overlapping a square around a position.
+
+        Args:
+            x: The x coordinate of the position.
+            y: The y coordinate of the position.
+            radius: Half the side of the square.
+
+        Returns:
+            The indices of the points, as passed to rebuild().
+        """
+        size: float = self.cell_size
+        first_column: int = min(max(int((x - radius) // size), 0), self.columns - 1)
+        last_column: int = min(max(int((x + radius) // size), 0), self.columns - 1)
+        first_row: int = min(max(int((y - radius) // size), 0), self.rows - 1)
+        last_row: int = min(max(int((y + radius) // size), 0), self.rows - 1)
+        starts: np.ndarray = self._starts
+        runs: List[np.ndarray] = []
+        for row in range(first_row, last_row + 1):
+            base: int = row * self.columns
+            runs.append(self._order[starts[base + first_column]:starts[base + last_column + 1]])
+        return runs[0] if len(runs) == 1 else np.concatenate(runs)
+
+
+class Field:
+    """
+    A rectangular field of moving animals.
+
+    Attributes:
+        width (float): The width of the field.
+        height (float): The height of the field.
+        animals (List[Animal]): The animals on the field.
+        grid (SpatialHash): The animals bucketed by position, rebuilt on the
+            first query after they moved or were spawned.
+    """
+    def __init__(self, width: float, height: float, cell_size: Optional[float] = None):
+        """
+        Initializes an empty Field instance.
+
+        Args:
+            width: The width of the field.
+            height: The height of the field.
+            cell_size: The side length of the spatial hash cells. Defaults to
+                four times DEFAULT_RADIUS.
+        """
+        self.width: float = width
+        self.height: float = height
+        self.animals: List[Animal] = []
+        # x, y, vx, vy and radius of each animal; only the first len(animals) columns are in use
+        self._columns: np.ndarray = np.empty((5, 16))
+        self._alive_buffer: np.ndarray = np.empty(16, dtype=bool)
+        self._removed: int = 0
+        self._max_radius: float = 0.0
+        self.grid: SpatialHash = SpatialHash(width, height, cell_size or 4 * DEFAULT_RADIUS)
+        self._grid_stale: bool = False
+
+    @property
+    def x(self) -> np.ndarray:
+        """The x coordinate of each animal."""
+        return self._columns[_X, :len(self.animals)]
+
+    @property
+    def y(self) -> np.ndarray:
+        """The y coordinate of each animal."""
+        return self._columns[_Y, :len(self.animals)]
+
+    @property
+    def vx(self) -> np.ndarray:
+        """The horizontal velocity of each animal, per second."""
+        return self._columns[_VX, :len(self.animals)]
+
+    @property
+    def vy(self) -> np.ndarray:
+        """The vertical velocity of each animal, per second."""
+        return self._columns[_VY, :len(self.animals)]
+
+    @property
+    def radius(self) -> np.ndarray:
+        """The hit radius of each animal."""
+        return self._columns[_RADIUS, :len(self.animals)]
+
+    @property
+    def _alive(self) -> np.ndarray:
+        """Whether each animal is still on the field."""
+        return self._alive_buffer[:len(self.animals)]
+
+    def _reserve(self, size: int) -> None:
+        """Grows the columns to hold at least size animals, doubling their capacity."""
+        capacity: int = self._columns.shape[1]
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        used: int = len(self.animals)
+        columns: np.ndarray = np.empty((5, capacity))
+        columns[:, :used] = self._columns[:, :used]
+        alive: np.ndarray = np.empty(capacity, dtype=bool)
+        alive[:used] = self._alive_buffer[:used]
+        self._columns, self._alive_buffer = columns, alive
+
+    def _refresh_grid(self) -> None:
+        """Rebuilds the spatial hash if the animals moved or were spawned since it was built."""
+        if self._grid_stale:
+            self.grid.rebuild(self.x, self.y)
+            self._grid_stale = False
+
+    def __len__(self) -> int:
+        """Returns the number of animals on the field."""
+        return len(self.animals) - self._removed
+
+    def spawn(self, animal: Animal, x: float, y: float, vx: float = 0.0, vy: float = 0.0, radius: float = DEFAULT_RADIUS) -> None:
+        """
+        Places one animal on the field.
+
+        Args:
+            animal: The animal.
+            x: Its x coordinate.
+            y: Its y coordinate.
+            vx: Its horizontal velocity, per second.
+            vy: Its vertical velocity, per second.
+            radius: How close to it a shot must land to hit it.
+        """
+        self.spawn_many([animal], [x], [y], [vx], [vy], [radius])
+
+    def spawn_many(
+        self,
+        animals: Sequence[Animal],
+        x: Sequence[float],
+        y: Sequence[float],
+        vx: Union[float, Sequence[float]] = 0.0,
+        vy: Union[float, Sequence[float]] = 0.0,
+        radius: Union[float, Sequence[float]] = DEFAULT_RADIUS,
+    ) -> None:
+        """
+        Places many animals on the field at once.
+
+        Args:
+            animals: The animals.
+            x: The x coordinate of each animal.
+            y: The y coordinate of each animal.
+            vx: The horizontal velocity of each animal, or one for all of them.
+            vy: The vertical velocity of each animal, or one for all of them.
+            radius: The hit radius of each animal, or one for all of them.
+        """
+        n: int = len(animals)
+        if n == 0:
+            return
+        start: int = len(self.animals)
+        self._reserve(start + n)
+        columns: np.ndarray = self._columns[:, start:start + n]
+        for row, values in ((_X, x), (_Y, y), (_VX, vx), (_VY, vy), (_RADIUS, radius)):
+            columns[row] = values
+        self._alive_buffer[start:start + n] = True
+        self.animals.extend(animals)
+        self._max_radius = max(self._max_radius, float(columns[_RADIUS].max()))
+        self._grid_stale = True
+
+    def populate(
+        self,
+        animals: Sequence[Animal],
+        n: int,
+        rng: RngLike = None,
+        max_speed: float = 0.0,
+        radius: float = DEFAULT_RADIUS,
+        weights: Optional[Sequence[float]] = None,
+    ) -> None:
+        """
+        Scatters n animals uniformly over the field, moving in random directions.
+
+        Args:
+            animals: The species to choose from; each is shared by all its copies.
+            n: The number of animals to place.
+            rng: A seed, NumPy Generator or RandomService.
+            max_speed: The largest speed an animal gets, per second.
+            radius: The hit radius of every animal.
+            weights: The relative frequency of each species. Defaults to equal.
+        """
+        generator: np.random.Generator = _generator(rng)
+        probabilities = None if weights is None else np.asarray(weights, dtype=np.float64) / np.sum(weights)
+        species: np.ndarray = generator.choice(len(animals), size=n, p=probabilities)
+        speed: np.ndarray = generator.random(n) * max_speed
+        heading: np.ndarray = generator.random(n) * (2 * math.pi)
+        self.spawn_many(
+            [animals[index] for index in species.tolist()],
+            generator.random(n) * self.width, generator.random(n) * self.height,
+            speed * np.cos(heading), speed * np.sin(heading), radius,
+        )
+
+    def remove(self, index: int) -> None:
+        """
+        Takes an animal off the field. It is dropped from the columns on the next step().
+
+        Args:
+            index: The animal's index in animals.
+        """
+        if self._alive[index]:
+            self._alive[index] = False
+            self._removed += 1
+
+    def _compact(self) -> None:
+        """Drops removed animals from every column."""
+        alive: np.ndarray = self._alive
+        kept: np.ndarray = self._columns[:, :len(alive)][:, alive]
+        self.animals = [animal for animal, keep in zip(self.animals, alive.tolist()) if keep]
+        self._columns[:, :len(self.animals)] = kept
+        self._alive_buffer[:len(self.animals)] = True
+        self._removed = 0
+
+    def step(self, dt: float) -> None:
+        """
+        Moves every animal, bouncing them off the edges.
+
+        The spatial hash is rebuilt on the next shot, so several steps between
+        two shots only rebuild it once.
+
+        Args:
+            dt: The elapsed time in seconds.
+        """
+        if self._removed:
+            self._compact()
+        x: np.ndarray = self.x
+        y: np.ndarray = self.y
+        x += self.vx * dt
+        y += self.vy * dt
+        # Reflect animals that crossed an edge back onto the field
+        for position, velocity, limit in ((x, self.vx, self.width), (y, self.vy, self.height)):
+            low: np.ndarray = position < 0
+            high: np.ndarray = position > limit
+            position[low] = -position[low]
+            position[high] = 2 * limit - position[high]
+            velocity[low | high] *= -1
+            np.clip(position, 0, limit, out=position)
+        self._grid_stale = True
+
+    def animal_at(self, x: float, y: float) -> Optional[int]:
+        """
+        Finds the animal a shot at a position would hit.
+
+        Args:
+            x: The x coordinate of the shot.
+            y: The y coordinate of the shot.
+
+        Returns:
+            The index in animals of the nearest animal whose hit radius covers the
+            position, or None if there is none.
+        """
+        if not self.animals:
+            return None
+        self._refresh_grid()
+        candidates: np.ndarray = self.grid.candidates(x, y, self._max_radius)
+        if len(candidates) == 0:
+            return None
+        dx: np.ndarray = self.x[candidates] - x
+        dy: np.ndarray = self.y[candidates] - y
+        distance: np.ndarray = dx * dx + dy * dy
+        distance[~((distance <= self.radius[candidates] ** 2) & self._alive[candidates])] = np.inf
+        nearest: int = int(np.argmin(distance))
+        return int(candidates[nearest]) if np.isfinite(distance[nearest]) else None
+
+    def shoot(self, player: Player, x: float, y: float) -> Optional[Animal]:
+        """
+        Resolves a shot at a position through Player.shoot.
+
+        The gun's accuracy still decides whether a shot at an animal hits; a shot
+        where there is no animal always misses. A hit animal leaves the field.
+
+        Args:
+            player: The player firing.
+            x: The x coordinate of the shot.
+            y: The y coordinate of the shot.
+
+        Returns:
+            The animal hit, or None.
+        """
+        index: Optional[int] = self.animal_at(x, y)
+        target: Optional[Animal] = self.animals[index] if index is not None else None
+        if not player.shoot(target) or index is None:
+            return None
+        self.remove(index)
+        return target
+
+
+class TickScheduler:
+    """
+    Runs updates at a fixed timestep, independent of how fast frames are drawn.
+
+    Real time is accumulated and spent in whole ticks, so the simulation behaves
+    the same on fast and slow machines. If the updates fall behind, at most
+    max_catch_up ticks run per frame and the rest of the backlog is dropped.
+
+    Attributes:
+        dt (float): The length of a tick in seconds.
+        max_catch_up (int): The most ticks run between two frames.
+        tick (int): The number of ticks run so far.
+    """
+    def __init__(
+        self,
+        tick_rate: float = 60.0,
+        max_catch_up: int = 5,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initializes a TickScheduler instance.
+
+        Args:
+            tick_rate: The number of ticks per second.
+            max_catch_up: The most ticks run between two frames.
+            clock: Returns the current time in seconds.
+            sleep: Waits for a number of seconds.
+
+        Raises:
+            ValueError: If tick_rate or max_catch_up is not positive.
+        """
+        if tick_rate <= 0 or max_catch_up < 1:
+            raise ValueError("tick_rate and max_catch_up must be positive.")
+        self.dt: float = 1.0 / tick_rate
+        self.max_catch_up: int = max_catch_up
+        self.tick: int = 0
+        self._clock: Callable[[], float] = clock
+        self._sleep: Callable[[float], None] = sleep
+
+    def run(
+        self,
+        update: Callable[[float], Optional[bool]],
+        render: Optional[Callable[[float], None]] = None,
+        max_ticks: Optional[int] = None,
+    ) -> int:
+        """
+        Runs the loop until update returns False or max_ticks ticks have run.
+
+        Args:
+            update: Called with dt once per tick. Returning False stops the loop.
+            render: Called once per frame with how far, from 0 to 1, the time
+                between the last tick and the next one has passed.
+            max_ticks: If given, the loop stops after this many ticks.
+
+        Returns:
+            The number of ticks run by this call.
+        """
+        dt: float = self.dt
+        accumulator: float = 0.0
+        last: float = self._clock()
+        ticks: int = 0
+        while max_ticks is None or ticks < max_ticks:
+            now: float = self._clock()
+            accumulator += now - last
+            last = now
+            steps: int = 0
+            while accumulator >= dt and steps < self.max_catch_up:
+                accumulator -= dt
+                steps += 1
+                ticks += 1
+                self.tick += 1
+                if update(dt) is False or ticks == max_ticks:
+                    return ticks
+            if steps == self.max_catch_up:
+                accumulator = min(accumulator, dt) # Drop the backlog instead of spiralling
+            if render is not None:
+                render(accumulator / dt)
+            self._sleep(max(0.0, dt - accumulator))
+        return ticks
+
+
+class RealTimeGame:
+    """
+    A player hunting the animals of a field in real time.
+
+    Attributes:
+        field (Field): The field of animals.
+        player (Player): The player.
+        scheduler (TickScheduler): Runs the game's ticks.
+        pending_shots (List[Tuple[float, float]]): Shots aimed since the last tick.
+        hits (List[Animal]): The animals hit so far, in order.
+    """
+    def __init__(self, field: Field, gun: Gun, sink: Optional[OutputSink] = None, tick_rate: float = 60.0):
+        """
+        Initializes a RealTimeGame instance.
+
+        Args:
+            field: The field of animals.
+            gun: The player's gun.
+            sink: Where the player's and animals' messages are written.
+            tick_rate: The number of ticks per second.
+        """
+        self.field: Field = field
+        self.player: Player = Player(sink=sink)
+        self.player.selected_gun = gun
+        self.scheduler: TickScheduler = TickScheduler(tick_rate)
+        self.pending_shots: List[Tuple[float, float]] = []
+        self.hits: List[Animal] = []
+
+    def aim(self, x: float, y: float) -> None:
+        """
+        Queues a shot at a position, resolved on the next tick.
+
+        Args:
+            x: The x coordinate of the shot.
+            y: The y coordinate of the shot.
+        """
+        self.pending_shots.append((x, y))
+
+    def update(self, dt: float) -> bool:
+        """
+        Advances the game by one tick: resolves queued shots, then moves the animals.
+
+        Args:
+            dt: The length of the tick in seconds.
+
+        Returns:
+            False once the field is empty, True otherwise.
+        """
+        for x, y in self.pending_shots:
+            hit: Optional[Animal] = self.field.shoot(self.player, x, y)
+            if hit is not None:
+                self.hits.append(hit)
+        self.pending_shots.clear()
+        self.field.step(dt)
+        return len(self.field) > 0
+
+    def run(self, max_ticks: Optional[int] = None, render: Optional[Callable[[float], None]] = None) -> int:
+        """
+        Runs the game in real time until the field is empty or max_ticks ticks have run.
+
+        Args:
+            max_ticks: If given, the game stops after this many ticks.
+            render: Called once per frame, see TickScheduler.run.
+
+        Returns:
+            The number of ticks run.
+        """
+        return self.scheduler.run(self.update, render=render, max_ticks=max_ticks)
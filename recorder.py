@@ -0,0 +1,288 @@
+"""
+Compact binary recording and fast-forward replay of game sessions.
+
+EventRecorder is an output sink: it encodes the structured events a Game emits
+(gun choice, spawns, hits, misses and score changes) as one opcode byte plus
+varint operands, and can forward every message to another sink for display.
+replay() decodes a recording and rebuilds the final Player and ScoreBoard state
+without touching an RNG or formatting any text.
+"""
+from collections import Counter
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Type, TYPE_CHECKING
+
+from output import NullSink, OutputSink
+from shooting_game import Gun, Player, ScoreBoard
+
+if TYPE_CHECKING:
+    from catalog import Catalog
+
+MAGIC: bytes = b"SGEV"
+FORMAT_VERSION: int = 1
+
+# Opcodes
+OP_NAME = 0 # Defines a name: varint id, varint length, UTF-8 bytes
+OP_GUN = 1 # Gun selected: varint name id
+OP_SPAWN = 2 # Animal appeared: varint name id
+OP_HIT = 3 # Shot hit: zigzag varint points
+OP_MISS = 4 # Shot missed
+OP_PLAYER_POINTS = 5 # Player.add_points: zigzag varint points
+OP_SCORE = 6 # ScoreBoard.update_score: zigzag varint points
+OP_END = 7 # Game over
+
+
+class RecordingError(Exception):
+    """Raised when a recording is malformed or of an unsupported version."""
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Appends an unsigned LEB128 varint."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Decodes an unsigned varint, returning the value and the next position."""
+    value: int = 0
+    shift: int = 0
+    while True:
+        byte: int = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    """Maps signed ints to unsigned ones so small magnitudes stay short."""
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+class EventRecorder(OutputSink):
+    """
+    Encodes game events into a compact binary recording.
+
+    Attributes:
+        inner (OutputSink): The sink every message is forwarded to.
+        stream (Optional[BinaryIO]): Where the recording is written on flush, if given.
+    """
+    def __init__(self, inner: Optional[OutputSink] = None, stream: Optional[BinaryIO] = None):
+        """
+        Initializes an EventRecorder instance.
+
+        Args:
+            inner: The sink every message is forwarded to. Defaults to a NullSink.
+            stream: A binary stream the recording is written to on each flush. Without
+                one the recording stays in memory, see getvalue().
+        """
+        self.inner: OutputSink = inner if inner is not None else NullSink()
+        self.stream: Optional[BinaryIO] = stream
+        self._buffer: bytearray = bytearray(MAGIC)
+        self._buffer.append(FORMAT_VERSION)
+        self._names: Dict[str, int] = {}
+        self._written: List[bytes] = [] # Flushed chunks, joined only by getvalue()
+
+    def _name_id(self, name: str) -> int:
+        """Returns the id of a name, defining it in the recording on first use."""
+        name_id: Optional[int] = self._names.get(name)
+        if name_id is None:
+            name_id = self._names[name] = len(self._names)
+            encoded: bytes = name.encode()
+            self._buffer.append(OP_NAME)
+            _write_varint(self._buffer, name_id)
+            _write_varint(self._buffer, len(encoded))
+            self._buffer += encoded
+        return name_id
+
+    def emit(self, event: str, template: str, **fields: Any) -> None:
+        """Encodes the events relevant to replay and forwards every message."""
+        buffer: bytearray = self._buffer
+        if event == "shot_hit":
+            buffer.append(OP_HIT)
+            _write_varint(buffer, _zigzag(fields["points"]))
+        elif event == "shot_miss":
+            buffer.append(OP_MISS)
+        elif event == "points_added":
+            buffer.append(OP_PLAYER_POINTS)
+            _write_varint(buffer, _zigzag(fields["points"]))
+        elif event == "score_updated":
+            buffer.append(OP_SCORE)
+            _write_varint(buffer, _zigzag(fields["points"]))
+        elif event == "animal_appear":
+            name_id: int = self._name_id(fields["animal"])
+            buffer.append(OP_SPAWN)
+            _write_varint(buffer, name_id)
+        elif event == "gun_selected":
+            name_id = self._name_id(fields["gun"])
+            buffer.append(OP_GUN)
+            _write_varint(buffer, name_id)
+        elif event == "volley":
+            for value in fields["scores"]:
+                buffer.append(OP_HIT)
+                _write_varint(buffer, _zigzag(value))
+            buffer += bytes([OP_MISS]) * (fields["shots"] - fields["hits"])
+        elif event == "scores_updated":
+            for value in fields["scores"]:
+                buffer.append(OP_SCORE)
+                _write_varint(buffer, _zigzag(value))
+        elif event == "game_over":
+            buffer.append(OP_END)
+        self.inner.emit(event, template, **fields)
+
+    def getvalue(self) -> bytes:
+        """Returns the full recording so far, including anything already written to the stream."""
+        return b"".join(self._written) + bytes(self._buffer)
+
+    def flush(self) -> None:
+        """Writes the pending part of the recording to the stream and flushes the inner sink."""
+        if self.stream is not None and self._buffer:
+            chunk: bytes = bytes(self._buffer)
+            self.stream.write(chunk)
+            self.stream.flush()
+            self._written.append(chunk)
+            self._buffer = bytearray()
+        self.inner.flush()
+
+
+def _gun_classes() -> Dict[str, Type[Gun]]:
+    """Maps the class name of every Gun subclass to the class."""
+    classes: Dict[str, Type[Gun]] = {}
+    pending: List[Type[Gun]] = [Gun]
+    while pending:
+        cls: Type[Gun] = pending.pop()
+        classes[cls.__name__] = cls
+        pending.extend(cls.__subclasses__())
+    return classes
+
+
+class ReplayResult:
+    """
+    The state rebuilt from a recording.
+
+    Attributes:
+        player (Player): The player with their selected gun and final points.
+        scoreboard (ScoreBoard): The scoreboard with every recorded score.
+        gun_name (Optional[str]): The name of the last gun selected.
+        shots (int): The number of shots fired.
+        hits (int): The number of shots that hit.
+        spawns (Counter): How often each animal appeared.
+        finished (bool): Whether the recording includes the end of the game.
+        events (int): The number of events replayed.
+    """
+    def __init__(self):
+        """Initializes an empty ReplayResult instance."""
+        self.player: Player = Player(sink=NullSink())
+        self.scoreboard: ScoreBoard = ScoreBoard(sink=NullSink())
+        self.gun_name: Optional[str] = None
+        self.shots: int = 0
+        self.hits: int = 0
+        self.spawns: Counter = Counter()
+        self.finished: bool = False
+        self.events: int = 0
+
+
+def replay(data: bytes, catalog: Optional["Catalog"] = None) -> ReplayResult:
+    """
+    Fast-forwards through a recording.
+
+    Score changes are summed and applied to the Player and ScoreBoard in bulk
+    at the end, so no per-event game logic or output runs.
+
+    Args:
+        data: A recording produced by EventRecorder.
+        catalog: The catalog the game was played with, if any. Its guns are
+            matched by name; otherwise the gun is rebuilt from the Gun subclass
+            of that name.
+
+    Raises:
+        RecordingError: If the recording is malformed or of another version.
+
+    Returns:
+        The rebuilt state.
+    """
+    if data[:4] != MAGIC or len(data) < 5:
+        raise RecordingError("Not a game recording")
+    if data[4] != FORMAT_VERSION:
+        raise RecordingError(f"Unsupported recording version {data[4]}")
+
+    names: List[str] = []
+    spawn_counts: List[int] = []
+    player_points: int = 0
+    scores: List[int] = []
+    gun_id: int = -1
+    shots: int = 0
+    hits: int = 0
+    events: int = 0
+    finished: bool = False
+    pos: int = 5
+    end: int = len(data)
+    try:
+        while pos < end:
+            op: int = data[pos]
+            pos += 1
+            events += 1
+            if op == OP_HIT or op == OP_PLAYER_POINTS or op == OP_SCORE or op == OP_SPAWN or op == OP_GUN:
+                # Inline varint decode, the hot path of the replay loop
+                byte: int = data[pos]
+                pos += 1
+                value: int = byte & 0x7F
+                shift: int = 7
+                while byte & 0x80:
+                    byte = data[pos]
+                    pos += 1
+                    value |= (byte & 0x7F) << shift
+                    shift += 7
+                if op == OP_SPAWN or op == OP_GUN:
+                    if value >= len(names):
+                        raise RecordingError(f"Undefined name id {value} at offset {pos}")
+                    if op == OP_SPAWN:
+                        spawn_counts[value] += 1
+                    else:
+                        gun_id = value
+                    continue
+                value = (value >> 1) ^ -(value & 1) # Undo zigzag
+                if op == OP_HIT:
+                    shots += 1
+                    hits += 1
+                elif op == OP_PLAYER_POINTS:
+                    player_points += value
+                else:
+                    scores.append(value)
+            elif op == OP_MISS:
+                shots += 1
+            elif op == OP_END:
+                finished = True
+            elif op == OP_NAME:
+                events -= 1
+                name_id, pos = _read_varint(data, pos)
+                length, pos = _read_varint(data, pos)
+                if name_id != len(names) or pos + length > end:
+                    raise RecordingError("Malformed name definition")
+                names.append(data[pos:pos + length].decode())
+                spawn_counts.append(0)
+                pos += length
+            else:
+                raise RecordingError(f"Unknown opcode {op} at offset {pos - 1}")
+    except IndexError:
+        raise RecordingError("Recording ends in the middle of an event") from None
+
+    result = ReplayResult()
+    result.events = events
+    result.shots = shots
+    result.hits = hits
+    result.finished = finished
+    result.spawns = Counter({names[i]: count for i, count in enumerate(spawn_counts) if count})
+    if gun_id >= 0:
+        result.gun_name = names[gun_id]
+        if catalog is not None:
+            guns: Dict[str, Gun] = {gun.name: gun for gun in catalog.build_guns()}
+            result.player.selected_gun = guns.get(result.gun_name)
+        else:
+            gun_class: Optional[Type[Gun]] = _gun_classes().get(result.gun_name)
+            result.player.selected_gun = gun_class() if gun_class is not None else None
+    result.player.points = player_points
+    result.scoreboard.update_scores(scores)
+    return result
+
@@ -0,0 +1,233 @@
+"""
+Compact score history and running statistics for ScoreBoard.
+
+ScoreHistory stores points as 64-bit ints in a typed ``array('q')`` instead of a
+list of Python ints, optionally as a fixed-capacity ring buffer. RunningStats
+keeps count, sum, min, max, mean and variance up to date in O(1) per recorded
+score.
+"""
+import math
+from array import array
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+class RunningStats:
+    """
+    Incrementally maintained summary statistics (Welford's algorithm).
+
+    Attributes:
+        count (int): The number of values recorded.
+        total (int): The sum of the values recorded.
+        minimum (Optional[int]): The smallest value recorded, or None if empty.
+        maximum (Optional[int]): The largest value recorded, or None if empty.
+        mean (float): The arithmetic mean of the values recorded.
+    """
+    def __init__(self):
+        """Initializes an empty RunningStats instance."""
+        self.count: int = 0
+        self.total: int = 0
+        self.minimum: Optional[int] = None
+        self.maximum: Optional[int] = None
+        self.mean: float = 0.0
+        self._m2: float = 0.0 # Sum of squared differences from the mean
+
+    def update(self, value: int) -> None:
+        """
+        Records a single value.
+
+        Args:
+            value: The value to record.
+        """
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        delta: float = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def update_many(self, values: Iterable[int]) -> None:
+        """
+        Records many values at once.
+
+        Args:
+            values: The values to record.
+        """
+        values = list(values)
+        if not values:
+            return
+        batch = RunningStats()
+        batch.count = len(values)
+        batch.total = sum(values)
+        batch.minimum = min(values)
+        batch.maximum = max(values)
+        batch.mean = batch.total / batch.count
+        batch._m2 = sum((value - batch.mean) ** 2 for value in values)
+        self.merge(batch)
+
+    def merge(self, other: "RunningStats") -> None:
+        """
+        Folds the values recorded by another instance into this one.
+
+        Args:
+            other: The statistics to merge in.
+        """
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.total, self.mean, self._m2 = other.count, other.total, other.mean, other._m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return
+        count: int = self.count + other.count
+        delta: float = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self) -> float:
+        """The population variance of the values recorded, or 0.0 if empty."""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """The population standard deviation of the values recorded."""
+        return math.sqrt(self.variance)
+
+
+class ScoreHistory:
+    """
+    A typed-array record of individual scores, oldest first.
+
+    With a capacity it behaves as a ring buffer that keeps only the most recent
+    scores, so memory stays flat however many scores are appended.
+
+    Attributes:
+        capacity (Optional[int]): The maximum number of scores kept, or None for no limit.
+    """
+    def __init__(self, capacity: Optional[int] = None, typecode: str = "q"):
+        """
+        Initializes an empty ScoreHistory instance.
+
+        Args:
+            capacity: The maximum number of scores kept, or None for no limit.
+            typecode: The array typecode used for storage. The default holds any
+                64-bit score.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity: Optional[int] = capacity
+        self._data: array = array(typecode)
+        self._start: int = 0 # Index of the oldest score once the ring buffer is full
+
+    def append(self, points: int) -> None:
+        """
+        Records a score, dropping the oldest one if the ring buffer is full.
+
+        Args:
+            points: The score to record.
+
+        Raises:
+            OverflowError: If the score does not fit the typecode; nothing is recorded.
+        """
+        if self.capacity is None or len(self._data) < self.capacity:
+            self._data.append(points)
+        else:
+            self._data[self._start] = points
+            self._start = (self._start + 1) % self.capacity
+
+    def extend(self, values: Iterable[int]) -> None:
+        """
+        Records many scores at once, oldest first.
+
+        Args:
+            values: The scores to record.
+
+        Raises:
+            OverflowError: If a score does not fit the typecode; nothing is recorded.
+        """
+        values = array(self._data.typecode, values) # Converted up front so a bad score changes nothing
+        if self.capacity is None:
+            self._data.extend(values)
+            return
+        if len(values) >= self.capacity:
+            # Only the newest scores survive, so replace the buffer outright
+            self._data = values[-self.capacity:]
+            self._start = 0
+            return
+        for points in values:
+            self.append(points)
+
+    def to_array(self) -> array:
+        """
+        Returns the scores as a contiguous array, oldest first.
+
+        Returns:
+            The underlying array when it is already in order, otherwise an ordered copy.
+        """
+        if self._start == 0:
+            return self._data
+        return self._data[self._start:] + self._data[:self._start]
+
+    @property
+    def typecode(self) -> str:
+        """The array typecode used for storage."""
+        return self._data.typecode
+
+    def buffers(self) -> Tuple[memoryview, ...]:
+        """
+        Returns views of the stored scores without copying them, oldest first.
+
+        The views lock the underlying array, so release them before recording
+        more scores.
+
+        Returns:
+            One view, or two once the ring buffer has wrapped around.
+        """
+        view: memoryview = memoryview(self._data)
+        if self._start == 0:
+            return (view,)
+        return (view[self._start:], view[:self._start])
+
+    def tolist(self) -> List[int]:
+        """Returns the scores as a list, oldest first."""
+        return self.to_array().tolist()
+
+    def clear(self) -> None:
+        """Removes all scores."""
+        del self._data[:]
+        self._start = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[int]:
+        if self._start == 0:
+            return iter(self._data)
+        return iter(self.to_array())
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, List[int]]:
+        if isinstance(index, slice):
+            return self.tolist()[index]
+        size: int = len(self._data)
+        if not -size <= index < size:
+            raise IndexError("score history index out of range")
+        return self._data[(self._start + index) % size]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ScoreHistory):
+            return self.tolist() == other.tolist()
+        if isinstance(other, (list, tuple, array)):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ScoreHistory({self.tolist()!r}, capacity={self.capacity!r})"
@@ -0,0 +1,389 @@
+"""
+Persistent, append-only binary log of scores and finished games.
+
+Every record has the same fixed width, so the log can be memory-mapped and read
+as a NumPy structured array without loading or parsing the whole file.
+Compaction rewrites the log grouped by player and writes an index next to it
+(``<path>.idx``) holding each player's record range and aggregates, so history
+and leaderboard queries only scan records appended since the last compaction.
+Each compaction stamps the log and its index with a new random generation, and
+an index is only used with the log of the same generation. A crash between
+replacing the log and replacing the index therefore cannot pair the new log
+with the old index.
+"""
+import mmap
+import os
+import struct
+import time
+from typing import BinaryIO, List, Optional, Tuple
+
+import numpy as np
+
+SCORE_RECORD: int = 0 # A single ScoreBoard.update_score call
+GAME_RECORD: int = 1 # A finished game and its final score
+
+LOG_MAGIC: bytes = b"SCLG"
+INDEX_MAGIC: bytes = b"SCIX"
+FORMAT_VERSION: int = 2
+
+# Header: magic, version, record size, generation
+_LOG_HEADER = struct.Struct("<4sHHQ")
+# Header of version 1 logs, which have no generation; compact() upgrades them
+_LOG_HEADER_V1 = struct.Struct("<4sHH")
+# Record: kind, 3 padding bytes, player id, points, unix timestamp
+_RECORD = struct.Struct("<BxxxIqd")
+# Header: magic, version, padding, generation of the log, records covered by the index, number of players
+_INDEX_HEADER = struct.Struct("<4sHxxQQQ")
+
+RECORD_DTYPE = np.dtype({
+    "names": ["kind", "player", "points", "time"],
+    "formats": ["u1", "<u4", "<i8", "<f8"],
+    "offsets": [0, 4, 8, 16],
+    "itemsize": _RECORD.size,
+})
+
+INDEX_DTYPE = np.dtype([
+    ("player", "<u4"), ("pad", "V4"), ("start", "<u8"), ("count", "<u8"),
+    ("total", "<i8"), ("best", "<i8"), ("games", "<u8"),
+])
+
+_NO_GAME: int = np.iinfo(np.int64).min
+
+
+class ScoreLogError(Exception):
+    """Raised when a log or index file is not in the expected format."""
+
+
+def _new_generation() -> int:
+    """Returns a random generation for a new or compacted log."""
+    return int.from_bytes(os.urandom(8), "little")
+
+
+class ScoreLog:
+    """
+    An append-only score log with memory-mapped reads.
+
+    Attributes:
+        path (str): The path of the log file.
+        index_path (str): The path of the index written by compact().
+    """
+    def __init__(self, path: str):
+        """
+        Opens or creates a ScoreLog.
+
+        Args:
+            path: The path of the log file.
+
+        Raises:
+            ScoreLogError: If the file exists but is not a score log.
+        """
+        self.path: str = path
+        self.index_path: str = path + ".idx"
+        self._file: Optional[BinaryIO] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._mapped_size: int = 0
+        self._index_mmap: Optional[mmap.mmap] = None
+        self._index: Optional[np.ndarray] = None
+        self._indexed_records: int = 0
+        self._header_size: int = _LOG_HEADER.size
+        self._generation: Optional[int] = None
+        self._open_for_append()
+        self._load_index()
+
+    def _open_for_append(self) -> None:
+        """
+        Opens the log for appending, writing the header of a new file.
+
+        A record cut short by a crash mid-write is dropped, so later records
+        stay aligned.
+        """
+        self._file = open(self.path, "ab")
+        size: int = self._file.tell()
+        if size == 0:
+            self._generation = _new_generation()
+            self._header_size = _LOG_HEADER.size
+            self._file.write(_LOG_HEADER.pack(LOG_MAGIC, FORMAT_VERSION, _RECORD.size, self._generation))
+            self._file.flush()
+            return
+        with open(self.path, "rb") as existing:
+            header: bytes = existing.read(_LOG_HEADER.size)
+        try:
+            self._read_header(header)
+        except ScoreLogError:
+            self._file.close()
+            self._file = None
+            raise
+        partial: int = (size - self._header_size) % _RECORD.size
+        if partial:
+            self._file.truncate(size - partial)
+
+    def _read_header(self, header: bytes) -> None:
+        """Reads the generation and header size of an existing log."""
+        if len(header) < _LOG_HEADER_V1.size:
+            raise ScoreLogError(f"{self.path} is too short to be a score log")
+        magic, version, record_size = _LOG_HEADER_V1.unpack_from(header)
+        if magic != LOG_MAGIC or version not in (1, FORMAT_VERSION) or record_size != _RECORD.size:
+            raise ScoreLogError(f"{self.path} is not a version {FORMAT_VERSION} score log")
+        if version == 1:
+            self._header_size, self._generation = _LOG_HEADER_V1.size, None # Never matches an index
+        elif len(header) < _LOG_HEADER.size:
+            raise ScoreLogError(f"{self.path} is too short to be a score log")
+        else:
+            self._header_size, self._generation = _LOG_HEADER.size, _LOG_HEADER.unpack(header)[3]
+
+    def append_score(self, player_id: int, points: int) -> None:
+        """
+        Appends a single score update.
+
+        Args:
+            player_id: The player who scored.
+            points: The points scored.
+        """
+        self._file.write(_RECORD.pack(SCORE_RECORD, player_id, points, time.time()))
+
+    def append_game(self, player_id: int, final_score: int) -> None:
+        """
+        Appends a finished game.
+
+        Args:
+            player_id: The player who played the game.
+            final_score: The player's final score.
+        """
+        self._file.write(_RECORD.pack(GAME_RECORD, player_id, final_score, time.time()))
+
+    def flush(self) -> None:
+        """Writes buffered records to disk."""
+        if self._file is not None:
+            self._file.flush()
+
+    def _records(self) -> np.ndarray:
+        """
+        Maps the log into memory.
+
+        Returns:
+            A read-only structured array over every record in the log.
+        """
+        self.flush()
+        size: int = os.path.getsize(self.path)
+        count: int = (size - self._header_size) // _RECORD.size
+        if count == 0:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        if self._mmap is None or size != self._mapped_size:
+            self._close_mmap()
+            with open(self.path, "rb") as log_file:
+                self._mmap = mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_size = size
+        return np.frombuffer(self._mmap, dtype=RECORD_DTYPE, count=count, offset=self._header_size)
+
+    def __len__(self) -> int:
+        """Returns the number of records in the log."""
+        self.flush()
+        return (os.path.getsize(self.path) - self._header_size) // _RECORD.size
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Reads a range of records.
+
+        Args:
+            start: The index of the first record.
+            stop: The index after the last record, or None for the end of the log.
+
+        Returns:
+            A copy of the records as a structured array with fields kind, player,
+            points and time.
+        """
+        return self._records()[start:stop].copy()
+
+    def _tail(self) -> np.ndarray:
+        """Returns the records appended since the index was built."""
+        return self._records()[self._indexed_records:]
+
+    def _index_entry(self, player_id: int) -> Optional[np.void]:
+        """Looks up a player's index entry with a binary search."""
+        if self._index is None or len(self._index) == 0:
+            return None
+        position: int = int(np.searchsorted(self._index["player"], player_id))
+        if position < len(self._index) and self._index["player"][position] == player_id:
+            return self._index[position]
+        return None
+
+    def history(self, player_id: int) -> np.ndarray:
+        """
+        Returns every score update of a player, oldest first within each segment.
+
+        Args:
+            player_id: The player to look up.
+
+        Returns:
+            An int64 array of the points of the player's score updates.
+        """
+        records: np.ndarray = self._records()
+        parts: List[np.ndarray] = []
+        entry = self._index_entry(player_id)
+        if entry is not None:
+            indexed: np.ndarray = records[int(entry["start"]):int(entry["start"]) + int(entry["count"])]
+            parts.append(indexed["points"][indexed["kind"] == SCORE_RECORD])
+        tail: np.ndarray = records[self._indexed_records:]
+        parts.append(tail["points"][(tail["player"] == player_id) & (tail["kind"] == SCORE_RECORD)])
+        return np.concatenate(parts).astype(np.int64)
+
+    def total(self, player_id: int) -> int:
+        """
+        Returns the sum of a player's score updates.
+
+        Args:
+            player_id: The player to look up.
+
+        Returns:
+            The player's total points.
+        """
+        entry = self._index_entry(player_id)
+        tail: np.ndarray = self._tail()
+        mask: np.ndarray = (tail["player"] == player_id) & (tail["kind"] == SCORE_RECORD)
+        return (int(entry["total"]) if entry is not None else 0) + int(tail["points"][mask].sum())
+
+    def best_scores(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computes each player's best final score.
+
+        Returns:
+            Two arrays of equal length: player ids in ascending order and the best
+            final score of each player. Players without a finished game are omitted.
+        """
+        players: List[np.ndarray] = []
+        bests: List[np.ndarray] = []
+        if self._index is not None:
+            played: np.ndarray = self._index[self._index["games"] > 0]
+            players.append(played["player"].astype(np.int64))
+            bests.append(played["best"])
+        tail: np.ndarray = self._tail()
+        games: np.ndarray = tail[tail["kind"] == GAME_RECORD]
+        players.append(games["player"].astype(np.int64))
+        bests.append(games["points"])
+
+        all_players: np.ndarray = np.concatenate(players)
+        all_bests: np.ndarray = np.concatenate(bests)
+        if len(all_players) == 0:
+            return all_players, all_bests
+        order: np.ndarray = np.argsort(all_players, kind="stable")
+        unique_players, starts = np.unique(all_players[order], return_index=True)
+        return unique_players, np.maximum.reduceat(all_bests[order], starts)
+
+    def leaderboard(self, k: int = 10) -> List[Tuple[int, int]]:
+        """
+        Returns the players with the best final scores.
+
+        Args:
+            k: The number of players to return.
+
+        Returns:
+            Up to k (player_id, best_score) pairs, best first. Ties are ordered by
+            player id, but which players tied at the cut-off are included is unspecified.
+        """
+        players, bests = self.best_scores()
+        if len(players) > k:
+            top: np.ndarray = np.argpartition(-bests, k - 1)[:k] if k > 0 else np.empty(0, dtype=np.int64)
+            players, bests = players[top], bests[top]
+        order: np.ndarray = np.lexsort((players, -bests))
+        return [(int(players[i]), int(bests[i])) for i in order]
+
+    def compact(self, chunk_size: int = 1 << 20) -> None:
+        """
+        Rewrites the log grouped by player and rebuilds the index.
+
+        Records keep their original order within each player. The new log and
+        index replace the old ones atomically, and share a new generation so the
+        index is ignored if a crash leaves it paired with another log.
+
+        Args:
+            chunk_size: The number of records copied at a time.
+        """
+        records: np.ndarray = self._records()
+        order: np.ndarray = np.argsort(records["player"], kind="stable")
+        players: np.ndarray = records["player"][order]
+
+        generation: int = _new_generation()
+        temp_path: str = self.path + ".tmp"
+        with open(temp_path, "wb") as out:
+            out.write(_LOG_HEADER.pack(LOG_MAGIC, FORMAT_VERSION, _RECORD.size, generation))
+            for start in range(0, len(order), chunk_size):
+                records[order[start:start + chunk_size]].tofile(out)
+
+        index: np.ndarray = np.zeros(0, dtype=INDEX_DTYPE)
+        if len(order):
+            unique_players, starts, counts = np.unique(players, return_index=True, return_counts=True)
+            kinds: np.ndarray = records["kind"][order]
+            points: np.ndarray = records["points"][order]
+            is_game: np.ndarray = kinds == GAME_RECORD
+            index = np.zeros(len(unique_players), dtype=INDEX_DTYPE)
+            index["player"] = unique_players
+            index["start"] = starts
+            index["count"] = counts
+            index["total"] = np.add.reduceat(np.where(is_game, 0, points), starts)
+            index["best"] = np.maximum.reduceat(np.where(is_game, points, _NO_GAME), starts)
+            index["games"] = np.add.reduceat(is_game.astype(np.uint64), starts)
+
+        temp_index_path: str = self.index_path + ".tmp"
+        with open(temp_index_path, "wb") as out:
+            out.write(_INDEX_HEADER.pack(INDEX_MAGIC, FORMAT_VERSION, generation, len(order), len(index)))
+            index.tofile(out)
+
+        del records
+        self.close()
+        os.replace(temp_path, self.path)
+        os.replace(temp_index_path, self.index_path)
+        self._open_for_append()
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """Maps the index into memory, ignoring it if it does not match the log."""
+        self._index = None
+        if self._index_mmap is not None:
+            self._index_mmap.close()
+            self._index_mmap = None
+        self._indexed_records = 0
+        if not os.path.exists(self.index_path) or os.path.getsize(self.index_path) < _INDEX_HEADER.size:
+            return
+        with open(self.index_path, "rb") as index_file:
+            magic, version, generation, indexed_records, n_players = _INDEX_HEADER.unpack(index_file.read(_INDEX_HEADER.size))
+            if magic != INDEX_MAGIC:
+                raise ScoreLogError(f"{self.index_path} is not a score log index")
+            if version != FORMAT_VERSION or generation != self._generation or indexed_records > len(self):
+                return # Built for another log, e.g. one replaced by a compaction that did not finish
+            if n_players:
+                self._index_mmap = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if n_players:
+            self._index = np.frombuffer(self._index_mmap, dtype=INDEX_DTYPE, count=n_players, offset=_INDEX_HEADER.size)
+        else:
+            self._index = np.zeros(0, dtype=INDEX_DTYPE)
+        self._indexed_records = indexed_records
+
+    def _close_mmap(self) -> None:
+        """Unmaps the log."""
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass # Still viewed by an array; unmapped once that array is released
+            self._mmap = None
+            self._mapped_size = 0
+
+    def close(self) -> None:
+        """Flushes and closes the log and its index."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._close_mmap()
+        self._index = None
+        if self._index_mmap is not None:
+            try:
+                self._index_mmap.close()
+            except BufferError:
+                pass # Still viewed by an array; unmapped once that array is released
+            self._index_mmap = None
+
+    def __enter__(self) -> "ScoreLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
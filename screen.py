@@ -0,0 +1,444 @@
+"""
+Full-screen terminal front end for the interactive game.
+
+GameScreen is both the game's output sink and its input function. Instead of
+printing every message and re-printing the menus, it keeps a model of what is
+on screen (gun picker or hunt view, live points and score, the latest messages)
+and draws it into a ScreenBuffer. The buffer holds the cells last sent to the
+terminal and the cells of the next frame; presenting a frame compares only the
+row spans written since the last one and sends only the cells that differ, so
+the cost of a frame follows what changed rather than the size of the screen.
+
+Frames are capped at max_fps. While keys are already waiting, e.g. when a key
+is held down, the game keeps playing and the screen catches up at the next
+frame; once it is idle and waiting for the player it is always up to date.
+"""
+import curses
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from output import OutputSink
+
+if TYPE_CHECKING:
+    from shooting_game import Game
+
+# Unchanged cells shorter than this between two changes are resent rather than skipped with a cursor move
+_MERGE_GAP: int = 4
+
+
+class ScreenBuffer:
+    """
+    A front and back buffer of terminal cells with dirty-span tracking.
+
+    Attributes:
+        height (int): The number of rows.
+        width (int): The number of columns.
+    """
+    def __init__(self, height: int, width: int):
+        """
+        Initializes a blank ScreenBuffer instance, matching a cleared terminal.
+
+        Args:
+            height: The number of rows.
+            width: The number of columns.
+        """
+        self.height: int = max(0, height)
+        self.width: int = max(0, width)
+        self._front: List[List[str]] = [[" "] * self.width for _ in range(self.height)]
+        self._back: List[List[str]] = [[" "] * self.width for _ in range(self.height)]
+        self._dirty: Dict[int, List[int]] = {} # Row -> [start, stop) written since the last frame
+
+    def put(self, y: int, x: int, text: str) -> None:
+        """
+        Writes text into the next frame, clipped to the screen.
+
+        Args:
+            y: The row.
+            x: The column of the first character.
+            text: The characters to write; one cell per character.
+        """
+        if not 0 <= y < self.height or x >= self.width:
+            return
+        if x < 0:
+            text, x = text[-x:], 0
+        text = text[:self.width - x]
+        stop: int = x + len(text)
+        row: List[str] = self._back[y]
+        if "".join(row[x:stop]) == text:
+            return
+        row[x:stop] = text
+        span: Optional[List[int]] = self._dirty.get(y)
+        if span is None:
+            self._dirty[y] = [x, stop]
+        else:
+            span[0], span[1] = min(span[0], x), max(span[1], stop)
+
+    def put_line(self, y: int, text: str) -> None:
+        """Writes a whole row, padding it with blanks."""
+        self.put(y, 0, text.ljust(self.width))
+
+    def row(self, y: int) -> str:
+        """Returns the text of a row of the next frame."""
+        return "".join(self._back[y])
+
+    def changes(self) -> List[Tuple[int, int, str]]:
+        """
+        Finishes a frame: collects the cells that differ from the last one.
+
+        Returns:
+            (row, column, text) runs to send to the terminal, top to bottom.
+        """
+        runs: List[Tuple[int, int, str]] = []
+        for y in sorted(self._dirty):
+            start, stop = self._dirty[y]
+            front, back = self._front[y], self._back[y]
+            run_start: Optional[int] = None
+            run_stop: int = 0
+            for x in range(start, stop):
+                if front[x] == back[x]:
+                    continue
+                if run_start is not None and x - run_stop >= _MERGE_GAP:
+                    runs.append((y, run_start, "".join(back[run_start:run_stop])))
+                    run_start = None
+                if run_start is None:
+                    run_start = x
+                run_stop = x + 1
+            if run_start is not None:
+                runs.append((y, run_start, "".join(back[run_start:run_stop])))
+            front[start:stop] = back[start:stop]
+        self._dirty.clear()
+        return runs
+
+
+class FrameLimiter:
+    """
+    Caps how often frames are drawn.
+
+    Attributes:
+        interval (float): The shortest time between two frames in seconds.
+    """
+    def __init__(self, max_fps: float = 30.0, clock: Callable[[], float] = time.perf_counter):
+        """
+        Initializes a FrameLimiter instance.
+
+        Args:
+            max_fps: The most frames per second.
+            clock: Returns the current time in seconds.
+
+        Raises:
+            ValueError: If max_fps is not positive.
+        """
+        if max_fps <= 0:
+            raise ValueError("max_fps must be positive.")
+        self.interval: float = 1.0 / max_fps
+        self._clock: Callable[[], float] = clock
+        self._last: float = -float("inf")
+
+    def due(self) -> bool:
+        """Whether enough time has passed since the last frame to draw another."""
+        return self._clock() - self._last >= self.interval
+
+    def mark(self) -> None:
+        """Records that a frame was drawn now."""
+        self._last = self._clock()
+
+
+class Terminal:
+    """The screen and keyboard GameScreen draws to and reads from."""
+    def size(self) -> Tuple[int, int]:
+        """
+        Returns the screen's height and width.
+
+        This method should be implemented by subclasses.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement this method.
+        """
+        raise NotImplementedError("Subclass must implement this method")
+
+    def write(self, y: int, x: int, text: str) -> None:
+        """Writes text at a position, shown at the next refresh. Must be implemented by subclasses."""
+        raise NotImplementedError("Subclass must implement this method")
+
+    def refresh(self) -> None:
+        """Shows everything written since the last refresh."""
+
+    def clear(self) -> None:
+        """Blanks the screen, e.g. after it was resized."""
+
+    def key_ready(self) -> bool:
+        """Whether a key press is waiting to be read. Must be implemented by subclasses."""
+        raise NotImplementedError("Subclass must implement this method")
+
+    def read_key(self) -> str:
+        """Waits for and returns the next key press. Must be implemented by subclasses."""
+        raise NotImplementedError("Subclass must implement this method")
+
+
+class CursesTerminal(Terminal):
+    """
+    A Terminal backed by a curses window.
+
+    Attributes:
+        window (Any): The curses window, usually the one passed in by curses.wrapper.
+    """
+    def __init__(self, window: Any):
+        """
+        Initializes a CursesTerminal instance.
+
+        Args:
+            window: The curses window.
+        """
+        self.window: Any = window
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass # The terminal cannot hide its cursor
+        window.leaveok(True) # Leave the cursor where the last write put it instead of moving it back
+
+    def size(self) -> Tuple[int, int]:
+        """Returns the window's height and width."""
+        return self.window.getmaxyx()
+
+    def write(self, y: int, x: int, text: str) -> None:
+        """Writes text into the window."""
+        try:
+            self.window.addstr(y, x, text)
+        except curses.error:
+            pass # Writing the bottom-right cell moves the cursor off the window
+
+    def refresh(self) -> None:
+        """Sends the written cells to the terminal."""
+        self.window.noutrefresh()
+        curses.doupdate()
+
+    def clear(self) -> None:
+        """Blanks the window."""
+        self.window.clear()
+
+    def key_ready(self) -> bool:
+        """Peeks for a waiting key press without blocking."""
+        self.window.nodelay(True)
+        try:
+            key: int = self.window.getch()
+        finally:
+            self.window.nodelay(False)
+        if key == -1:
+            return False
+        curses.ungetch(key)
+        return True
+
+    def read_key(self) -> str:
+        """Waits for the next key press."""
+        return self.window.getkey()
+
+
+class GameScreen(OutputSink):
+    """
+    Draws a running Game full-screen and reads its commands key by key.
+
+    Attributes:
+        terminal (Terminal): Where the screen is drawn and keys are read.
+        game (Optional[Game]): The game shown, once attached.
+        buffer (ScreenBuffer): The cells on screen and of the next frame.
+        limiter (FrameLimiter): Caps the frame rate.
+        messages (Deque[str]): The latest messages, oldest first.
+        shots (int): The number of shots fired.
+        hits (int): The number of shots that hit.
+        frames (int): The number of frames drawn.
+        cells_sent (int): The number of cells sent to the terminal over all frames.
+    """
+    def __init__(
+        self, terminal: Terminal, max_fps: float = 30.0, log_size: int = 100,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Initializes a GameScreen instance.
+
+        Args:
+            terminal: Where the screen is drawn and keys are read.
+            max_fps: The most frames per second.
+            log_size: The number of messages kept for the message log.
+            clock: Returns the current time in seconds.
+        """
+        self.terminal: Terminal = terminal
+        self.game: Optional["Game"] = None
+        self.buffer: ScreenBuffer = ScreenBuffer(*terminal.size())
+        self.limiter: FrameLimiter = FrameLimiter(max_fps, clock)
+        self.messages: Deque[str] = deque(maxlen=log_size)
+        self.guns: List[str] = []
+        self.shots: int = 0
+        self.hits: int = 0
+        self.frames: int = 0
+        self.cells_sent: int = 0
+        self._prompt: str = ""
+        self._typed: str = ""
+        self._regions: Set[str] = {"header", "panel", "log"} # Parts of the screen to redraw
+
+    def attach(self, game: "Game") -> None:
+        """
+        Shows a game and feeds it the keys pressed.
+
+        The game must have been created with this screen as its sink.
+
+        Args:
+            game: The game to show.
+        """
+        self.game = game
+        game.input_func = self.read_input
+
+    def emit(self, event: str, template: str, **fields: Any) -> None:
+        """Updates the screen's model; the options menu is always on screen and is not repeated."""
+        if event == "options":
+            return
+        if event == "gun_menu":
+            self.guns = []
+        elif event == "gun_option":
+            self.guns.append(fields["gun"])
+        else:
+            self.messages.append(template.format(**fields).strip())
+            self._regions.add("log")
+        if event in ("shot_hit", "shot_miss"):
+            self.shots += 1
+            self.hits += event == "shot_hit"
+        elif event == "volley":
+            self.shots += fields["shots"]
+            self.hits += fields["hits"]
+        self._regions.update(("header", "panel"))
+
+    def flush(self) -> None:
+        """Draws a frame if one is due; the game flushes before every prompt."""
+        if self.limiter.due():
+            self.render()
+
+    def read_input(self, prompt: str) -> str:
+        """
+        Reads the game's next command from the keyboard.
+
+        A frame is drawn first if one is due or no key is waiting yet, so held
+        keys are not slowed down by drawing every action.
+
+        Args:
+            prompt: The game's prompt, shown in the panel.
+
+        Returns:
+            The key pressed, or the digits typed before Enter when there are more
+            than nine guns to choose from.
+        """
+        if prompt != self._prompt:
+            self._prompt = prompt
+            self._regions.add("panel")
+        while True:
+            if self.limiter.due() or not self.terminal.key_ready():
+                self.render()
+            key: str = self.terminal.read_key()
+            if key == "KEY_RESIZE":
+                self.render()
+                continue
+            if not self._typing():
+                return key
+            if key in ("\n", "\r", "KEY_ENTER"):
+                typed, self._typed = self._typed, ""
+                return typed
+            self._typed = self._typed[:-1] if key in ("\b", "\x7f", "KEY_BACKSPACE") else self._typed + key
+            self._regions.add("panel")
+
+    def _typing(self) -> bool:
+        """Whether a gun number may need more than one key."""
+        return self.game is not None and self.game.player.selected_gun is None and len(self.guns) > 9
+
+    def render(self) -> int:
+        """
+        Draws the parts of the screen that changed and sends the changed cells.
+
+        Returns:
+            The number of cells sent to the terminal.
+        """
+        height, width = self.terminal.size()
+        if (height, width) != (self.buffer.height, self.buffer.width):
+            self.buffer = ScreenBuffer(height, width)
+            self.terminal.clear()
+            self._regions = {"header", "panel", "log"}
+        if "header" in self._regions:
+            self._draw_header()
+        if "panel" in self._regions:
+            self._draw_panel()
+        if "log" in self._regions:
+            self._draw_log()
+        self._regions.clear()
+        sent: int = 0
+        for y, x, text in self.buffer.changes():
+            self.terminal.write(y, x, text)
+            sent += len(text)
+        if sent:
+            self.terminal.refresh()
+        self.frames += 1
+        self.cells_sent += sent
+        self.limiter.mark()
+        return sent
+
+    def _panel_rows(self) -> int:
+        """The number of rows below the header used by the gun picker or hunt view."""
+        return len(self.guns) + 3
+
+    def _draw_header(self) -> None:
+        """Draws the title, selected gun and live score."""
+        points: int = self.game.player.points if self.game is not None else 0
+        total: int = self.game.scoreboard.total_score if self.game is not None else 0
+        gun = self.game.player.selected_gun if self.game is not None else None
+        score: str = f"Points: {points}  Scoreboard: {total} "
+        title: str = " Shooting Game" + (f" - {gun.name}" if gun is not None else "")
+        self.buffer.put_line(0, title.ljust(self.buffer.width - len(score)) + score)
+        self.buffer.put_line(1, "-" * self.buffer.width)
+
+    def _draw_panel(self) -> None:
+        """Draws the gun picker while no gun is chosen, then the hunt view."""
+        game = self.game
+        lines: List[str]
+        if game is not None and not game.is_game_running and game.player.selected_gun is not None:
+            lines = [" Game over. Press any key to leave."]
+        elif game is None or game.player.selected_gun is None:
+            lines = [" Choose your gun:"]
+            lines += [f"   {index}. {name}" for index, name in enumerate(self.guns, start=1)]
+            lines.append(f" {self._prompt}{self._typed}")
+        else:
+            rate: str = f"{self.hits / self.shots:.0%}" if self.shots else "-"
+            lines = [f" Shots: {self.shots}  Hits: {self.hits}  Hit rate: {rate}", "", " [1] Shoot an animal   [2] End game"]
+        for offset in range(self._panel_rows()):
+            self.buffer.put_line(2 + offset, lines[offset] if offset < len(lines) else "")
+
+    def _draw_log(self) -> None:
+        """Draws the latest messages, newest at the bottom."""
+        top: int = 2 + self._panel_rows()
+        self.buffer.put_line(top, "-" * self.buffer.width)
+        rows: int = max(0, self.buffer.height - top - 1)
+        shown: List[str] = list(self.messages)[-rows:] if rows else []
+        shown = [""] * (rows - len(shown)) + shown
+        for offset, message in enumerate(shown, start=top + 1):
+            self.buffer.put_line(offset, " " + message)
+
+
+def play_screen(max_fps: float = 30.0, **game_options: Any) -> "Game":
+    """
+    Plays one interactive game full-screen in the current terminal.
+
+    Args:
+        max_fps: The most frames per second.
+        **game_options: Game arguments other than sink and input_func, such as
+            score_log, player_id or catalog.
+
+    Returns:
+        The finished game.
+    """
+    from shooting_game import Game
+
+    def play(window: Any) -> "Game":
+        screen = GameScreen(CursesTerminal(window), max_fps=max_fps)
+        game = Game(sink=screen, **game_options)
+        screen.attach(game)
+        game.start_game()
+        screen.read_input("")
+        return game
+
+    return curses.wrapper(play)
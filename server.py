@@ -0,0 +1,236 @@
+"""
+Asyncio server hosting many concurrent Game sessions.
+
+Each connection plays its own Game over a line-based protocol. Clients send one
+command per line and receive the game's messages as lines of text:
+
+    <n> or gun <n>   choose gun number n (while choosing a gun)
+    1 or shoot       shoot an animal
+    2 or end         end the game, after which the server closes the connection
+
+Sessions are driven through Game.begin/handle_input, so no thread or coroutine
+waits on a connection between commands: an idle session is a Game object and a
+protocol instance. Output is written once per batch of received lines.
+"""
+import asyncio
+from typing import Any, List, Optional, Set
+
+from output import OutputSink
+from rng import RandomService
+from shooting_game import Game
+
+MAX_LINE_LENGTH: int = 1024
+
+# Word commands accepted in addition to the menu numbers
+COMMAND_ALIASES = {"shoot": "1", "end": "2", "quit": "2"}
+
+
+def normalize_command(line: str) -> str:
+    """
+    Translates a protocol line into the menu number Game expects.
+
+    Args:
+        line: A line received from the client, without its line ending.
+
+    Returns:
+        The menu number for word commands, otherwise the stripped line.
+    """
+    command: str = line.strip().lower()
+    if command.startswith("gun "):
+        return command[4:].strip()
+    return COMMAND_ALIASES.get(command, command)
+
+
+class _TransportSink(OutputSink):
+    """
+    Buffers formatted lines and writes them to a transport on flush.
+
+    Attributes:
+        transport (asyncio.WriteTransport): The connection the lines are written to.
+    """
+    def __init__(self, transport: asyncio.WriteTransport):
+        """
+        Initializes a _TransportSink instance with an empty buffer.
+
+        Args:
+            transport: The connection the lines are written to.
+        """
+        self.transport: asyncio.WriteTransport = transport
+        self._lines: List[str] = []
+
+    def emit(self, event: str, template: str, **fields: Any) -> None:
+        """Buffers the formatted message until the next flush."""
+        self._lines.append(template.format(**fields))
+
+    def flush(self) -> None:
+        """
+        Writes all buffered lines to the transport in a single write.
+
+        The lines are dropped without writing if the connection is already
+        closing, so a session that ended keeps no output around.
+        """
+        if self._lines and not self.transport.is_closing():
+            self.transport.write(("\n".join(self._lines) + "\n").encode())
+        self._lines.clear()
+
+
+class _SessionProtocol(asyncio.Protocol):
+    """
+    Plays one Game per connection.
+
+    Attributes:
+        server (GameServer): The server that accepted the connection.
+        transport (Optional[asyncio.WriteTransport]): The connection, once made.
+        sink (Optional[_TransportSink]): The sink the game writes to, once connected.
+        game (Optional[Game]): The session's game, once connected.
+    """
+    def __init__(self, server: "GameServer"):
+        """
+        Initializes a _SessionProtocol instance before its connection is made.
+
+        Args:
+            server: The server that accepted the connection.
+        """
+        self.server: "GameServer" = server
+        self.transport: Optional[asyncio.WriteTransport] = None
+        self.sink: Optional[_TransportSink] = None
+        self.game: Optional[Game] = None
+        self._buffer: bytes = b""
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """
+        Starts a game on the new connection and sends its opening messages.
+
+        Args:
+            transport: The connection to the client.
+        """
+        self.transport = transport
+        self.sink = _TransportSink(transport)
+        self.game = Game(sink=self.sink, rng=self.server.next_rng())
+        self.server.sessions.add(self)
+        self.game.begin()
+        self.sink.flush()
+
+    def data_received(self, data: bytes) -> None:
+        """
+        Plays every complete command line received, then writes their output at once.
+
+        Data is appended to a buffer and split on newlines; the piece after the
+        last newline stays buffered, so a command that arrives in several
+        pieces is handled once its line ending arrives. The connection is
+        closed if an unfinished line grows beyond MAX_LINE_LENGTH bytes, and
+        once the game has ended, in which case the remaining lines are ignored.
+
+        Args:
+            data: The bytes received, which may hold any number of partial or complete lines.
+        """
+        self._buffer += data
+        *lines, self._buffer = self._buffer.split(b"\n")
+        if len(self._buffer) > MAX_LINE_LENGTH:
+            self.transport.close()
+            return
+        for line in lines:
+            self.game.handle_input(normalize_command(line.decode(errors="replace")))
+            if not self.game.is_game_running:
+                break
+        self.sink.flush()
+        if not self.game.is_game_running:
+            self.transport.close()
+
+    def eof_received(self) -> Optional[bool]:
+        """
+        Handles the client closing its side of the connection.
+
+        Returns:
+            False, so the transport closes the connection.
+        """
+        return False # Close the connection when the client stops sending
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        """
+        Forgets the session once its connection is closed.
+
+        Args:
+            exc: The error that closed the connection, or None if it closed normally.
+        """
+        self.server.sessions.discard(self)
+
+
+class GameServer:
+    """
+    Hosts Game sessions over TCP or a Unix socket.
+
+    Attributes:
+        sessions (Set[_SessionProtocol]): The protocols of the currently connected sessions.
+    """
+    def __init__(self, seed: Optional[int] = None, rng_block_size: int = 64):
+        """
+        Initializes a GameServer instance.
+
+        Args:
+            seed: The seed every session's RNG substream is derived from. None
+                seeds from the operating system.
+            rng_block_size: The number of random values buffered per session. Kept
+                small so idle sessions use little memory.
+        """
+        self.sessions: Set[_SessionProtocol] = set()
+        self._rng: RandomService = RandomService(seed, block_size=rng_block_size)
+        self._next_session: int = 0
+
+    def next_rng(self) -> RandomService:
+        """Returns the RNG substream of the next session."""
+        rng: RandomService = self._rng.substream(self._next_session)
+        self._next_session += 1
+        return rng
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        """
+        Starts accepting TCP connections.
+
+        Args:
+            host: The address to listen on.
+            port: The port to listen on, or 0 to pick a free one.
+
+        Returns:
+            The listening asyncio server.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.create_server(lambda: _SessionProtocol(self), host, port)
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """
+        Starts accepting connections on a Unix socket.
+
+        Args:
+            path: The path of the socket.
+
+        Returns:
+            The listening asyncio server.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.create_unix_server(lambda: _SessionProtocol(self), path)
+
+
+def serve(host: str = "127.0.0.1", port: int = 8765, unix_path: Optional[str] = None, seed: Optional[int] = None) -> None:
+    """
+    Runs a GameServer until interrupted.
+
+    Args:
+        host: The address to listen on for TCP.
+        port: The TCP port to listen on.
+        unix_path: If given, listen on this Unix socket instead of TCP.
+        seed: The seed every session's RNG is derived from.
+    """
+    async def run() -> None:
+        game_server = GameServer(seed=seed)
+        if unix_path is not None:
+            listener = await game_server.start_unix(unix_path)
+        else:
+            listener = await game_server.start_tcp(host, port)
+        async with listener:
+            await listener.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,346 @@
+"""
+A ScoreBoard backend shared between processes through shared memory.
+
+SharedScores is one multiprocessing.shared_memory block with a fixed layout:
+a header followed by one slot per worker. Every worker process publishes its
+SharedScoreBoard into its own slot, so writers never contend and the hot path
+takes no locks. Any process that attaches to the block by name, e.g. a monitor,
+reads every slot directly without asking the workers for anything.
+
+Layout (little-endian):
+
+    header  magic "SGSB", version, number of slots, history capacity
+    slot    sequence number, pid, active flag, total score, count, sum,
+            minimum, maximum, mean, m2 of the scores, number of scores
+            appended, then a ring buffer of the most recent scores
+
+Each slot is a seqlock: its writer makes the sequence number odd, writes the
+slot and makes it even again. A reader copies the slot and retries if the
+number was odd or changed meanwhile, so it never sees a half-written slot.
+This relies on stores reaching memory in program order, which holds on x86;
+on weakly ordered CPUs a torn read is possible but very unlikely.
+"""
+import os
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, NamedTuple, Optional, Sequence, TextIO, TYPE_CHECKING
+
+from output import OutputSink
+from score_history import RunningStats
+from shooting_game import ScoreBoard
+
+if TYPE_CHECKING:
+    from score_log import ScoreLog
+
+MAGIC: bytes = b"SGSB"
+FORMAT_VERSION: int = 1
+
+# magic, version, slots, history capacity
+_HEADER = struct.Struct("<4sHxxII")
+_SEQUENCE = struct.Struct("<Q")
+# pid, active, total score, count, sum, minimum, maximum, mean, m2, scores appended
+_FIELDS = struct.Struct("<IIqqqqqddQ")
+_SCORE = struct.Struct("<q")
+_SLOT_HEADER_SIZE: int = _SEQUENCE.size + _FIELDS.size
+
+# Reads retried this often without sleeping before yielding to the writer
+_SPIN: int = 100
+
+
+class SlotState(NamedTuple):
+    """A consistent copy of one worker's slot."""
+    slot: int
+    pid: int
+    active: bool
+    total_score: int
+    stats: RunningStats
+    history: List[int]
+    appended: int
+
+
+class ScoreboardView(NamedTuple):
+    """A view of every slot in use, read in one pass."""
+    slots: List[SlotState]
+
+    @property
+    def total_score(self) -> int:
+        """The sum of every worker's total score."""
+        return sum(state.total_score for state in self.slots)
+
+    @property
+    def stats(self) -> RunningStats:
+        """The statistics of every score recorded by any worker."""
+        merged = RunningStats()
+        for state in self.slots:
+            merged.merge(state.stats)
+        return merged
+
+    @property
+    def active(self) -> int:
+        """The number of workers still publishing."""
+        return sum(state.active for state in self.slots)
+
+    def summary(self) -> str:
+        """Formats the view as one console line."""
+        stats: RunningStats = self.stats
+        return (
+            f"Workers: {self.active}/{len(self.slots)}  Total: {self.total_score}  "
+            f"Scores: {stats.count}  Mean: {stats.mean:.2f}  Max: {stats.maximum}"
+        )
+
+
+class SharedScores:
+    """
+    A shared memory block holding one scoreboard slot per worker.
+
+    Attributes:
+        name (str): The block's name, used to attach to it from other processes.
+        slots (int): The number of worker slots.
+        history (int): The number of recent scores each slot keeps.
+    """
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        """
+        Wraps an existing block; use create() or attach() instead.
+
+        Raises:
+            ValueError: If the block is not a scoreboard of this version.
+        """
+        self._memory: shared_memory.SharedMemory = memory
+        self._owner: bool = owner
+        magic, version, slots, history = _HEADER.unpack_from(memory.buf)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            memory.close()
+            raise ValueError(f"{memory.name} is not a shared scoreboard of version {FORMAT_VERSION}")
+        self.name: str = memory.name
+        self.slots: int = slots
+        self.history: int = history
+        self._slot_size: int = _SLOT_HEADER_SIZE + _SCORE.size * history
+
+    @classmethod
+    def create(cls, slots: int, history: int = 256, name: Optional[str] = None) -> "SharedScores":
+        """
+        Creates a new block with empty slots.
+
+        Args:
+            slots: The number of worker slots.
+            history: The number of recent scores each slot keeps.
+            name: The block's name. Defaults to a random one.
+
+        Raises:
+            ValueError: If slots or history is not positive.
+
+        Returns:
+            The new block; unlink() it once every process is done.
+        """
+        if slots < 1 or history < 1:
+            raise ValueError("slots and history must be positive.")
+        size: int = _HEADER.size + slots * (_SLOT_HEADER_SIZE + _SCORE.size * history)
+        memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        memory.buf[:size] = bytes(size)
+        _HEADER.pack_into(memory.buf, 0, MAGIC, FORMAT_VERSION, slots, history)
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedScores":
+        """
+        Attaches to a block created by another process.
+
+        Args:
+            name: The block's name.
+
+        Returns:
+            The block; closing it leaves it in place for the other processes.
+        """
+        try:
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Before Python 3.13 attaching registers the block with the resource tracker,
+            # which unlinks it when its process exits. Children of the creator share the
+            # creator's tracker, where the registration is harmless; elsewhere, or if the
+            # tracker's private state cannot be inspected, undo it so only the creator unlinks.
+            tracker = getattr(resource_tracker, "_resource_tracker", None)
+            shared_tracker: bool = getattr(tracker, "_fd", None) is not None
+            memory = shared_memory.SharedMemory(name=name)
+            if not shared_tracker:
+                resource_tracker.unregister(memory._name, "shared_memory")
+        return cls(memory, owner=False)
+
+    def _offset(self, slot: int) -> int:
+        """The byte offset of a slot."""
+        if not 0 <= slot < self.slots:
+            raise IndexError("slot out of range")
+        return _HEADER.size + slot * self._slot_size
+
+    def read_slot(self, slot: int) -> SlotState:
+        """
+        Reads a consistent copy of one slot, retrying while its writer is busy.
+
+        Args:
+            slot: The slot's index.
+
+        Returns:
+            The slot's state.
+        """
+        buf = self._memory.buf
+        offset: int = self._offset(slot)
+        attempts: int = 0
+        while True:
+            (before,) = _SEQUENCE.unpack_from(buf, offset)
+            if not before & 1:
+                data: bytes = bytes(buf[offset:offset + self._slot_size])
+                (after,) = _SEQUENCE.unpack_from(buf, offset)
+                if after == before:
+                    return self._decode(slot, data)
+            attempts += 1
+            if attempts % _SPIN == 0:
+                time.sleep(0) # Let a preempted writer finish
+
+    def _decode(self, slot: int, data: bytes) -> SlotState:
+        """Decodes a slot copied by read_slot."""
+        pid, active, total_score, count, total, minimum, maximum, mean, m2, appended = _FIELDS.unpack_from(data, _SEQUENCE.size)
+        stats = RunningStats()
+        stats.count, stats.total, stats.mean, stats._m2 = count, total, mean, m2
+        stats.minimum, stats.maximum = (minimum, maximum) if count else (None, None)
+        ring: List[int] = [value for (value,) in _SCORE.iter_unpack(data[_SLOT_HEADER_SIZE:])]
+        history: List[int] = ring[:appended]
+        if appended > self.history:
+            start: int = appended % self.history
+            history = ring[start:] + ring[:start]
+        return SlotState(slot, pid, bool(active), total_score, stats, history, appended)
+
+    def view(self) -> ScoreboardView:
+        """
+        Reads every slot that has been used.
+
+        Returns:
+            The slots, each consistent on its own.
+        """
+        states: List[SlotState] = [self.read_slot(slot) for slot in range(self.slots)]
+        return ScoreboardView([state for state in states if state.pid or state.appended])
+
+    def close(self) -> None:
+        """Detaches from the block in this process."""
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Destroys the block; only the creator should call this."""
+        self._memory.unlink()
+
+    def __enter__(self) -> "SharedScores":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+
+class SharedScoreBoard(ScoreBoard):
+    """
+    A ScoreBoard that also publishes its state to a slot of a SharedScores block.
+
+    Only one SharedScoreBoard may write to a slot; give each worker its own.
+
+    Attributes:
+        shared (SharedScores): The block published to.
+        slot (int): The slot written.
+    """
+    def __init__(
+        self,
+        shared: SharedScores,
+        slot: int,
+        sink: Optional[OutputSink] = None,
+        max_history: Optional[int] = None,
+        log: Optional["ScoreLog"] = None,
+        player_id: int = 0,
+    ):
+        """
+        Initializes a SharedScoreBoard instance and claims its slot, clearing it.
+
+        Args:
+            shared: The block to publish to.
+            slot: The index of this worker's slot.
+            sink: Where messages are written. Defaults to the console.
+            max_history: If given, only the most recent max_history scores are kept locally.
+            log: A persistent log every score and finished game is appended to.
+            player_id: The id under which scores are logged.
+        """
+        super().__init__(sink=sink, max_history=max_history, log=log, player_id=player_id)
+        self.shared: SharedScores = shared
+        self.slot: int = slot
+        self._buf = shared._memory.buf
+        self._offset: int = shared._offset(slot)
+        self._history_offset: int = self._offset + _SLOT_HEADER_SIZE
+        (self._sequence,) = _SEQUENCE.unpack_from(self._buf, self._offset)
+        self._sequence += self._sequence & 1 # A writer that died mid-update leaves it odd
+        self._appended: int = 0
+        self._active: bool = True
+        self._publish(())
+
+    def _publish(self, points: Sequence[int]) -> None:
+        """Writes new scores and the current totals to the slot under the seqlock."""
+        buf, offset, capacity = self._buf, self._offset, self.shared.history
+        _SEQUENCE.pack_into(buf, offset, self._sequence + 1)
+        self._appended += max(0, len(points) - capacity) # Scores pushed out of the ring by this batch are skipped
+        for value in points[-capacity:]:
+            _SCORE.pack_into(buf, self._history_offset + _SCORE.size * (self._appended % capacity), value)
+            self._appended += 1
+        stats: RunningStats = self.stats
+        _FIELDS.pack_into(
+            buf, offset + _SEQUENCE.size, os.getpid(), self._active, self.total_score,
+            stats.count, stats.total, stats.minimum or 0, stats.maximum or 0, stats.mean, stats._m2, self._appended,
+        )
+        self._sequence += 2
+        _SEQUENCE.pack_into(buf, offset, self._sequence)
+
+    def update_score(self, points: int) -> None:
+        """Updates the scoreboard like ScoreBoard.update_score and publishes it."""
+        super().update_score(points)
+        self._publish((points,))
+
+    def update_scores(self, points: Sequence[int]) -> None:
+        """Updates the scoreboard like ScoreBoard.update_scores and publishes it with one slot update."""
+        super().update_scores(points)
+        if points:
+            self._publish(points)
+
+    def release(self) -> None:
+        """Marks the slot as no longer published to; its scores stay visible."""
+        self._active = False
+        self._publish(())
+
+
+def watch(
+    name: str,
+    interval: float = 1.0,
+    iterations: Optional[int] = None,
+    stream: Optional[TextIO] = None,
+) -> ScoreboardView:
+    """
+    Prints a line with the global view of a shared scoreboard at a fixed interval.
+
+    Args:
+        name: The block's name.
+        interval: Seconds between two lines.
+        iterations: If given, stops after this many lines.
+        stream: Where the lines are written. Defaults to sys.stdout.
+
+    Returns:
+        The last view read.
+    """
+    stream = stream if stream is not None else sys.stdout
+    shared = SharedScores.attach(name)
+    try:
+        printed: int = 0
+        while True:
+            view: ScoreboardView = shared.view()
+            stream.write(view.summary() + "\n")
+            stream.flush()
+            printed += 1
+            if iterations is not None and printed >= iterations:
+                return view
+            time.sleep(interval)
+    finally:
+        shared.close()
@@ -1,5 +1,18 @@
+import argparse
+import contextlib
+import itertools
 import random
-from typing import List, Optional
+import sys
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence
+
+from events import HIT, MISS, SCORE, VOLLEY, EventBatch, EventBus
+from output import CONSOLE, OutputSink
+from score_history import RunningStats, ScoreHistory
+
+if TYPE_CHECKING:
+    from catalog import Catalog
+    from score_log import ScoreLog
+    from spawn_table import SpawnTable
 
 # Animal Class
 class Animal:
@@ -8,19 +21,28 @@ class Animal:
 
     Attributes:
         points_value (int): The number of points awarded for shooting this animal.
+        sink (OutputSink): Where the animal's messages are written.
+        name (str): The name shown in messages.
+        visible_for (float): Seconds the animal stays in sight after appearing in a timed game.
     """
-    def __init__(self, points_value: int):
+    visible_for: float = 5.0
+
+    def __init__(self, points_value: int, sink: Optional[OutputSink] = None, name: Optional[str] = None):
         """
         Initializes an Animal instance.
 
         Args:
             points_value: The points value for the animal.
+            sink: Where messages are written. Defaults to the console.
+            name: The name shown in messages. Defaults to the class name.
         """
         self.points_value: int = points_value
+        self.sink: OutputSink = sink if sink is not None else CONSOLE
+        self.name: str = name if name is not None else self.__class__.__name__
 
     def appear(self) -> None:
         """Prints a message indicating the animal has appeared."""
-        print(f"A {self.__class__.__name__} appears!")
+        self.sink.emit("animal_appear", "A {animal} appears!", animal=self.name)
 
     def get_shot(self) -> int:
         """
@@ -29,37 +51,66 @@ class Animal:
         Returns:
             The points value of the animal.
         """
-        print(f"The {self.__class__.__name__} is hit!")
+        self.sink.emit("animal_hit", "The {animal} is hit!", animal=self.name)
         return self.points_value
 
 class Deer(Animal):
     """Represents a Deer, a type of Animal."""
-    def __init__(self):
+    visible_for: float = 3.0 # Deer bolt quickly
+
+    def __init__(self, sink: Optional[OutputSink] = None):
         """Initializes a Deer instance with a predefined points value."""
-        super().__init__(points_value=10)
+        super().__init__(points_value=10, sink=sink)
 
     def appear(self) -> None:
         """Prints a message specific to a Deer appearing."""
         # Specific appearance behavior for Deer
         super().appear()
-        print("The deer looks around cautiously.")
+        self.sink.emit("animal_behavior", "The deer looks around cautiously.", animal="Deer")
 
 class Bear(Animal):
     """Represents a Bear, a type of Animal."""
-    def __init__(self):
+    visible_for: float = 6.0
+
+    def __init__(self, sink: Optional[OutputSink] = None):
         """Initializes a Bear instance with a predefined points value."""
-        super().__init__(points_value=20)
+        super().__init__(points_value=20, sink=sink)
 
     def appear(self) -> None:
         """Prints a message specific to a Bear appearing."""
         # Specific appearance behavior for Bear
         super().appear()
-        print("The bear growls menacingly.")
+        self.sink.emit("animal_behavior", "The bear growls menacingly.", animal="Bear")
 
 
 # Gun class
 class Gun:
-    """Represents a gun in the game."""
+    """
+    Represents a gun in the game.
+
+    Attributes:
+        accuracy (float): The probability, between 0 and 1, that a shot hits.
+        rng (random.Random): The random number generator used to resolve shots.
+        name (str): The name shown in messages.
+        magazine_size (Optional[int]): Shots before a reload in a timed game, or None for no limit.
+        reload_time (float): Seconds a reload takes in a timed game.
+    """
+    accuracy: float = 0.0
+    magazine_size: Optional[int] = None
+    reload_time: float = 0.0
+
+    def __init__(self, rng: Optional[random.Random] = None, name: Optional[str] = None):
+        """
+        Initializes a Gun instance.
+
+        Args:
+            rng: The random number generator used to resolve shots. Defaults to the
+                global generator of the random module.
+            name: The name shown in messages. Defaults to the class name.
+        """
+        self.rng = rng if rng is not None else random
+        self.name: str = name if name is not None else self.__class__.__name__
+
     def fire(self) -> bool:
         """
         Fires the gun.
@@ -75,8 +126,34 @@ class Gun:
         """
         raise NotImplementedError("Subclass must implement this method")
 
+    def fire_many(self, n: int) -> Sequence[bool]:
+        """
+        Fires the gun n times in one volley.
+
+        With an rng offering random_many (e.g. rng.RandomService) the volley is one
+        vectorized draw compared against accuracy; otherwise each shot is drawn from
+        rng.random() as fire() does. Subclasses whose fire() does more than compare a
+        draw with accuracy should override this method too.
+
+        Args:
+            n: The number of shots.
+
+        Returns:
+            Whether each shot hits: a NumPy bool array when drawn in one go, otherwise a list.
+        """
+        random_many = getattr(self.rng, "random_many", None)
+        if random_many is not None:
+            return random_many(n) < self.accuracy
+        draw = self.rng.random
+        accuracy: float = self.accuracy
+        return [draw() < accuracy for _ in range(n)]
+
 class Rifle(Gun):
     """Represents a Rifle, a type of Gun with high accuracy."""
+    accuracy: float = 0.8  # 80% chance to hit
+    magazine_size: Optional[int] = 5
+    reload_time: float = 2.0
+
     def fire(self) -> bool:
         """
         Fires the rifle with an 80% chance of hitting.
@@ -85,10 +162,14 @@ class Rifle(Gun):
             True if the shot hits, False otherwise.
         """
         # Assume a higher accuracy for the rifle
-        return random.random() < 0.8  # 80% chance to hit
+        return self.rng.random() < self.accuracy
 
 class Shotgun(Gun):
     """Represents a Shotgun, a type of Gun with lower accuracy."""
+    accuracy: float = 0.5  # 50% chance to hit
+    magazine_size: Optional[int] = 2
+    reload_time: float = 1.5
+
     def fire(self) -> bool:
         """
         Fires the shotgun with a 50% chance of hitting.
@@ -97,7 +178,7 @@ class Shotgun(Gun):
             True if the shot hits, False otherwise.
         """
         # Assume a lower accuracy for the shotgun but higher damage
-        return random.random() < 0.5  # 50% chance to hit
+        return self.rng.random() < self.accuracy
 
 
 
@@ -108,22 +189,65 @@ class Game:
     Attributes:
         player (Player): The player participating in the game.
         scoreboard (ScoreBoard): The scoreboard tracking the player's score.
+        bus (EventBus): Carries the player's hits, misses and scores to the scoreboard and other subscribers.
         animals (List[Animal]): A list of available animals in the game.
         guns (List[Gun]): A list of available guns in the game.
         is_game_running (bool): A flag indicating if the game is currently active.
+        sink (OutputSink): Where the game's messages are written.
+        rng (random.Random): The random number generator shared by the guns and animal spawns.
+        input_func (Optional[Callable[[str], str]]): Reads the player's commands, or None to use input().
+        spawn_table (Optional[SpawnTable]): Weighted spawns, or None to pick animals uniformly.
     """
-    def __init__(self):
-        """Initializes a Game instance, setting up the player, scoreboard, animals, and guns."""
-        self.player: Player = Player()
-        self.scoreboard: ScoreBoard = ScoreBoard() # Scoreboard is initialized but not used actively in the current game logic
-        self.animals: List[Animal] = [Deer(), Bear()]  # Example list of animals
-        self.guns: List[Gun] = [Rifle(), Shotgun()]  # Example list of guns
+    def __init__(
+        self,
+        sink: Optional[OutputSink] = None,
+        rng: Optional[random.Random] = None,
+        input_func: Optional[Callable[[str], str]] = None,
+        score_log: Optional["ScoreLog"] = None,
+        player_id: int = 0,
+        spawn_table: Optional["SpawnTable"] = None,
+        catalog: Optional["Catalog"] = None,
+    ):
+        """
+        Initializes a Game instance, setting up the player, scoreboard, animals, and guns.
+
+        Args:
+            sink: Where messages are written, shared with the player, scoreboard and
+                animals. Defaults to the console.
+            rng: The random number generator for shots and spawns, e.g. a seeded
+                rng.RandomService. Defaults to the global generator of the random module.
+            input_func: Called with a prompt to read each command in place of input(),
+                e.g. a scripted or bot strategy.
+            score_log: A persistent log the scoreboard appends scores and finished games to.
+            player_id: The id of the player in the score log.
+            spawn_table: Draws animals with per-species weights. Its animals replace
+                the default ones.
+            catalog: The guns and animals to play with, in place of the default ones.
+                Animals with spawn weights are drawn through a spawn table.
+        """
+        self.sink: OutputSink = sink if sink is not None else CONSOLE
+        self.rng = rng if rng is not None else random
+        self.input_func: Optional[Callable[[str], str]] = input_func
+        self.bus: EventBus = EventBus()
+        self.player: Player = Player(sink=self.sink, bus=self.bus)
+        self.scoreboard: ScoreBoard = ScoreBoard(sink=self.sink, log=score_log, player_id=player_id)
+        self.bus.subscribe(self._update_scoreboard)
+        self.animals: List[Animal] = [Deer(sink=self.sink), Bear(sink=self.sink)]  # Example list of animals
+        self.guns: List[Gun] = [Rifle(rng=self.rng), Shotgun(rng=self.rng)]  # Example list of guns
+        self.spawn_table: Optional["SpawnTable"] = spawn_table
+        if catalog is not None:
+            self.animals = catalog.build_animals(sink=self.sink)
+            self.guns = catalog.build_guns(rng=self.rng)
+            if spawn_table is None and catalog.has_weights:
+                self.spawn_table = catalog.spawn_table(self.animals)
+        if spawn_table is not None:
+            self.animals = list(spawn_table.animals)
         self.is_game_running: bool = False
 
     def start_game(self) -> None:
         """Starts the game, including gun selection and the main game loop."""
         self.is_game_running = True
-        print("Welcome to the Shooting Game!")
+        self.sink.emit("welcome", "Welcome to the Shooting Game!")
         gun: Optional[Gun] = self.choose_gun_from_list()
         # Loop until a valid gun is chosen
         while gun is None:
@@ -139,44 +263,127 @@ class Game:
             The selected Gun object, or None if the choice was invalid.
         """
         # Display gun choices and return the selected gun
-        print("Choose your gun:")
+        self.display_gun_menu()
+        return self.parse_gun_choice(self.read_input("Enter your choice: "))
+
+    def display_gun_menu(self) -> None:
+        """Displays the available guns to the player."""
+        self.sink.emit("gun_menu", "Choose your gun:")
         for index, gun_option in enumerate(self.guns, start=1):
-            print(f"{index}. {gun_option.__class__.__name__}")
+            self.sink.emit("gun_option", "{index}. {gun}", index=index, gun=gun_option.name)
+
+    def parse_gun_choice(self, raw_choice: str) -> Optional[Gun]:
+        """
+        Interprets the player's answer to the gun menu.
+
+        Args:
+            raw_choice: The menu number entered by the player.
+
+        Returns:
+            The selected Gun object, or None if the choice was invalid.
+        """
         try:
-          choice: int = int(input("Enter your choice: "))
+          choice: int = int(raw_choice)
           # Adjust choice to be zero-indexed for list access
           if 1 <= choice <= len(self.guns):
               return self.guns[choice - 1]
           else:
-              print("Invalid Choice for Gun. Please select a valid number.")
+              self.sink.emit("invalid_gun", "Invalid Choice for Gun. Please select a valid number.")
               return None
         except ValueError: # Handle cases where input is not an integer
-          print("Invalid input. Please enter a number.")
+          self.sink.emit("invalid_input", "Invalid input. Please enter a number.")
           return None
         except Exception as e: # Catch any other unexpected errors
-          print(f"An unexpected error occurred: {e}")
+          self.sink.emit("error", "An unexpected error occurred: {error}", error=e)
           return None
 
     def game_loop(self) -> None:
         """Runs the main game loop, allowing the player to shoot or end the game."""
         while self.is_game_running:
             self.display_options()
-            choice: str = input("Enter your action: ")
-            if choice == '1':
-                # Player chooses to shoot
-                selected_animal: Animal = self.random_animal()
-                selected_animal.appear() # Make the animal appear before shooting
-                self.player.shoot(selected_animal)
-            elif choice == '2':
-                # Player chooses to end the game
-                self.end_game()
-            else:
-                print("Invalid choice. Please try again.")
+            choice: str = self.read_input("Enter your action: ")
+            self.handle_action(choice)
+
+    def handle_action(self, choice: str) -> None:
+        """
+        Performs one action chosen from the options menu.
+
+        Args:
+            choice: '1' to shoot an animal, '2' to end the game.
+        """
+        if choice == '1':
+            # Player chooses to shoot
+            selected_animal: Animal = self.random_animal()
+            selected_animal.appear() # Make the animal appear before shooting
+            self.player.shoot(selected_animal)
+        elif choice == '2':
+            # Player chooses to end the game
+            self.end_game()
+        else:
+            self.sink.emit("invalid_action", "Invalid choice. Please try again.")
+
+    def begin(self) -> None:
+        """
+        Starts the game without reading any input.
+
+        Together with handle_input this drives the same game as start_game, but
+        lets the caller push each command in, e.g. from a network connection.
+        """
+        self.is_game_running = True
+        self.sink.emit("welcome", "Welcome to the Shooting Game!")
+        self.display_gun_menu()
+
+    @property
+    def awaiting_gun(self) -> bool:
+        """Whether the running game still needs the player to choose a gun."""
+        return self.is_game_running and self.player.selected_gun is None
+
+    def handle_input(self, command: str) -> None:
+        """
+        Advances a game started with begin() by one command.
+
+        Args:
+            command: A gun menu number while a gun is being chosen, otherwise an
+                action from the options menu.
+        """
+        if not self.is_game_running:
+            return
+        if self.awaiting_gun:
+            gun: Optional[Gun] = self.parse_gun_choice(command)
+            if gun is None:
+                self.display_gun_menu()
+                return
+            self.player.choose_gun(gun)
+        else:
+            self.handle_action(command)
+        self.bus.flush() # One tick per command
+        if self.is_game_running:
+            self.display_options()
+
+    def read_input(self, prompt: str) -> str:
+        """
+        Reads the player's next command.
+
+        Args:
+            prompt: The prompt shown to the player.
+
+        Returns:
+            The command entered by the player or supplied by input_func.
+        """
+        self.bus.flush() # One tick per prompt
+        self.sink.flush() # Make sure pending output is visible before prompting
+        return self._read_command(prompt)
+
+    def _read_command(self, prompt: str) -> str:
+        """Waits for the next command from input_func or input(), without any game work."""
+        if self.input_func is not None:
+            return self.input_func(prompt)
+        return input(prompt)
 
     def display_options(self) -> None:
         """Displays the available actions to the player."""
-        print("\n1. Shoot an animal")
-        print("2. End game")
+        self.sink.emit("options", "\n1. Shoot an animal")
+        self.sink.emit("options", "2. End game")
 
     def random_animal(self) -> Animal:
         """
@@ -186,20 +393,29 @@ class Game:
             A randomly selected Animal object.
         """
         # Randomly select an animal
-        return random.choice(self.animals)
+        if self.spawn_table is not None:
+            return self.spawn_table.choose(self.rng)
+        return self.rng.choice(self.animals)
 
     def end_game(self) -> None:
         """Ends the game and displays the final score."""
         self.is_game_running = False
+        self.bus.flush()
+        self.scoreboard.record_game(self.player.points)
         self.display_score() # Display player's points from Player class
-        print("Game Over. Thank you for playing!")
+        self.sink.emit("game_over", "Game Over. Thank you for playing!")
+        self.sink.flush()
 
     def display_score(self) -> None:
         """Displays the player's final score."""
         # This method currently displays the score from the Player object.
         # The ScoreBoard class has more detailed score tracking capabilities
         # that could be integrated here if desired.
-        print(f"Final Score: {self.player.points}")
+        self.sink.emit("final_score", "Final Score: {score}", score=self.player.points)
+
+    def _update_scoreboard(self, batch: EventBatch) -> None:
+        """Passes a batch of events to the current scoreboard, which may have been replaced."""
+        self.scoreboard.handle_events(batch)
 
 
 
@@ -211,11 +427,23 @@ class Player:
     Attributes:
         selected_gun (Optional[Gun]): The gun currently selected by the player.
         points (int): The player's current score.
+        sink (OutputSink): Where the player's messages are written.
+        score_listeners (List[Callable[[Player], None]]): Called with the player after every change to points.
+        bus (Optional[EventBus]): Where hit, miss and score events are published, if anywhere.
     """
-    def __init__(self):
-        """Initializes a Player instance with no gun selected and zero points."""
+    def __init__(self, sink: Optional[OutputSink] = None, bus: Optional[EventBus] = None):
+        """
+        Initializes a Player instance with no gun selected and zero points.
+
+        Args:
+            sink: Where messages are written. Defaults to the console.
+            bus: Where hit, miss and score events are published.
+        """
         self.selected_gun: Optional[Gun] = None
         self.points: int = 0
+        self.sink: OutputSink = sink if sink is not None else CONSOLE
+        self.score_listeners: List[Callable[["Player"], None]] = []
+        self.bus: Optional[EventBus] = bus
 
     def choose_gun(self, gun: Gun) -> None:
         """
@@ -225,28 +453,79 @@ class Player:
             gun: The Gun object to be selected.
         """
         self.selected_gun = gun
-        print(f"You have selected {self.selected_gun.__class__.__name__}")
+        self.sink.emit("gun_selected", "You have selected {gun}", gun=self.selected_gun.name)
 
-    def shoot(self, target: Animal) -> None:
+    def shoot(self, target: Optional[Animal]) -> bool:
         """
         Allows the player to shoot at a target animal.
 
         Args:
-            target: The Animal object to be shot at.
+            target: The Animal object to be shot at, or None if the shot is aimed
+                where there is no animal, in which case it always misses.
+
+        Returns:
+            True if the shot hit the target, False otherwise.
         """
         if self.selected_gun is None:
-            print("You need to select a gun first!")
-            return
+            self.sink.emit("no_gun", "You need to select a gun first!")
+            return False
 
         # The fire() method of the selected gun determines if the shot is a hit
         hit: bool = self.selected_gun.fire()
-        if hit:
+        if hit and target is not None:
             # The get_shot() method of the animal returns the points for hitting it
             points_earned: int = target.get_shot()
+            if self.bus is not None:
+                self.bus.publish(HIT, self, points_earned)
             self.add_points(points_earned)
-            print(f"Hit! You earned {points_earned} points.")
-        else:
-            print("Missed! Better luck next time.")
+            self.sink.emit("shot_hit", "Hit! You earned {points} points.", points=points_earned)
+            return True
+        if self.bus is not None:
+            self.bus.publish(MISS, self)
+        self.sink.emit("shot_miss", "Missed! Better luck next time.")
+        return False
+
+    def shoot_many(self, targets: Sequence[Animal], scoreboard: Optional["ScoreBoard"] = None) -> List[int]:
+        """
+        Fires one volley, one shot per target animal.
+
+        The whole volley is resolved with Gun.fire_many, the earned points are added
+        with a single add_points call, and one "volley" message and one VOLLEY event
+        are published instead of per-shot ones. Points are read from each target's points_value, so
+        get_shot() is not called.
+
+        Args:
+            targets: The animal each shot is aimed at.
+            scoreboard: If given, receives the points of every hit in one update_scores call.
+                Only for a player without a bus; a bus already feeds the scoreboard,
+                which then records the volley's total as one score.
+
+        Raises:
+            ValueError: If a scoreboard is given for a player with a bus, whose hits
+                would then be recorded twice.
+
+        Returns:
+            The points earned by each hit, in target order.
+        """
+        if scoreboard is not None and self.bus is not None:
+            raise ValueError("A player with a bus scores through it; leave out the scoreboard.")
+        if self.selected_gun is None:
+            self.sink.emit("no_gun", "You need to select a gun first!")
+            return []
+        hits: Sequence[bool] = self.selected_gun.fire_many(len(targets))
+        earned: List[int] = [target.points_value for target in itertools.compress(targets, hits)]
+        total: int = sum(earned)
+        self.sink.emit(
+            "volley", "Volley: {hits} of {shots} shots hit for {points} points.",
+            shots=len(targets), hits=len(earned), points=total, scores=earned,
+        )
+        if self.bus is not None:
+            self.bus.publish(VOLLEY, self, (len(earned), len(targets) - len(earned)))
+        if earned:
+            self.add_points(total)
+            if scoreboard is not None:
+                scoreboard.update_scores(earned)
+        return earned
 
     def add_points(self, points: int) -> None:
         """
@@ -256,7 +535,11 @@ class Player:
             points: The number of points to add.
         """
         self.points += points
-        print(f"Total Points: {self.points}")
+        if self.bus is not None:
+            self.bus.publish(SCORE, self, points)
+        self.sink.emit("points_added", "Total Points: {total}", points=points, total=self.points)
+        for listener in self.score_listeners:
+            listener(self)
 
 
 
@@ -266,12 +549,35 @@ class ScoreBoard:
 
     Attributes:
         total_score (int): The cumulative score.
-        score_history (List[int]): A list of individual scores achieved.
+        score_history (ScoreHistory): The individual scores achieved, oldest first.
+        stats (RunningStats): Count, sum, min, max, mean and variance of every score recorded.
+        sink (OutputSink): Where the scoreboard's messages are written.
+        log (Optional[ScoreLog]): A persistent log every score and finished game is appended to.
+        player_id (int): The id under which scores are logged.
     """
-    def __init__(self):
-        """Initializes a ScoreBoard instance with a total score of zero and an empty score history."""
+    def __init__(
+        self,
+        sink: Optional[OutputSink] = None,
+        max_history: Optional[int] = None,
+        log: Optional["ScoreLog"] = None,
+        player_id: int = 0,
+    ):
+        """
+        Initializes a ScoreBoard instance with a total score of zero and an empty score history.
+
+        Args:
+            sink: Where messages are written. Defaults to the console.
+            max_history: If given, only the most recent max_history scores are kept in
+                score_history. The statistics still cover every score.
+            log: A persistent log every score and finished game is appended to.
+            player_id: The id under which scores are logged.
+        """
         self.total_score: int = 0
-        self.score_history: List[int] = []
+        self.score_history: ScoreHistory = ScoreHistory(capacity=max_history)
+        self.stats: RunningStats = RunningStats()
+        self.sink: OutputSink = sink if sink is not None else CONSOLE
+        self.log: Optional["ScoreLog"] = log
+        self.player_id: int = player_id
 
     def update_score(self, points: int) -> None:
         """
@@ -280,26 +586,207 @@ class ScoreBoard:
         Args:
             points: The points to add to the score.
         """
+        self.score_history.append(points) # First, as it is the only step that can fail
         self.total_score += points
-        self.score_history.append(points)
-        print(f"Score updated: +{points} points")
+        self.stats.update(points)
+        if self.log is not None:
+            self.log.append_score(self.player_id, points)
+        self.sink.emit("score_updated", "Score updated: +{points} points", points=points, total=self.total_score)
+
+    def update_scores(self, points: Sequence[int]) -> None:
+        """
+        Updates the scoreboard with many scores at once.
+
+        The history, statistics and log are updated as if update_score had been
+        called for each score, but only one summary message is written.
+
+        Args:
+            points: The points of each score, oldest first.
+        """
+        if not points:
+            return
+        batch_total: int = sum(points)
+        self.score_history.extend(points) # First, as it is the only step that can fail
+        self.total_score += batch_total
+        self.stats.update_many(points)
+        if self.log is not None:
+            for value in points:
+                self.log.append_score(self.player_id, value)
+        self.sink.emit(
+            "scores_updated", "Score updated: +{points} points from {count} scores",
+            points=batch_total, count=len(points), total=self.total_score, scores=points,
+        )
+
+    def handle_events(self, batch: EventBatch) -> None:
+        """
+        Records the scores of a batch of events, as an EventBus subscriber.
+
+        Args:
+            batch: The events; only score events are recorded.
+        """
+        scores: List[int] = batch.scores
+        if len(scores) == 1:
+            self.update_score(scores[0])
+        elif scores:
+            self.update_scores(scores)
 
     def display_score(self) -> None:
         """Displays the current total score and the history of scores."""
-        print(f"Current Score: {self.total_score}")
-        print("Score History:")
+        self.sink.emit("current_score", "Current Score: {score}", score=self.total_score)
+        self.sink.emit("score_history", "Score History:")
         for score in self.score_history:
-            print(f"  +{score} points")
+            self.sink.emit("score_history_entry", "  +{points} points", points=score)
+
+    def record_game(self, final_score: int) -> None:
+        """
+        Records a finished game in the persistent log, if there is one.
+
+        Args:
+            final_score: The player's final score.
+        """
+        if self.log is not None:
+            self.log.append_game(self.player_id, final_score)
+            self.log.flush()
+
+    def display_statistics(self) -> None:
+        """Displays summary statistics of every score recorded, without walking the history."""
+        self.sink.emit(
+            "score_statistics",
+            "Scores: {count}, Mean: {mean:.2f}, Min: {minimum}, Max: {maximum}, Std Dev: {stdev:.2f}",
+            count=self.stats.count,
+            mean=self.stats.mean,
+            minimum=self.stats.minimum,
+            maximum=self.stats.maximum,
+            stdev=self.stats.stdev,
+        )
 
     def display_final_score(self) -> None:
         """Displays the final total score."""
-        print(f"Final Score: {self.total_score}")
+        self.sink.emit("final_score", "Final Score: {score}", score=self.total_score)
+
 
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the command-line parser.
+
+    Returns:
+        The parser for the game's command-line options.
+    """
+    parser = argparse.ArgumentParser(description="Shooting Game")
+    parser.add_argument("--log", help="Append scores and finished games to this score log")
+    parser.add_argument("--player-id", type=int, default=0, help="Player id used in the score log")
+    parser.add_argument("--catalog", help="Play with the guns and animals of this TOML or JSON catalog")
+    parser.add_argument("--metrics", help="Record action counters and latencies, written to this file on exit (.json for JSON, otherwise Prometheus text)")
+    parser.add_argument("--screen", action="store_true", help="Play full-screen in the terminal instead of scrolling text")
+    parser.add_argument("--fps", type=float, default=30.0, help="Frame rate cap of the full-screen mode")
+    commands = parser.add_subparsers(dest="command")
+
+    tournament = commands.add_parser("tournament", help="Run many bot-driven sessions in parallel")
+    tournament.add_argument("--sessions", type=int, default=1000, help="Number of sessions to play")
+    tournament.add_argument("--seed", type=int, default=0, help="Master seed for every session's RNG")
+    tournament.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    tournament.add_argument("--gun", type=int, default=1, help="Gun choice entered by the bot")
+    tournament.add_argument("--shots", type=int, default=10, help="Shots fired by the bot before ending")
+
+    optimize = commands.add_parser("optimize", help="Search for the best gun, shot budget and stop score")
+    optimize.add_argument("--budget", type=int, default=20000, help="Most sessions played in total")
+    optimize.add_argument("--seed", type=int, default=0, help="Master seed for every session's RNG")
+    optimize.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    optimize.add_argument("--shots", type=int, nargs="+", default=[5, 10, 20, 40], help="Shot budgets to try")
+    optimize.add_argument("--stop-at", type=int, nargs="*", default=[], help="Scores to end the game at early")
+    optimize.add_argument("--shot-cost", type=float, default=0.0, help="Points subtracted per shot fired")
+
+    leaderboard = commands.add_parser("leaderboard", help="Show the best final scores in a score log")
+    leaderboard.add_argument("path", help="Path of the score log")
+    leaderboard.add_argument("--top", type=int, default=10, help="Number of players to show")
+    leaderboard.add_argument("--compact", action="store_true", help="Compact the log and rebuild its index first")
+
+    batch = commands.add_parser("batch", help="Play a scripted command stream without prompts")
+    batch.add_argument("script", nargs="?", default="-", help="File of commands, one per line (default: stdin)")
+    batch.add_argument("--seed", type=int, default=None, help="Seed for the game's RNG")
+    batch.add_argument("--actions", action="store_true", help="Print a compact log line per command before the summary")
+
+    monitor = commands.add_parser("monitor", help="Print the live totals of a shared-memory scoreboard")
+    monitor.add_argument("name", help="Name of the shared memory block")
+    monitor.add_argument("--interval", type=float, default=1.0, help="Seconds between updates")
+    monitor.add_argument("--count", type=int, default=None, help="Stop after this many updates")
+
+    serve = commands.add_parser("serve", help="Host concurrent sessions over TCP or a Unix socket")
+    serve.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    serve.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    serve.add_argument("--unix", default=None, help="Listen on this Unix socket instead of TCP")
+    serve.add_argument("--seed", type=int, default=None, help="Master seed for every session's RNG")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Runs the main game sequence, or the command given on the command line.
 
-def main():
-    """Runs the main game sequence."""
-    game: Game = Game()
-    game.start_game()
+    Args:
+        argv: Command-line arguments. No arguments starts the interactive game.
+    """
+    args = build_parser().parse_args(argv or [])
+    if args.command == "tournament":
+        from tournament import BotStrategy, run_tournament
+        report = run_tournament(args.sessions, BotStrategy(args.gun, args.shots), master_seed=args.seed, workers=args.workers)
+        print(report.summary())
+        return
+    if args.command == "optimize":
+        from catalog import load_catalog
+        from optimizer import candidate_policies, optimize
+        catalog = load_catalog(args.catalog) if args.catalog else None
+        policies = candidate_policies(len(Game(catalog=catalog).guns), args.shots, [None, *args.stop_at])
+        report = optimize(
+            policies, args.budget, master_seed=args.seed, shot_cost=args.shot_cost, catalog=catalog, workers=args.workers,
+        )
+        print(report.summary())
+        return
+    if args.command == "leaderboard":
+        from score_log import ScoreLog
+        with ScoreLog(args.path) as log:
+            if args.compact:
+                log.compact()
+            for rank, (player_id, best) in enumerate(log.leaderboard(args.top), start=1):
+                print(f"{rank}. Player {player_id}: {best}")
+        return
+    if args.command == "monitor":
+        from shared_scoreboard import watch
+        watch(args.name, interval=args.interval, iterations=args.count)
+        return
+    if args.command == "serve":
+        from server import serve
+        serve(host=args.host, port=args.port, unix_path=args.unix, seed=args.seed)
+        return
+    catalog: Optional["Catalog"] = None
+    if args.catalog:
+        from catalog import load_catalog
+        catalog = load_catalog(args.catalog) # Loaded before instrumenting, so its classes are timed too
+    with contextlib.ExitStack() as stack:
+        score_log: Optional["ScoreLog"] = None
+        if args.log:
+            from score_log import ScoreLog
+            score_log = stack.enter_context(ScoreLog(args.log))
+        if args.metrics:
+            from metrics import Metrics, instrumented
+            metrics = stack.enter_context(instrumented(Metrics()))
+            stack.callback(metrics.write, args.metrics) # Runs on exit, before uninstrumenting
+        if args.command == "batch":
+            from batch import read_commands, run_batch
+            from rng import RandomService
+            script = sys.stdin if args.script == "-" else stack.enter_context(open(args.script))
+            report = run_batch(
+                read_commands(script), rng=RandomService(args.seed), log_stream=sys.stdout if args.actions else None,
+                score_log=score_log, player_id=args.player_id, catalog=catalog,
+            )
+            print(report.summary())
+            return
+        if args.screen:
+            from screen import play_screen
+            play_screen(max_fps=args.fps, score_log=score_log, player_id=args.player_id, catalog=catalog)
+            return
+        game: Game = Game(score_log=score_log, player_id=args.player_id, catalog=catalog)
+        game.start_game()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(sys.argv[1:])
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""
+Headless Monte Carlo simulation of hunting sessions.
+
+The interactive game resolves one shot per ``input()`` call and prints every
+step. This module reuses the same rules (each gun's ``accuracy`` and each
+animal's ``points_value``) but resolves whole batches of shots and sessions as
+NumPy arrays, without any console output.
+"""
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from shooting_game import Animal, Gun
+
+SeedLike = Union[None, int, np.random.Generator]
+
+# Upper bound on the number of per-shot draws materialised at once.
+_MAX_CHUNK_ELEMENTS: int = 1 << 22
+
+
+def hit_probability(gun: Gun) -> float:
+    """
+    Returns the probability that a single shot from the gun hits.
+
+    Args:
+        gun: The Gun whose accuracy is read.
+
+    Raises:
+        ValueError: If the gun's accuracy is not between 0 and 1.
+
+    Returns:
+        The hit probability of the gun.
+    """
+    accuracy: float = float(gun.accuracy)
+    if not 0.0 <= accuracy <= 1.0:
+        raise ValueError(f"{gun.__class__.__name__} has an invalid accuracy: {accuracy}")
+    return accuracy
+
+
+def points_table(animals: Sequence[Animal]) -> np.ndarray:
+    """
+    Builds an array of the points value of each animal.
+
+    Args:
+        animals: The animals that can appear.
+
+    Raises:
+        ValueError: If no animals are given.
+
+    Returns:
+        An int64 array where entry ``i`` is ``animals[i].points_value``.
+    """
+    if len(animals) == 0:
+        raise ValueError("At least one animal is required for a simulation.")
+    return np.array([animal.points_value for animal in animals], dtype=np.int64)
+
+
+def simulate_shots(gun: Gun, animals: Sequence[Animal], n_shots: int, seed: SeedLike = None) -> np.ndarray:
+    """
+    Simulates individual shots, each at a uniformly chosen animal.
+
+    Args:
+        gun: The gun used for every shot.
+        animals: The animals that can appear, chosen uniformly as in Game.random_animal.
+        n_shots: The number of shots to simulate.
+        seed: A seed or NumPy Generator for reproducible results.
+
+    Returns:
+        An int64 array of length ``n_shots`` with the points earned by each shot (0 on a miss).
+    """
+    rng: np.random.Generator = np.random.default_rng(seed)
+    values: np.ndarray = points_table(animals)
+    hits: np.ndarray = rng.random(n_shots) < hit_probability(gun)
+    spawned: np.ndarray = rng.integers(0, len(values), size=n_shots)
+    return np.where(hits, values[spawned], 0)
+
+
+def simulate_sessions(
+    gun: Gun,
+    animals: Sequence[Animal],
+    n_sessions: int,
+    shots_per_session: Union[int, Sequence[int], np.ndarray],
+    seed: SeedLike = None,
+) -> np.ndarray:
+    """
+    Simulates complete sessions and returns the final score of each one.
+
+    Every shot either misses or hits one of the animals, so the number of hits on
+    each animal in a session follows a multinomial distribution. Sampling those
+    counts directly costs O(len(animals)) per session regardless of how many
+    shots each session fires.
+
+    Args:
+        gun: The gun used for every shot.
+        animals: The animals that can appear, chosen uniformly as in Game.random_animal.
+        n_sessions: The number of sessions to simulate.
+        shots_per_session: The number of shots fired in each session, either one
+            value for all sessions or one value per session.
+        seed: A seed or NumPy Generator for reproducible results.
+
+    Raises:
+        ValueError: If a shot count is negative or does not match ``n_sessions``.
+
+    Returns:
+        An int64 array of length ``n_sessions`` with the final score of each session.
+    """
+    rng: np.random.Generator = np.random.default_rng(seed)
+    values: np.ndarray = points_table(animals)
+    shots: np.ndarray = np.broadcast_to(np.asarray(shots_per_session, dtype=np.int64), (n_sessions,))
+    if np.any(shots < 0):
+        raise ValueError("Shots per session must not be negative.")
+
+    accuracy: float = hit_probability(gun)
+    # Outcome 0 is a miss, outcome i + 1 is a hit on animals[i]
+    outcome_probabilities: np.ndarray = np.concatenate(
+        ([1.0 - accuracy], np.full(len(values), accuracy / len(values)))
+    )
+    outcome_points: np.ndarray = np.concatenate(([0], values))
+    counts: np.ndarray = rng.multinomial(shots, outcome_probabilities)
+    return counts @ outcome_points
+
+
+def simulate_session_shots(
+    gun: Gun,
+    animals: Sequence[Animal],
+    n_sessions: int,
+    shots_per_session: int,
+    seed: SeedLike = None,
+    chunk_size: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Simulates sessions shot by shot and returns the final score of each one.
+
+    This draws every shot explicitly, which is slower than simulate_sessions but
+    mirrors the game loop step for step. Sessions are processed in chunks so
+    memory use stays bounded for very large batches.
+
+    Args:
+        gun: The gun used for every shot.
+        animals: The animals that can appear, chosen uniformly as in Game.random_animal.
+        n_sessions: The number of sessions to simulate.
+        shots_per_session: The number of shots fired in each session.
+        seed: A seed or NumPy Generator for reproducible results.
+        chunk_size: The number of sessions simulated per chunk. Defaults to a size
+            that keeps each chunk to a few million draws.
+
+    Returns:
+        An int64 array of length ``n_sessions`` with the final score of each session.
+    """
+    rng: np.random.Generator = np.random.default_rng(seed)
+    values: np.ndarray = points_table(animals)
+    accuracy: float = hit_probability(gun)
+    if chunk_size is None:
+        chunk_size = max(1, _MAX_CHUNK_ELEMENTS // max(1, shots_per_session))
+
+    scores: np.ndarray = np.empty(n_sessions, dtype=np.int64)
+    for start in range(0, n_sessions, chunk_size):
+        stop: int = min(start + chunk_size, n_sessions)
+        shape = (stop - start, shots_per_session)
+        hits: np.ndarray = rng.random(shape) < accuracy
+        spawned: np.ndarray = rng.integers(0, len(values), size=shape)
+        scores[start:stop] = np.where(hits, values[spawned], 0).sum(axis=1)
+    return scores
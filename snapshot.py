@@ -0,0 +1,278 @@
+"""
+Compact, versioned binary snapshots of a running game.
+
+A snapshot holds everything a Game changes while it is played: whether it is
+running, the player's gun and points, the scoreboard's total, statistics and
+score history, and the exact state of the random number generator, so a
+restored game draws the same shots and spawns the original would have.
+
+Layout (little-endian):
+
+    header      magic "SGSN", version and the fixed-size fields of _HEADER
+    gun name    the selected gun's name, checked against the restored game's guns
+    history     the raw score history array, oldest first
+    rng         the RNG state: a RandomService's PCG64 state and buffered values,
+                or a random.Random's Mersenne Twister state
+
+The score history is written straight from its array's buffer, without
+converting or copying it, and a snapshot is restored from a single read.
+Configuration that does not change during play (sink, guns, animals, catalog,
+score log) is not saved; pass it again when restoring.
+"""
+import os
+import random
+import struct
+from array import array
+from typing import Any, BinaryIO, List, Tuple, Union
+
+from rng import RandomService
+from score_history import ScoreHistory
+from shooting_game import Game
+
+MAGIC: bytes = b"SGSN"
+FORMAT_VERSION: int = 1
+
+RNG_RANDOM_SERVICE: int = 1
+RNG_MERSENNE_TWISTER: int = 2
+
+# magic, version, running, history typecode, rng kind, selected gun index (-1 for none),
+# player id, player points, total score, stats count, total, minimum, maximum, mean, m2,
+# history capacity (0 for unbounded), history length, gun name length
+_HEADER = struct.Struct("<4sHBcBxiIqqqqqqddQQH")
+# block size, has_uint32, uinteger, PCG64 state and increment, seed length, spawn key length, buffered values
+_PCG64 = struct.Struct("<IBxxxI16s16sHHQ")
+# Mersenne Twister state version, gauss_next present, gauss_next
+_MT_HEADER = struct.Struct("<iBxxxd")
+_MT_WORDS: int = 625
+
+Buffer = Union[bytes, memoryview]
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot is malformed, of an unsupported version, or does not fit the game."""
+
+
+def _rng_parts(rng: Any) -> Tuple[int, List[Buffer]]:
+    """Encodes the state of a game's RNG."""
+    if isinstance(rng, RandomService):
+        state = rng.getstate()
+        bit_state = state["bit_generator"]
+        if bit_state["bit_generator"] != "PCG64":
+            raise SnapshotError(f"Cannot snapshot a {bit_state['bit_generator']} generator")
+        seed: int = rng.seed
+        seed_bytes: bytes = seed.to_bytes((seed.bit_length() + 7) // 8 or 1, "little")
+        buffered = array("d", state["buffer"])
+        header: bytes = _PCG64.pack(
+            rng.block_size, bit_state["has_uint32"], bit_state["uinteger"],
+            bit_state["state"]["state"].to_bytes(16, "little"), bit_state["state"]["inc"].to_bytes(16, "little"),
+            len(seed_bytes), len(rng.spawn_key), len(buffered),
+        )
+        return RNG_RANDOM_SERVICE, [header, seed_bytes, array("I", rng.spawn_key).tobytes(), memoryview(buffered)]
+    if rng is random or isinstance(rng, random.Random):
+        version, words, gauss_next = rng.getstate()
+        header = _MT_HEADER.pack(version, gauss_next is not None, gauss_next or 0.0)
+        return RNG_MERSENNE_TWISTER, [header, array("I", words).tobytes()]
+    raise SnapshotError(f"Cannot snapshot an RNG of type {type(rng).__name__}")
+
+
+def snapshot_parts(game: Game) -> List[Buffer]:
+    """
+    Encodes a game's state as a list of buffers, to be written in order.
+
+    The score history buffers are views of the scoreboard's array, not copies,
+    so write them out before the game records more scores.
+
+    Args:
+        game: The game to capture.
+
+    Raises:
+        SnapshotError: If the game's RNG is of an unsupported type.
+
+    Returns:
+        The parts of the snapshot.
+    """
+    game.bus.flush() # Scores still pending on the bus belong in the snapshot
+    gun = game.player.selected_gun
+    gun_index: int = game.guns.index(gun) if gun is not None and gun in game.guns else -1
+    gun_name: bytes = gun.name.encode() if gun_index >= 0 else b""
+    scoreboard = game.scoreboard
+    stats = scoreboard.stats
+    history = scoreboard.score_history
+    rng_kind, rng_parts = _rng_parts(game.rng)
+    header: bytes = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, game.is_game_running, history.typecode.encode(), rng_kind, gun_index,
+        scoreboard.player_id, game.player.points, scoreboard.total_score,
+        stats.count, stats.total, stats.minimum or 0, stats.maximum or 0, stats.mean, stats._m2,
+        history.capacity or 0, len(history), len(gun_name),
+    )
+    return [header, gun_name, *history.buffers(), *rng_parts]
+
+
+def snapshot(game: Game) -> bytes:
+    """
+    Captures a game's state as bytes.
+
+    Args:
+        game: The game to capture.
+
+    Returns:
+        The snapshot.
+    """
+    return b"".join(snapshot_parts(game))
+
+
+def save_snapshot(game: Game, path: str) -> None:
+    """
+    Writes a game's snapshot to a file, replacing it atomically.
+
+    The parts are written one after another without joining them first, so the
+    score history is never copied. The file is not fsynced, which keeps frequent
+    checkpoints cheap; a crash may lose the latest one but never leaves a torn file.
+
+    Args:
+        game: The game to capture.
+        path: The file to write.
+    """
+    temp_path: str = path + ".tmp"
+    with open(temp_path, "wb") as handle:
+        write_snapshot(game, handle)
+    os.replace(temp_path, path)
+
+
+def write_snapshot(game: Game, stream: BinaryIO) -> int:
+    """
+    Writes a game's snapshot to a binary stream.
+
+    Args:
+        game: The game to capture.
+        stream: The stream written to.
+
+    Returns:
+        The number of bytes written.
+    """
+    written: int = 0
+    for part in snapshot_parts(game):
+        stream.write(part)
+        written += len(part) if isinstance(part, bytes) else part.nbytes
+    return written
+
+
+def _array(typecode: str, data: memoryview) -> array:
+    """Copies raw bytes into a new typed array."""
+    values = array(typecode)
+    values.frombytes(data)
+    return values
+
+
+def _restore_rng(kind: int, data: memoryview, pos: int) -> Any:
+    """Decodes the RNG state written by _rng_parts."""
+    if kind == RNG_RANDOM_SERVICE:
+        block_size, has_uint32, uinteger, state, inc, seed_length, key_length, buffered = _PCG64.unpack_from(data, pos)
+        pos += _PCG64.size
+        seed: int = int.from_bytes(data[pos:pos + seed_length], "little")
+        pos += seed_length
+        spawn_key = _array("I", data[pos:pos + 4 * key_length])
+        pos += 4 * key_length
+        values = _array("d", data[pos:pos + 8 * buffered])
+        if len(values) != buffered:
+            raise SnapshotError("Snapshot ends in the middle of the RNG state")
+        rng = RandomService(seed, block_size=block_size, spawn_key=tuple(spawn_key))
+        rng.setstate({
+            "bit_generator": {
+                "bit_generator": "PCG64",
+                "state": {"state": int.from_bytes(state, "little"), "inc": int.from_bytes(inc, "little")},
+                "has_uint32": has_uint32,
+                "uinteger": uinteger,
+            },
+            "buffer": values.tolist(),
+        })
+        return rng
+    if kind == RNG_MERSENNE_TWISTER:
+        version, has_gauss, gauss_next = _MT_HEADER.unpack_from(data, pos)
+        pos += _MT_HEADER.size
+        words = _array("I", data[pos:pos + 4 * _MT_WORDS])
+        if len(words) != _MT_WORDS:
+            raise SnapshotError("Snapshot ends in the middle of the RNG state")
+        rng = random.Random()
+        rng.setstate((version, tuple(words), gauss_next if has_gauss else None))
+        return rng
+    raise SnapshotError(f"Unknown RNG kind {kind}")
+
+
+def restore(data: bytes, **game_options: Any) -> Game:
+    """
+    Rebuilds a game from a snapshot.
+
+    A running game resumes with game_loop(), or with handle_input() if it was
+    driven that way, and draws the same random numbers the original would have.
+
+    Args:
+        data: A snapshot produced by snapshot() or save_snapshot().
+        **game_options: Game arguments other than rng, such as sink, input_func,
+            catalog or score_log. They must describe the same guns as the
+            original game. player_id defaults to the snapshot's.
+
+    Raises:
+        SnapshotError: If the snapshot is malformed, of another version, or its
+            selected gun is not among the restored game's guns.
+
+    Returns:
+        The restored game.
+    """
+    view = memoryview(data)
+    if len(view) < _HEADER.size or view[:4] != MAGIC:
+        raise SnapshotError("Not a game snapshot")
+    (
+        _, version, running, typecode, rng_kind, gun_index, player_id, points, total_score,
+        count, total, minimum, maximum, mean, m2, capacity, history_length, name_length,
+    ) = _HEADER.unpack_from(view)
+    if version != FORMAT_VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version}")
+    pos: int = _HEADER.size
+    gun_name: str = bytes(view[pos:pos + name_length]).decode()
+    pos += name_length
+    try:
+        scores = array(typecode.decode())
+    except ValueError:
+        raise SnapshotError(f"Invalid history typecode {typecode!r}") from None
+    history_bytes: int = history_length * scores.itemsize
+    scores.frombytes(view[pos:pos + history_bytes])
+    if len(scores) != history_length:
+        raise SnapshotError("Snapshot ends in the middle of the score history")
+    pos += history_bytes
+    try:
+        rng = _restore_rng(rng_kind, view, pos)
+    except struct.error:
+        raise SnapshotError("Snapshot ends in the middle of the RNG state") from None
+
+    game = Game(rng=rng, **{"player_id": player_id, **game_options})
+    if gun_index >= 0:
+        if gun_index >= len(game.guns) or game.guns[gun_index].name != gun_name:
+            raise SnapshotError(f"The snapshot's gun {gun_name} is not gun {gun_index + 1} of this game")
+        game.player.selected_gun = game.guns[gun_index]
+    game.is_game_running = bool(running)
+    game.player.points = points
+    scoreboard = game.scoreboard
+    scoreboard.total_score = total_score
+    scoreboard.score_history = ScoreHistory(capacity=capacity or None, typecode=scores.typecode)
+    scoreboard.score_history.extend(scores)
+    stats = scoreboard.stats
+    stats.count, stats.total, stats.mean, stats._m2 = count, total, mean, m2
+    stats.minimum, stats.maximum = (minimum, maximum) if count else (None, None)
+    return game
+
+
+def load_snapshot(path: str, **game_options: Any) -> Game:
+    """
+    Restores a game from a snapshot file, read in one go.
+
+    Args:
+        path: The file written by save_snapshot().
+        **game_options: Game arguments other than rng, see restore().
+
+    Returns:
+        The restored game.
+    """
+    with open(path, "rb") as handle:
+        data: bytes = handle.read()
+    return restore(data, **game_options)
@@ -0,0 +1,147 @@
+"""
+Weighted animal spawn table using Vose's alias method.
+
+The table is built once in O(n) for n species. Afterwards every spawn costs one
+uniform draw and at most two list lookups, however many species there are, and
+sample(n) draws many spawns with two vectorized NumPy calls.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from rng import RandomService
+from shooting_game import Animal
+
+RngLike = Union[None, int, np.random.Generator, RandomService]
+
+
+def _generator(rng: RngLike) -> np.random.Generator:
+    """Returns the NumPy Generator behind a seed, Generator or RandomService."""
+    if isinstance(rng, RandomService):
+        return rng.generator
+    return np.random.default_rng(rng)
+
+
+class SpawnTable:
+    """
+    Draws animals with fixed relative weights in O(1) per spawn.
+
+    Attributes:
+        animals (List[Animal]): The animals that can spawn, in table order.
+        weights (List[float]): The normalized spawn probability of each animal.
+    """
+    def __init__(self, animals: Sequence[Animal], weights: Optional[Sequence[float]] = None):
+        """
+        Builds the alias table.
+
+        Args:
+            animals: The animals that can spawn.
+            weights: The relative spawn weight of each animal. Defaults to equal weights.
+
+        Raises:
+            ValueError: If there are no animals, the weights do not match the animals,
+                or a weight is negative, or all weights are zero.
+        """
+        if len(animals) == 0:
+            raise ValueError("A spawn table needs at least one animal.")
+        if weights is None:
+            weights = [1.0] * len(animals)
+        if len(weights) != len(animals):
+            raise ValueError("Each animal needs exactly one weight.")
+        if any(weight < 0 for weight in weights):
+            raise ValueError("Spawn weights must not be negative.")
+        total: float = float(sum(weights))
+        if total <= 0:
+            raise ValueError("At least one spawn weight must be positive.")
+
+        self.animals: List[Animal] = list(animals)
+        self.weights: List[float] = [weight / total for weight in weights]
+        self._probability, self._alias = self._build(self.weights)
+        self._probability_array: np.ndarray = np.array(self._probability)
+        self._alias_array: np.ndarray = np.array(self._alias, dtype=np.int64)
+
+    @classmethod
+    def from_weights(cls, weighted_animals: Dict[Animal, float]) -> "SpawnTable":
+        """
+        Builds a table from a mapping of animal to weight, e.g. one level's spawn weights.
+
+        Args:
+            weighted_animals: The relative spawn weight of each animal.
+
+        Returns:
+            The spawn table.
+        """
+        return cls(list(weighted_animals), list(weighted_animals.values()))
+
+    @staticmethod
+    def _build(probabilities: Sequence[float]) -> Tuple[List[float], List[int]]:
+        """Builds the probability and alias columns with Vose's algorithm."""
+        n: int = len(probabilities)
+        scaled: List[float] = [p * n for p in probabilities]
+        probability: List[float] = [0.0] * n
+        alias: List[int] = list(range(n))
+        small: List[int] = [i for i, p in enumerate(scaled) if p < 1.0]
+        large: List[int] = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less: int = small.pop()
+            more: int = large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Leftovers are 1.0 up to rounding error
+        for i in large + small:
+            probability[i] = 1.0
+        return probability, alias
+
+    def __len__(self) -> int:
+        """Returns the number of species in the table."""
+        return len(self.animals)
+
+    def choose(self, rng) -> Animal:
+        """
+        Draws one animal.
+
+        Args:
+            rng: Anything with a random() method returning floats in [0, 1), such as
+                the random module, a random.Random or a RandomService.
+
+        Returns:
+            The spawned animal.
+        """
+        scaled: float = rng.random() * len(self.animals)
+        column: int = int(scaled)
+        # The fractional part is a second uniform draw, independent of the column
+        if scaled - column < self._probability[column]:
+            return self.animals[column]
+        return self.animals[self._alias[column]]
+
+    def sample(self, n: int, rng: RngLike = None) -> np.ndarray:
+        """
+        Draws many spawns at once.
+
+        Args:
+            n: The number of spawns.
+            rng: A seed, NumPy Generator or RandomService.
+
+        Returns:
+            An int64 array of n indices into animals.
+        """
+        generator: np.random.Generator = _generator(rng)
+        columns: np.ndarray = generator.integers(0, len(self.animals), size=n)
+        keep: np.ndarray = generator.random(n) < self._probability_array[columns]
+        return np.where(keep, columns, self._alias_array[columns])
+
+    def sample_animals(self, n: int, rng: RngLike = None) -> List[Animal]:
+        """
+        Draws many spawns at once as Animal objects.
+
+        Args:
+            n: The number of spawns.
+            rng: A seed, NumPy Generator or RandomService.
+
+        Returns:
+            The spawned animals.
+        """
+        animals: List[Animal] = self.animals
+        return [animals[index] for index in self.sample(n, rng).tolist()]
@@ -0,0 +1,581 @@
+"""
+Mergeable streaming statistics of scores, shots and guns.
+
+Every summary here uses constant (or, for the histogram, value-bounded) memory
+however many values it has seen. Two summaries of the same kind merge into one
+that describes both streams, in any order and grouping, so sessions, worker
+processes or machines can each keep their own and combine them at the end:
+
+    KLLSketch       approximate quantiles (p50, p99, ...) of any numeric stream
+    PointsHistogram exact counts of each per-shot points value, 0 for a miss
+    GunHitRates     shots and hits per gun
+    ScoreSummary    all of the above for a set of games, plus RunningStats of
+                    the final scores, serialized to a few KB by to_bytes()
+
+StatsSink fills a ScoreSummary from a game's messages, so any Game can be
+summarized by passing it as the sink.
+"""
+import math
+import struct
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from output import OutputSink
+from score_history import RunningStats
+
+MAGIC: bytes = b"SGSS"
+FORMAT_VERSION: int = 1
+
+# magic, version, k, levels, count, minimum, maximum, compaction parity bits
+_KLL = struct.Struct("<4sHHHqddQ")
+# count, total, minimum, maximum, mean, m2 of the final scores
+_RUNNING = struct.Struct("<qqqqdd")
+# distinct points values; gun count
+_COUNT = struct.Struct("<I")
+# gun name length, shots, hits
+_GUN = struct.Struct("<HQQ")
+
+Number = Union[int, float]
+
+
+class SummaryError(Exception):
+    """Raised when serialized statistics are malformed or of an unsupported version."""
+
+
+class KLLSketch:
+    """
+    A KLL quantile sketch.
+
+    Values are kept in levels of compactors; an item on level h stands for 2**h
+    values of the stream. When a level fills up it is sorted and every other
+    item is promoted to the next level, so the sketch keeps about 3k items
+    however long the stream is. A quantile's rank is off by roughly 1.7/k of the
+    stream length at worst (under 1% for the default k), independent of the
+    order values or sketches are added in.
+
+    Attributes:
+        k (int): The size of the top compactor; larger is more accurate.
+        count (int): The number of values seen.
+        minimum (float): The smallest value seen, or inf if empty.
+        maximum (float): The largest value seen, or -inf if empty.
+    """
+    def __init__(self, k: int = 200):
+        """
+        Initializes an empty KLLSketch instance.
+
+        Args:
+            k: The size of the top compactor.
+
+        Raises:
+            ValueError: If k is below 8.
+        """
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k: int = k
+        self.count: int = 0
+        self.minimum: float = math.inf
+        self.maximum: float = -math.inf
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._pending: List[float] = [] # Single updates waiting to join level 0
+        self._parity: int = 0 # Bit h picks the odd or even items at level h's next compaction
+
+    def _capacity(self, level: int) -> int:
+        """The number of items a level holds before it is compacted."""
+        depth: int = len(self._levels) - 1 - level
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def update(self, value: Number) -> None:
+        """
+        Adds a value.
+
+        Args:
+            value: The value to add.
+        """
+        self.count += 1
+        if value < self.minimum:
+            self.minimum = float(value)
+        if value > self.maximum:
+            self.maximum = float(value)
+        self._pending.append(value)
+        if len(self._pending) >= self.k:
+            self._flush()
+
+    def update_many(self, values: Iterable[Number]) -> None:
+        """
+        Adds many values at once.
+
+        Args:
+            values: The values to add, e.g. a NumPy array.
+        """
+        array_values: np.ndarray = np.asarray(
+            values if isinstance(values, (np.ndarray, list, tuple)) else list(values), dtype=np.float64,
+        ).ravel()
+        if not array_values.size:
+            return
+        self.count += array_values.size
+        self.minimum = min(self.minimum, float(array_values.min()))
+        self.maximum = max(self.maximum, float(array_values.max()))
+        self._flush()
+        self._absorb(array_values)
+
+    def _flush(self) -> None:
+        """Moves the pending single updates into level 0."""
+        if self._pending:
+            values: np.ndarray = np.array(self._pending, dtype=np.float64)
+            self._pending.clear()
+            self._absorb(values)
+
+    def _absorb(self, values: np.ndarray) -> None:
+        """Adds items to level 0 and compacts until the sketch fits."""
+        self._levels[0] = np.concatenate((self._levels[0], values))
+        self._compress()
+
+    def _compress(self) -> None:
+        """While the sketch holds more items than its levels allow, compacts the lowest full level."""
+        while sum(len(items) for items in self._levels) > sum(self._capacity(level) for level in range(len(self._levels))):
+            level: int = next(level for level, items in enumerate(self._levels) if len(items) >= self._capacity(level))
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+            items: np.ndarray = np.sort(self._levels[level])
+            even: int = len(items) - len(items) % 2
+            offset: int = (self._parity >> level) & 1
+            self._parity ^= 1 << level # Alternate between odd and even items to cancel the rounding bias
+            self._levels[level] = items[even:]
+            self._levels[level + 1] = np.concatenate((self._levels[level + 1], items[offset:even:2]))
+
+    def merge(self, other: "KLLSketch") -> None:
+        """
+        Folds another sketch into this one.
+
+        Args:
+            other: A sketch with the same k; it is left unchanged.
+
+        Raises:
+            ValueError: If the sketches have different k.
+        """
+        if other.k != self.k:
+            raise ValueError("Only sketches with the same k can be merged.")
+        if other.count == 0:
+            return
+        self._flush()
+        self.count += other.count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate((self._levels[level], items))
+        if other._pending:
+            self._levels[0] = np.concatenate((self._levels[0], np.array(other._pending, dtype=np.float64)))
+        self._compress()
+
+    def _weighted(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the retained items in order with their cumulative weights."""
+        self._flush()
+        values: np.ndarray = np.concatenate(self._levels)
+        weights: np.ndarray = np.concatenate([np.full(len(items), 1 << level, dtype=np.int64) for level, items in enumerate(self._levels)])
+        order: np.ndarray = np.argsort(values, kind="stable")
+        return values[order], np.cumsum(weights[order])
+
+    def quantiles(self, qs: Sequence[float]) -> List[float]:
+        """
+        Estimates several quantiles at once.
+
+        Args:
+            qs: Fractions between 0 and 1, e.g. 0.5 for the median.
+
+        Raises:
+            ValueError: If the sketch is empty or a fraction is out of range.
+
+        Returns:
+            The estimated quantiles; 0 and 1 give the exact minimum and maximum.
+        """
+        if self.count == 0:
+            raise ValueError("An empty sketch has no quantiles.")
+        if any(not 0.0 <= q <= 1.0 for q in qs):
+            raise ValueError("Quantiles must be between 0 and 1.")
+        values, cumulative = self._weighted()
+        total: int = int(cumulative[-1])
+        result: List[float] = []
+        for q in qs:
+            if q == 0.0:
+                result.append(self.minimum)
+            elif q == 1.0:
+                result.append(self.maximum)
+            else:
+                index: int = int(np.searchsorted(cumulative, q * total, side="left"))
+                result.append(float(values[min(index, len(values) - 1)]))
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Estimates one quantile, see quantiles()."""
+        return self.quantiles([q])[0]
+
+    def rank(self, value: Number) -> float:
+        """
+        Estimates the fraction of values less than or equal to a value.
+
+        Args:
+            value: The value to look up.
+
+        Returns:
+            A fraction between 0 and 1, or 0.0 for an empty sketch.
+        """
+        if self.count == 0:
+            return 0.0
+        values, cumulative = self._weighted()
+        index: int = int(np.searchsorted(values, value, side="right"))
+        return float(cumulative[index - 1]) / float(cumulative[-1]) if index else 0.0
+
+    @property
+    def retained(self) -> int:
+        """The number of items the sketch holds."""
+        return sum(len(items) for items in self._levels) + len(self._pending)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the sketch.
+
+        Returns:
+            The header, the item count of each level and the items as doubles.
+        """
+        self._flush()
+        sizes = array("I", [len(items) for items in self._levels])
+        header: bytes = _KLL.pack(
+            MAGIC, FORMAT_VERSION, self.k, len(self._levels), self.count, self.minimum, self.maximum, self._parity,
+        )
+        return b"".join([header, sizes.tobytes(), *(items.tobytes() for items in self._levels)])
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, memoryview]) -> "KLLSketch":
+        """
+        Rebuilds a sketch from to_bytes() output.
+
+        Raises:
+            SummaryError: If the data is malformed or of another version.
+        """
+        sketch, _ = cls._read(memoryview(data), 0)
+        return sketch
+
+    @classmethod
+    def _read(cls, view: memoryview, pos: int) -> Tuple["KLLSketch", int]:
+        """Decodes a sketch at an offset, returning it and the offset after it."""
+        try:
+            magic, version, k, n_levels, count, minimum, maximum, parity = _KLL.unpack_from(view, pos)
+        except struct.error:
+            raise SummaryError("Data ends in the middle of a sketch") from None
+        if magic != MAGIC:
+            raise SummaryError("Not a serialized sketch")
+        if version != FORMAT_VERSION:
+            raise SummaryError(f"Unsupported sketch version {version}")
+        pos += _KLL.size
+        sizes = array("I")
+        sizes.frombytes(view[pos:pos + 4 * n_levels])
+        pos += 4 * n_levels
+        sketch = cls(k)
+        sketch.count, sketch.minimum, sketch.maximum, sketch._parity = count, minimum, maximum, parity
+        sketch._levels = []
+        for size in sizes:
+            items: np.ndarray = np.frombuffer(view[pos:pos + 8 * size], dtype=np.float64).copy()
+            if len(items) != size:
+                raise SummaryError("Data ends in the middle of a sketch")
+            sketch._levels.append(items)
+            pos += 8 * size
+        if len(sketch._levels) != n_levels or not n_levels:
+            raise SummaryError("Data ends in the middle of a sketch")
+        return sketch, pos
+
+
+class PointsHistogram:
+    """
+    Exact counts of each per-shot points value; a miss counts as 0 points.
+
+    Per-shot points only take the few values of the animals, so the histogram
+    stays tiny however many shots it has counted.
+
+    Attributes:
+        counts (Dict[int, int]): The number of shots per points value.
+    """
+    def __init__(self):
+        """Initializes an empty PointsHistogram instance."""
+        self.counts: Dict[int, int] = {}
+
+    def update(self, points: int, count: int = 1) -> None:
+        """
+        Counts shots that earned a number of points.
+
+        Args:
+            points: The points earned by each shot, 0 for a miss.
+            count: The number of such shots.
+        """
+        self.counts[points] = self.counts.get(points, 0) + count
+
+    def update_many(self, points: Iterable[int]) -> None:
+        """
+        Counts many shots at once.
+
+        Args:
+            points: The points earned by each shot, e.g. a NumPy array.
+        """
+        values, counts = np.unique(np.asarray(points if isinstance(points, (np.ndarray, list, tuple)) else list(points), dtype=np.int64), return_counts=True)
+        for value, count in zip(values.tolist(), counts.tolist()):
+            self.update(value, count)
+
+    def merge(self, other: "PointsHistogram") -> None:
+        """Adds another histogram's counts to this one."""
+        for points, count in other.counts.items():
+            self.update(points, count)
+
+    @property
+    def shots(self) -> int:
+        """The number of shots counted."""
+        return sum(self.counts.values())
+
+    @property
+    def mean(self) -> float:
+        """The average points per shot, or 0.0 without shots."""
+        shots: int = self.shots
+        return sum(points * count for points, count in self.counts.items()) / shots if shots else 0.0
+
+    def quantile(self, q: float) -> int:
+        """
+        Returns the exact points quantile of a single shot.
+
+        Args:
+            q: A fraction between 0 and 1.
+
+        Raises:
+            ValueError: If there are no shots or q is out of range.
+        """
+        if not self.counts:
+            raise ValueError("An empty histogram has no quantiles.")
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("Quantiles must be between 0 and 1.")
+        target: float = q * self.shots
+        seen: int = 0
+        for points in sorted(self.counts):
+            seen += self.counts[points]
+            if seen >= target:
+                return points
+        return max(self.counts)
+
+
+class GunHitRates:
+    """
+    Shots and hits per gun.
+
+    Attributes:
+        guns (Dict[str, List[int]]): [shots, hits] per gun name.
+    """
+    def __init__(self):
+        """Initializes an empty GunHitRates instance."""
+        self.guns: Dict[str, List[int]] = {}
+
+    def update(self, gun: str, shots: int, hits: int) -> None:
+        """
+        Counts shots fired with a gun.
+
+        Args:
+            gun: The gun's name.
+            shots: The number of shots fired.
+            hits: How many of them hit.
+        """
+        counts: List[int] = self.guns.setdefault(gun, [0, 0])
+        counts[0] += shots
+        counts[1] += hits
+
+    def merge(self, other: "GunHitRates") -> None:
+        """Adds another instance's counts to this one."""
+        for gun, (shots, hits) in other.guns.items():
+            self.update(gun, shots, hits)
+
+    def rate(self, gun: str) -> float:
+        """Returns the fraction of a gun's shots that hit, or 0.0 without shots."""
+        shots, hits = self.guns.get(gun, (0, 0))
+        return hits / shots if shots else 0.0
+
+    def rates(self) -> Dict[str, float]:
+        """Returns the hit rate of every gun, by name."""
+        return {gun: self.rate(gun) for gun in sorted(self.guns)}
+
+
+class ScoreSummary:
+    """
+    Mergeable statistics of a set of games.
+
+    Attributes:
+        final_scores (KLLSketch): Quantiles of the games' final scores.
+        final_stats (RunningStats): Count, mean, variance, minimum and maximum of the final scores.
+        shot_points (PointsHistogram): The points of every shot, 0 for a miss.
+        guns (GunHitRates): Shots and hits per gun.
+    """
+    def __init__(self, k: int = 200):
+        """
+        Initializes an empty ScoreSummary instance.
+
+        Args:
+            k: The accuracy parameter of the final score sketch.
+        """
+        self.final_scores: KLLSketch = KLLSketch(k)
+        self.final_stats: RunningStats = RunningStats()
+        self.shot_points: PointsHistogram = PointsHistogram()
+        self.guns: GunHitRates = GunHitRates()
+
+    def record_shot(self, gun: str, points: int, hit: bool) -> None:
+        """
+        Records one shot.
+
+        Args:
+            gun: The name of the gun fired.
+            points: The points earned, 0 for a miss.
+            hit: Whether the shot hit, as returned by Player.shoot. Not derived from
+                points, as an animal may be worth 0 or fewer points.
+        """
+        self.shot_points.update(points)
+        self.guns.update(gun, 1, hit)
+
+    def record_game(self, final_score: int) -> None:
+        """
+        Records a finished game.
+
+        Args:
+            final_score: The game's final score.
+        """
+        self.final_scores.update(final_score)
+        self.final_stats.update(final_score)
+
+    def record_games(self, final_scores: Sequence[int]) -> None:
+        """Records many finished games at once, e.g. a NumPy array of final scores."""
+        self.final_scores.update_many(final_scores)
+        self.final_stats.update_many(int(score) for score in final_scores)
+
+    def merge(self, other: "ScoreSummary") -> None:
+        """
+        Folds another summary into this one.
+
+        Args:
+            other: The summary to merge in; it is left unchanged.
+        """
+        self.final_scores.merge(other.final_scores)
+        self.final_stats.merge(other.final_stats)
+        self.shot_points.merge(other.shot_points)
+        self.guns.merge(other.guns)
+
+    def report(self, qs: Sequence[float] = (0.5, 0.9, 0.99)) -> str:
+        """
+        Formats the summary for the console.
+
+        Args:
+            qs: The final score quantiles listed.
+
+        Returns:
+            A multi-line, human-readable summary.
+        """
+        stats: RunningStats = self.final_stats
+        lines: List[str] = [f"Games: {stats.count}", f"Mean Final Score: {stats.mean:.2f}"]
+        if stats.count:
+            quantiles: List[float] = self.final_scores.quantiles(qs)
+            lines.append("Final Score " + ", ".join(f"p{q * 100:g}: {value:g}" for q, value in zip(qs, quantiles)))
+        lines.append(f"Shots: {self.shot_points.shots}, Mean Points per Shot: {self.shot_points.mean:.2f}")
+        for gun, rate in self.guns.rates().items():
+            lines.append(f"  {gun}: {rate:.2%} hit rate over {self.guns.guns[gun][0]} shots")
+        return "\n".join(lines)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the summary.
+
+        Returns:
+            The sketch, the final score statistics, the histogram and the gun counts.
+        """
+        stats: RunningStats = self.final_stats
+        parts: List[bytes] = [
+            self.final_scores.to_bytes(),
+            _RUNNING.pack(stats.count, stats.total, stats.minimum or 0, stats.maximum or 0, stats.mean, stats._m2),
+            _COUNT.pack(len(self.shot_points.counts)),
+            array("q", self.shot_points.counts.keys()).tobytes(),
+            array("q", self.shot_points.counts.values()).tobytes(),
+            _COUNT.pack(len(self.guns.guns)),
+        ]
+        for gun, (shots, hits) in self.guns.guns.items():
+            name: bytes = gun.encode()
+            parts += [_GUN.pack(len(name), shots, hits), name]
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, memoryview]) -> "ScoreSummary":
+        """
+        Rebuilds a summary from to_bytes() output.
+
+        Raises:
+            SummaryError: If the data is malformed or of another version.
+        """
+        view = memoryview(data)
+        sketch, pos = KLLSketch._read(view, 0)
+        summary = cls(sketch.k)
+        summary.final_scores = sketch
+        try:
+            count, total, minimum, maximum, mean, m2 = _RUNNING.unpack_from(view, pos)
+            pos += _RUNNING.size
+            stats: RunningStats = summary.final_stats
+            stats.count, stats.total, stats.mean, stats._m2 = count, total, mean, m2
+            stats.minimum, stats.maximum = (minimum, maximum) if count else (None, None)
+            (distinct,) = _COUNT.unpack_from(view, pos)
+            pos += _COUNT.size
+            values, counts = array("q"), array("q")
+            values.frombytes(view[pos:pos + 8 * distinct])
+            counts.frombytes(view[pos + 8 * distinct:pos + 16 * distinct])
+            if len(counts) != distinct:
+                raise SummaryError("Data ends in the middle of the points histogram")
+            summary.shot_points.counts = dict(zip(values, counts))
+            pos += 16 * distinct
+            (n_guns,) = _COUNT.unpack_from(view, pos)
+            pos += _COUNT.size
+            for _ in range(n_guns):
+                name_length, shots, hits = _GUN.unpack_from(view, pos)
+                pos += _GUN.size
+                summary.guns.guns[bytes(view[pos:pos + name_length]).decode()] = [shots, hits]
+                pos += name_length
+        except struct.error:
+            raise SummaryError("Data ends in the middle of the summary") from None
+        return summary
+
+
+class StatsSink(OutputSink):
+    """
+    Fills a ScoreSummary from the messages of a game, discarding the text.
+
+    Attributes:
+        summary (ScoreSummary): The summary updated.
+        gun (Optional[str]): The name of the gun selected last.
+    """
+    def __init__(self, summary: Optional[ScoreSummary] = None):
+        """
+        Initializes a StatsSink instance.
+
+        Args:
+            summary: The summary to update. Defaults to a new one.
+        """
+        self.summary: ScoreSummary = summary if summary is not None else ScoreSummary()
+        self.gun: Optional[str] = None
+        self._final_score: Optional[int] = None
+
+    def emit(self, event: str, template: str, **fields: Any) -> None:
+        """Records shots, volleys and final scores."""
+        if event == "gun_selected":
+            self.gun = fields["gun"]
+        elif event == "shot_hit":
+            self.summary.record_shot(self.gun, fields["points"], True)
+        elif event == "shot_miss":
+            self.summary.record_shot(self.gun, 0, False)
+        elif event == "volley":
+            self.summary.shot_points.update_many(fields["scores"])
+            self.summary.shot_points.update(0, fields["shots"] - fields["hits"])
+            self.summary.guns.update(self.gun, fields["shots"], fields["hits"])
+        elif event == "final_score":
+            self._final_score = fields["score"]
+        elif event == "game_over" and self._final_score is not None:
+            self.summary.record_game(self._final_score)
+            self._final_score = None
@@ -0,0 +1,85 @@
+import itertools
+import unittest
+import numpy as np
+from analytics import pair_statistics, score_distribution, shot_distribution
+from catalog import CatalogAnimal
+from shooting_game import Bear, Deer, Rifle, Shotgun
+from simulation import simulate_sessions
+
+class TestScoreDistribution(unittest.TestCase):
+    """Test cases for the exact score distribution calculator."""
+    def setUp(self):
+        """Set up the default animals used by the game."""
+        self.animals = [Deer(), Bear()]
+
+    def brute_force(self, accuracy, points, spawn, shots):
+        """Enumerate every sequence of shot outcomes."""
+        outcomes = [(0, 1.0 - accuracy)] + [(value, accuracy * p) for value, p in zip(points, spawn)]
+        totals = {}
+        for sequence in itertools.product(outcomes, repeat=shots):
+            score = sum(value for value, _ in sequence)
+            totals[score] = totals.get(score, 0.0) + float(np.prod([p for _, p in sequence]))
+        return totals
+
+    def test_matches_enumeration(self):
+        """Test that small sessions match an exhaustive enumeration, including weights and negative points."""
+        animals = [CatalogAnimal(-5), CatalogAnimal(10), CatalogAnimal(25)]
+        weights = [1.0, 3.0, 2.0]
+        distribution = score_distribution(Rifle(), animals, 4, weights)
+        expected = self.brute_force(0.8, [-5, 10, 25], [1 / 6, 3 / 6, 2 / 6], 4)
+        for score, probability in expected.items():
+            self.assertAlmostEqual(distribution.probability(score), probability)
+        self.assertAlmostEqual(distribution.probabilities.sum(), 1.0)
+        self.assertEqual(distribution.probability(3), 0.0, "Scores off the grid should be impossible.")
+
+    def test_moments_of_long_sessions(self):
+        """Test that thousands of shots keep the distribution normalized with the closed-form moments."""
+        distribution = score_distribution(Shotgun(), self.animals, 5000)
+        scores = distribution.scores
+        mean = (scores * distribution.probabilities).sum()
+        variance = ((scores - mean) ** 2 * distribution.probabilities).sum()
+        self.assertEqual(distribution.step, 10, "Points should be reduced by their common divisor.")
+        self.assertAlmostEqual(distribution.probabilities.sum(), 1.0)
+        self.assertAlmostEqual(mean, distribution.mean, places=6)
+        self.assertAlmostEqual(variance / distribution.variance, 1.0, places=6)
+        self.assertEqual(distribution.mean, 5000 * 0.5 * 15)
+
+    def test_cdf_and_quantile(self):
+        """Test cumulative probabilities and quantiles."""
+        distribution = shot_distribution(Rifle(), self.animals)
+        self.assertAlmostEqual(distribution.cdf(-1), 0.0)
+        self.assertAlmostEqual(distribution.cdf(0), 0.2)
+        self.assertAlmostEqual(distribution.cdf(15), 0.6)
+        self.assertAlmostEqual(distribution.cdf(20), 1.0)
+        self.assertEqual(distribution.quantile(0.5), 10)
+        self.assertEqual(distribution.quantile(1.0), 20)
+        with self.assertRaises(ValueError):
+            distribution.quantile(1.5)
+
+    def test_agrees_with_simulation(self):
+        """Test that simulated sessions follow the computed distribution."""
+        distribution = score_distribution(Rifle(), self.animals, 20)
+        scores = simulate_sessions(Rifle(), self.animals, 200_000, 20, seed=4)
+        for score in (200, 240, 280):
+            self.assertAlmostEqual(np.mean(scores == score), distribution.probability(score), delta=0.005)
+
+    def test_pair_statistics(self):
+        """Test the expected points and variance of every gun and animal pair."""
+        rows = {(row.gun, row.animal): row for row in pair_statistics([Rifle(), Shotgun()], self.animals, [3.0, 1.0])}
+        self.assertEqual(len(rows), 4)
+        self.assertAlmostEqual(rows["Rifle", "Bear"].mean, 16.0)
+        self.assertAlmostEqual(rows["Rifle", "Bear"].variance, 0.8 * 0.2 * 400)
+        self.assertAlmostEqual(rows["Shotgun", "Deer"].spawn_probability, 0.75)
+
+    def test_invalid_arguments(self):
+        """Test that invalid shot counts and weights are rejected."""
+        with self.assertRaises(ValueError):
+            score_distribution(Rifle(), self.animals, -1)
+        with self.assertRaises(ValueError):
+            score_distribution(Rifle(), self.animals, 10, [1.0])
+        with self.assertRaises(ValueError):
+            score_distribution(Rifle(), [], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from batch import read_commands, run_batch
+from output import NullSink
+from rng import RandomService
+from shooting_game import Game, main
+
+class TestBatch(unittest.TestCase):
+    """Test cases for the non-interactive batch mode."""
+    def test_read_commands_across_chunks(self):
+        """Test that lines split across chunk boundaries are reassembled."""
+        stream = io.StringIO("1\n 11 \n2\r\nlast")
+        self.assertEqual(list(read_commands(stream, chunk_size=3)), ["1", "11", "2", "last"])
+
+    def test_run_batch_report(self):
+        """Test that a script is played to the end and summarized."""
+        commands = ["x", "1"] + ["1"] * 100 + ["9", "2", "1", "1"]
+        report = run_batch(commands, rng=RandomService(5))
+        self.assertEqual(report.commands, 104, "Commands after the game ends should not be read.")
+        self.assertEqual(report.gun, "Rifle")
+        self.assertEqual(report.shots, 100)
+        self.assertEqual(report.invalid, 2)
+        self.assertGreater(report.hits, 60)
+        self.assertIn("Final Score: {}".format(report.points), report.summary())
+
+    def test_run_batch_matches_interactive_game(self):
+        """Test that a batch plays the same game as the interactive loop with the same seed."""
+        script = ["2"] + ["1"] * 50 + ["2"]
+        commands = iter(script)
+        game = Game(sink=NullSink(), rng=RandomService(8), input_func=lambda prompt: next(commands))
+        game.start_game()
+        self.assertEqual(run_batch(script, rng=RandomService(8)).points, game.player.points)
+
+    def test_action_log_and_unfinished_script(self):
+        """Test the compact log and that a script without "2" still ends the game."""
+        log = io.StringIO()
+        with patch('random.random', return_value=0.0), patch('random.choice', side_effect=lambda animals: animals[1]):
+            report = run_batch(["1", "abc", "1"], log_stream=log)
+        self.assertEqual(log.getvalue().splitlines(), ["gun Rifle", "invalid", "Bear +20", "end 20"])
+        self.assertEqual(report.points, 20)
+
+    def test_main_batch_command(self):
+        """Test the batch subcommand reading a script from stdin."""
+        with patch('sys.stdin', io.StringIO("1\n1\n1\n2\n")), patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            main(["batch", "--seed", "3"])
+        self.assertIn("Shots: 2", stdout.getvalue())
+
+    def test_main_batch_metrics(self):
+        """Test that --metrics counts the shots of a batch game."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics.json")
+            with patch('sys.stdin', io.StringIO("1\n1\n1\n2\n")), patch('sys.stdout', new_callable=io.StringIO):
+                main(["--metrics", path, "batch", "--seed", "3"])
+            with open(path) as handle:
+                counters = json.load(handle)["counters"]
+        self.assertEqual(counters["shots_hit"] + counters["shots_missed"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import io # For capturing print output
+from benchmarks import build_cases, compare, main, measure, run_benchmarks
+
+class TestBenchmarks(unittest.TestCase):
+    """Test cases for the benchmark suite."""
+    def test_measure(self):
+        """Test that measure reports throughput and latency percentiles."""
+        calls = []
+        result = measure(lambda: calls.append(1), iterations=100, repeat=2, latency_samples=10)
+        self.assertEqual(len(calls), 210, "Each repeat and latency sample should call the function.")
+        self.assertGreater(result["ops_per_sec"], 0)
+        self.assertLessEqual(result["p50_ns"], result["p99_ns"])
+
+    def test_measure_resets_between_repeats(self):
+        """Test that state kept by the measured operation is reset before each repeat and the latency samples."""
+        calls = []
+        measure(lambda: calls.append(1), iterations=100, repeat=3, latency_samples=10, reset=calls.clear)
+        self.assertEqual(len(calls), 10, "Only the latency samples should remain.")
+
+    def test_event_cases_have_their_own_sinks(self):
+        """Test that every case collecting events gets its own sink and a reset."""
+        with open(os.devnull, "w") as devnull:
+            cases = [case for case in build_cases(devnull, scale=0.001) if "[event" in case[0]]
+        self.assertTrue(all(reset is not None for _, _, _, reset in cases))
+        self.assertEqual(len({id(reset.__self__) for _, _, _, reset in cases}), len(cases), "No two cases should share a sink.")
+
+    def test_run_benchmarks_select(self):
+        """Test that a selected subset of benchmarks runs and covers every output mode."""
+        results = run_benchmarks(scale=0.001, repeat=1, select="player.shoot")
+        self.assertEqual(
+            sorted(results["results"]),
+            ["player.shoot[buffered]", "player.shoot[console]", "player.shoot[event]", "player.shoot[null]"],
+        )
+        self.assertIn("python", results["meta"])
+
+    def test_compare_flags_regressions(self):
+        """Test that a throughput drop beyond the threshold is a regression."""
+        baseline = {"results": {"a": {"ops_per_sec": 100.0}, "b": {"ops_per_sec": 100.0}, "c": {"ops_per_sec": 1.0}}}
+        current = {"results": {"a": {"ops_per_sec": 95.0}, "b": {"ops_per_sec": 80.0}}}
+        rows = {row["name"]: row for row in compare(baseline, current, threshold=0.10)}
+        self.assertFalse(rows["a"]["regression"], "A 5% drop should be within the threshold.")
+        self.assertTrue(rows["b"]["regression"], "A 20% drop should be a regression.")
+        self.assertNotIn("c", rows, "Cases missing from the current run should be skipped.")
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_main_run_and_compare(self, mock_stdout):
+        """Test the run and compare commands end to end."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.json")
+            self.assertEqual(main(["run", "--output", path, "--scale", "0.001", "--repeat", "1", "--select", "gun.fire"]), 0)
+            with open(path) as handle:
+                self.assertIn("gun.fire", json.load(handle)["results"])
+            self.assertEqual(main(["compare", path, path]), 0, "A run compared with itself should not regress.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from catalog import Catalog, CatalogError, cache_path, load_catalog, parse_catalog
+from output import EventSink
+from rng import RandomService
+from shooting_game import Game
+
+CATALOG_TOML = """
+[[guns]]
+name = "Crossbow"
+accuracy = 0.7
+
+[[animals]]
+name = "Rabbit"
+points = 5
+weight = 3
+
+[[animals]]
+name = "Moose"
+points = 40
+weight = 1
+behavior = "The moose lowers its antlers."
+"""
+
+class TestCatalog(unittest.TestCase):
+    """Test cases for catalog loading and validation."""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "catalog.toml")
+        with open(self.path, "w") as handle:
+            handle.write(CATALOG_TOML)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_toml_and_json(self):
+        """Test that TOML and JSON catalogs load to the same entries."""
+        catalog = load_catalog(self.path, use_cache=False)
+        json_path = os.path.join(self.directory.name, "catalog.json")
+        with open(json_path, "w") as handle:
+            json.dump({
+                "guns": [{"name": "Crossbow", "accuracy": 0.7}],
+                "animals": [
+                    {"name": "Rabbit", "points": 5, "weight": 3},
+                    {"name": "Moose", "points": 40, "weight": 1, "behavior": "The moose lowers its antlers."},
+                ],
+            }, handle)
+        from_json = load_catalog(json_path, use_cache=False)
+        self.assertEqual(catalog.guns, from_json.guns)
+        self.assertEqual(catalog.animals, from_json.animals)
+        self.assertEqual(catalog.animals[0].weight, 3.0)
+        self.assertTrue(catalog.has_weights)
+
+    def test_toml_without_tomllib(self):
+        """Test that a TOML catalog is rejected cleanly where tomllib is missing."""
+        with patch('catalog.tomllib', None):
+            with self.assertRaises(CatalogError):
+                load_catalog(self.path, use_cache=False)
+
+    def test_invalid_entries(self):
+        """Test that malformed entries are rejected."""
+        valid_gun = {"name": "Rifle", "accuracy": 0.8}
+        valid_animal = {"name": "Deer", "points": 10}
+        for data in [
+            [],
+            {"guns": [valid_gun]},
+            {"animals": [valid_animal]},
+            {"guns": [{"name": "Rifle"}], "animals": [valid_animal]},
+            {"guns": [{"name": "Rifle", "accuracy": 1.5}], "animals": [valid_animal]},
+            {"guns": [valid_gun], "animals": [{"name": "Deer", "points": "10"}]},
+            {"guns": [valid_gun], "animals": [{"name": "Deer", "points": True}]},
+            {"guns": [valid_gun], "animals": [{"name": "Deer", "points": 10, "weight": -1}]},
+            {"guns": [valid_gun], "animals": [{"name": "Deer", "points": 10, "weight": 0}]},
+            {"guns": [valid_gun], "animals": [valid_animal, valid_animal]},
+        ]:
+            with self.subTest(data=data), self.assertRaises(CatalogError):
+                parse_catalog(data)
+        with open(self.path, "w") as handle:
+            handle.write("[[guns]\n")
+        with self.assertRaises(CatalogError):
+            load_catalog(self.path)
+
+    def test_cache_skips_reparse(self):
+        """Test that an unchanged catalog is loaded from its cache, and an edited one is reparsed."""
+        first = load_catalog(self.path)
+        self.assertTrue(os.path.exists(cache_path(self.path)))
+        with patch("catalog.parse_catalog") as parse:
+            second = load_catalog(self.path)
+        parse.assert_not_called()
+        self.assertEqual(first.guns, second.guns)
+        self.assertEqual(first.animals, second.animals)
+
+        with open(self.path, "a") as handle:
+            handle.write('\n[[guns]]\nname = "Sling"\naccuracy = 0.3\n')
+        self.assertEqual([gun.name for gun in load_catalog(self.path).guns], ["Crossbow", "Sling"])
+
+    def test_cache_is_replaced_on_edit(self):
+        """Test that rebuilding the cache of an edited catalog replaces its previous cache file."""
+        cache_dir = os.path.join(self.directory.name, "cache")
+        for index in range(3):
+            with open(self.path, "a") as handle:
+                handle.write(f'\n[[guns]]\nname = "Sling {index}"\naccuracy = 0.3\n')
+            self.assertEqual(len(load_catalog(self.path, cache_dir=cache_dir).guns), index + 2)
+        self.assertEqual(os.listdir(cache_dir), [os.path.basename(cache_path(self.path, cache_dir))])
+        other = os.path.join(self.directory.name, "other", "catalog.toml")
+        self.assertNotEqual(cache_path(other, cache_dir), cache_path(self.path, cache_dir))
+
+    def test_corrupt_cache_is_rebuilt(self):
+        """Test that a damaged cache file falls back to parsing the catalog."""
+        cache_dir = os.path.join(self.directory.name, "cache")
+        load_catalog(self.path, cache_dir=cache_dir)
+        for name in os.listdir(cache_dir):
+            with open(os.path.join(cache_dir, name), "r+b") as handle:
+                handle.seek(32 + 5) # Past the digest, magic and version
+                handle.write(b"garbage")
+                handle.truncate()
+        self.assertEqual(len(load_catalog(self.path, cache_dir=cache_dir).animals), 2)
+        with self.assertRaises(CatalogError):
+            Catalog.from_bytes(b"nope")
+
+    def test_game_uses_catalog(self):
+        """Test that a Game built from a catalog plays with its guns and animals."""
+        sink = EventSink()
+        commands = iter(["1", "1", "1", "2"])
+        game = Game(sink=sink, rng=RandomService(3), input_func=lambda prompt: next(commands), catalog=load_catalog(self.path))
+        self.assertEqual([gun.name for gun in game.guns], ["Crossbow"])
+        self.assertEqual([animal.name for animal in game.animals], ["Rabbit", "Moose"])
+        self.assertIsNotNone(game.spawn_table)
+        game.start_game()
+        options = [event["gun"] for event in sink.events if event["event"] == "gun_option"]
+        self.assertEqual(options, ["Crossbow"])
+        selected = [event["gun"] for event in sink.events if event["event"] == "gun_selected"]
+        self.assertEqual(selected, ["Crossbow"])
+        spawned = [event["animal"] for event in sink.events if event["event"] == "animal_appear"]
+        self.assertEqual(len(spawned), 2)
+        self.assertTrue(set(spawned) <= {"Rabbit", "Moose"})
+
+    def test_default_catalog_matches_builtin_game(self):
+        """Test that the shipped catalog describes the built-in guns and animals."""
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog.toml")
+        catalog = load_catalog(path, use_cache=False)
+        game = Game()
+        self.assertEqual([(gun.name, gun.accuracy) for gun in catalog.build_guns()], [(gun.name, gun.accuracy) for gun in game.guns])
+        self.assertEqual([(animal.name, animal.points_value) for animal in catalog.build_animals()], [(animal.name, animal.points_value) for animal in game.animals])
+        self.assertFalse(catalog.has_weights)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from events import HIT, MISS, SCORE, VOLLEY, EventBus
+from output import NullSink
+from shooting_game import Bear, Deer, Player, Rifle, ScoreBoard
+from unittest.mock import patch
+
+class TestEventBus(unittest.TestCase):
+    """Test cases for the batched event bus."""
+    def setUp(self):
+        self.bus = EventBus(max_pending=4)
+        self.batches = []
+        self.bus.subscribe(self.batches.append)
+
+    def test_flush_delivers_one_batch(self):
+        """Test that subscribers get every pending event in one call, and nothing for an empty flush."""
+        second = []
+        self.bus.subscribe(second.append)
+        self.bus.publish(HIT, "a", 10)
+        self.bus.publish(SCORE, "a", 10)
+        self.bus.publish(MISS, "b")
+        self.assertEqual(self.batches, [], "Publishing alone should not call subscribers.")
+        self.bus.flush()
+        self.bus.flush()
+        self.assertEqual(len(self.batches), 1)
+        self.assertIs(second[0], self.batches[0], "Every subscriber should share the batch.")
+        batch = self.batches[0]
+        self.assertEqual((len(batch), batch.hits, batch.misses, batch.scores, batch.points), (3, 1, 1, [10], 10))
+        split = batch.by_source()
+        self.assertEqual(list(split), ["a", "b"])
+        self.assertEqual(split["b"].misses, 1)
+
+    def test_flushes_when_max_pending_is_reached(self):
+        """Test that the bus flushes itself once max_pending events are waiting."""
+        for value in range(10):
+            self.bus.publish(SCORE, None, value)
+        self.assertEqual([batch.scores for batch in self.batches], [[0, 1, 2, 3], [4, 5, 6, 7]])
+        self.assertEqual(self.bus.pending, 2)
+        with self.assertRaises(ValueError):
+            EventBus(max_pending=0)
+
+    def test_events_published_by_subscribers_go_to_the_next_batch(self):
+        """Test that a subscriber publishing during a flush does not see its own event in the same batch."""
+        self.bus.subscribe(lambda batch: self.bus.publish(MISS, None) if batch.hits else None)
+        self.bus.publish(HIT, None, 5)
+        self.bus.flush()
+        self.assertEqual(self.bus.pending, 1)
+        self.bus.flush()
+        self.assertEqual([batch.misses for batch in self.batches], [0, 1])
+        self.bus.unsubscribe(self.batches.append)
+        self.bus.publish(HIT, None, 5)
+        self.bus.flush()
+        self.assertEqual(len(self.batches), 2)
+
+    def test_player_publishes_shots_and_scores(self):
+        """Test that shooting publishes hits, misses and scores, and the scoreboard records the scores."""
+        player = Player(sink=NullSink(), bus=self.bus)
+        scoreboard = ScoreBoard(sink=NullSink())
+        self.bus.subscribe(scoreboard.handle_events)
+        player.choose_gun(Rifle())
+        with patch.object(Rifle, 'fire', side_effect=[True, False]):
+            player.shoot(Deer())
+            player.shoot(Deer())
+        player.add_points(3)
+        self.bus.flush()
+        self.assertEqual(self.batches[0].events, [(HIT, player, 10), (SCORE, player, 10), (MISS, player, 0), (SCORE, player, 3)])
+        self.assertEqual(scoreboard.score_history, [10, 3])
+        with patch.object(Rifle, 'fire_many', return_value=[True, False, True]):
+            player.shoot_many([Deer(), Bear(), Bear()])
+        self.bus.flush()
+        self.assertEqual(self.batches[1].events, [(VOLLEY, player, (2, 1)), (SCORE, player, 30)], "A volley should publish one event.")
+        self.assertEqual((self.batches[1].hits, self.batches[1].misses), (2, 1))
+        self.assertEqual(scoreboard.score_history, [10, 3, 30], "A volley should score once.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -189,5 +189,59 @@ class TestGame(unittest.TestCase):
         # Assert that start_game() was called on the instance returned by Game().
         mock_game_instance.start_game.assert_called_once()
 
+    def test_scripted_input_and_seeded_rng(self):
+        """Test that a Game can be driven by input_func and replayed with a seeded RNG."""
+        import random
+        from output import NullSink
+
+        def play():
+            commands = iter(['1', '1', '1', '1', '2'])
+            game = Game(sink=NullSink(), rng=random.Random(99), input_func=lambda prompt: next(commands))
+            game.start_game()
+            return game
+
+        first, second = play(), play()
+        self.assertIs(first.player.selected_gun, first.guns[0], "The scripted gun choice should be used.")
+        self.assertFalse(first.is_game_running, "The scripted '2' should end the game.")
+        self.assertEqual(first.player.points, second.player.points, "The same seed should give the same score.")
+
+    def test_begin_and_handle_input(self):
+        """Test driving a game by pushing commands through handle_input."""
+        from output import EventSink
+        sink = EventSink()
+        game = Game(sink=sink)
+        game.begin()
+        self.assertTrue(game.awaiting_gun, "A gun should be requested after begin().")
+        game.handle_input('abc')
+        self.assertTrue(game.awaiting_gun, "An invalid gun choice should keep asking for a gun.")
+        game.handle_input('2')
+        self.assertIs(game.player.selected_gun, game.guns[1])
+        game.handle_input('1')
+        game.handle_input('2')
+        self.assertFalse(game.is_game_running, "'2' should end the game.")
+        events = [event["event"] for event in sink.events]
+        self.assertEqual(events.count("gun_menu"), 2, "The gun menu should be shown again after invalid input.")
+        self.assertEqual(events[-1], "game_over")
+
+    def test_scoreboard_follows_the_game(self):
+        """Test that the player's scores reach the scoreboard once per command through the event bus."""
+        from output import NullSink
+        from rng import RandomService
+        game = Game(sink=NullSink(), rng=RandomService(5))
+        game.begin()
+        game.handle_input('1')
+        hits = []
+        game.bus.subscribe(lambda batch: hits.append(batch.hits))
+        for _ in range(20):
+            game.handle_input('1')
+        self.assertEqual(game.bus.pending, 0, "Every command should flush the bus.")
+        self.assertEqual(len(hits), 20, "Subscribers should be called once per command.")
+        self.assertEqual(game.scoreboard.total_score, game.player.points)
+        self.assertEqual(game.scoreboard.stats.count, sum(hits))
+        game.scoreboard = ScoreBoard(sink=NullSink())
+        game.handle_input('1')
+        game.handle_input('2')
+        self.assertEqual(game.scoreboard.stats.count, hits[-1], "A replaced scoreboard should receive later scores.")
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import patch
+from rng import RandomService
 from shooting_game import Rifle, Shotgun
 
 class TestRifle(unittest.TestCase):
@@ -38,6 +39,21 @@ class TestShotgun(unittest.TestCase):
         mock_random.return_value = 0.6 # Simulate a random value that results in a miss
         self.assertFalse(self.shotgun.fire(), "Shotgun should miss.")
 
+class TestFireMany(unittest.TestCase):
+    """Test cases for Gun.fire_many."""
+    def test_fire_many_with_random_service(self):
+        """Test that a RandomService resolves a volley as one bool array at the gun's accuracy."""
+        hits = Rifle(rng=RandomService(5)).fire_many(20_000)
+        self.assertEqual(hits.dtype, bool)
+        self.assertEqual(len(hits), 20_000)
+        self.assertAlmostEqual(hits.mean(), 0.8, delta=0.01)
+
+    @patch('random.random')
+    def test_fire_many_with_random_module(self, mock_random):
+        """Test that without random_many each shot is drawn like fire()."""
+        mock_random.side_effect = [0.1, 0.6, 0.4]
+        self.assertEqual(Shotgun().fire_many(3), [True, False, True])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,64 @@
+import random
+import unittest
+from leaderboard import Leaderboard
+from shooting_game import Player
+from output import NullSink
+
+class TestLeaderboard(unittest.TestCase):
+    """Test cases for the Leaderboard class."""
+    def setUp(self):
+        """Set up an empty Leaderboard instance before each test."""
+        self.leaderboard = Leaderboard()
+
+    def test_update_and_top(self):
+        """Test that top returns the best players in order."""
+        for player_id, score in [(1, 30), (2, 50), (3, 10), (4, 50)]:
+            self.leaderboard.update(player_id, score)
+        self.assertEqual(self.leaderboard.top(3), [(2, 50), (4, 50), (1, 30)], "Ties should be ordered by player id.")
+        self.assertEqual(self.leaderboard.top(0), [])
+
+    def test_rank_after_updates(self):
+        """Test that ranks follow score changes."""
+        self.leaderboard.update(1, 10)
+        self.leaderboard.update(2, 20)
+        self.assertEqual(self.leaderboard.rank(1), 2)
+        self.leaderboard.add_points(1, 15)
+        self.assertEqual(self.leaderboard.rank(1), 1, "Player 1 should move to the top.")
+        self.assertEqual(self.leaderboard.score(1), 25)
+
+    def test_remove(self):
+        """Test that removed players are no longer ranked."""
+        self.leaderboard.update(1, 10)
+        self.leaderboard.remove(1)
+        self.assertNotIn(1, self.leaderboard)
+        with self.assertRaises(KeyError):
+            self.leaderboard.rank(1)
+
+    def test_matches_full_sort(self):
+        """Test ranks and top K against a full sort over many random updates."""
+        rng = random.Random(0)
+        scores = {}
+        for _ in range(20_000):
+            player_id = rng.randrange(3_000)
+            points = rng.randrange(100)
+            self.leaderboard.add_points(player_id, points)
+            scores[player_id] = scores.get(player_id, 0) + points
+        expected = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        self.assertEqual(self.leaderboard.top(25), expected[:25])
+        for position in range(0, len(expected), 97):
+            player_id = expected[position][0]
+            self.assertEqual(self.leaderboard.rank(player_id), position + 1)
+
+    def test_attach_player(self):
+        """Test that an attached player's points keep the leaderboard up to date."""
+        player = Player(sink=NullSink())
+        self.leaderboard.update(2, 15)
+        self.leaderboard.attach(player, 1)
+        player.add_points(10)
+        player.add_points(10)
+        self.assertEqual(self.leaderboard.score(1), 20)
+        self.assertEqual(self.leaderboard.top(1), [(1, 20)])
+
+
+if __name__ == '__main__':
+    unittest.main()
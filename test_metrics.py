@@ -0,0 +1,124 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from events import EventBus
+from metrics import Histogram, Metrics, instrument, instrumented, uninstrument
+from output import NullSink
+from rng import RandomService
+from shooting_game import Deer, Game, Player, Rifle, ScoreBoard
+
+class TestHistogram(unittest.TestCase):
+    """Test cases for the Histogram class."""
+    def test_observe_and_percentile(self):
+        """Test that observations land in power-of-two buckets."""
+        histogram = Histogram()
+        for nanoseconds in [100, 1000, 1000, 5000]:
+            histogram.observe(nanoseconds)
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.total_ns, 7100)
+        self.assertEqual(histogram.percentile(0.5), 1024.0, "The median should fall in the bucket below 1024 ns.")
+        self.assertEqual(histogram.percentile(1.0), 8192.0)
+        histogram.observe(10 ** 12)
+        self.assertEqual(histogram.counts[-1], 1, "Very slow calls should land in the overflow bucket.")
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for instrumenting the game classes."""
+    def tearDown(self):
+        """Make sure no test leaves the game instrumented."""
+        uninstrument()
+
+    def test_counts_game_actions(self):
+        """Test that a scripted session records every instrumented action."""
+        metrics = Metrics()
+        commands = iter(['1', '1', '1', '1', '2'])
+        with instrumented(metrics):
+            game = Game(sink=NullSink(), rng=RandomService(3), input_func=lambda prompt: next(commands))
+            game.start_game()
+        self.assertEqual(metrics.counters["player_shoot"], 3)
+        self.assertEqual(metrics.counters["gun_fire"], 3)
+        self.assertEqual(metrics.counters["animal_appear"], 3, "Overridden appear() should be counted once per call.")
+        self.assertEqual(metrics.counters["game_input_wait"], 5)
+        self.assertEqual(metrics.counters.get("gun_fire_hits", 0), metrics.counters.get("animal_get_shot", 0))
+        self.assertEqual(metrics.histograms["player_shoot"].count, 3)
+
+    def test_input_wait_excludes_flushes(self):
+        """Test that the game work done before each prompt is not timed as input wait."""
+        metrics = Metrics()
+        commands = iter(['1', '2'])
+        with instrumented(metrics):
+            game = Game(sink=NullSink(), input_func=lambda prompt: next(commands))
+            with patch.object(game.bus, 'flush', side_effect=lambda: time.sleep(0.05)):
+                game.start_game()
+        self.assertEqual(metrics.histograms["game_input_wait"].count, 2)
+        self.assertLess(metrics.histograms["game_input_wait"].total_ns, 50_000_000)
+
+    def test_counts_bus_events(self):
+        """Test that the metrics subscriber counts a game's hits, misses and points once per batch."""
+        metrics = Metrics()
+        commands = iter(['1'] + ['1'] * 50 + ['2'])
+        with instrumented(metrics):
+            game = Game(sink=NullSink(), rng=RandomService(3), input_func=lambda prompt: next(commands))
+            game.start_game()
+        self.assertEqual(metrics.counters["shots_hit"] + metrics.counters["shots_missed"], 50)
+        self.assertEqual(metrics.counters["points_scored"], game.player.points)
+        self.assertEqual(game.bus.subscribers[-1], metrics.handle_events, "Games created while instrumented should subscribe.")
+        self.assertEqual(len(Game().bus.subscribers), 1, "Uninstrumenting should stop subscribing new games.")
+
+    def test_counts_batched_score_updates(self):
+        """Test that scores recorded in batches, from a bus batch or a volley, are counted."""
+        metrics = Metrics()
+        with instrumented(metrics):
+            bus = EventBus()
+            scoreboard = ScoreBoard(sink=NullSink())
+            bus.subscribe(scoreboard.handle_events)
+            player = Player(sink=NullSink(), bus=bus)
+            player.add_points(10)
+            player.add_points(20)
+            bus.flush()
+            player = Player(sink=NullSink())
+            player.selected_gun = Rifle()
+            player.selected_gun.accuracy = 1.0
+            deer = Deer(sink=NullSink())
+            player.shoot_many([deer] * 3, scoreboard=scoreboard)
+        self.assertEqual(metrics.counters["scoreboard_update_scores"], 2)
+        self.assertEqual(metrics.histograms["scoreboard_update_scores"].count, 2)
+        self.assertNotIn("scoreboard_update_score", metrics.counters)
+        self.assertEqual(scoreboard.total_score, 30 + 3 * deer.points_value)
+
+    def test_uninstrument_restores_methods(self):
+        """Test that uninstrumenting restores the original methods."""
+        original = Player.__dict__["shoot"]
+        instrument(Metrics())
+        self.assertIsNot(Player.__dict__["shoot"], original)
+        with self.assertRaises(RuntimeError):
+            instrument(Metrics())
+        uninstrument()
+        self.assertIs(Player.__dict__["shoot"], original)
+        self.assertFalse(hasattr(Rifle.__dict__["fire"], "__wrapped__"), "Gun subclasses should be restored.")
+        self.assertFalse(hasattr(Deer.__dict__["appear"], "__wrapped__"), "Subclass overrides should be restored too.")
+
+    def test_export_formats(self):
+        """Test the Prometheus and JSON exports."""
+        metrics = Metrics()
+        with instrumented(metrics):
+            ScoreBoard(sink=NullSink()).update_score(10)
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE shooting_game_scoreboard_update_score_total counter", text)
+        self.assertIn("shooting_game_scoreboard_update_score_total 1", text)
+        self.assertIn('shooting_game_scoreboard_update_score_seconds_bucket{le="+Inf"} 1', text)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics.json")
+            metrics.write(path)
+            with open(path) as handle:
+                snapshot = json.load(handle)
+            self.assertEqual(snapshot["counters"]["scoreboard_update_score"], 1)
+            self.assertEqual(snapshot["histograms"]["scoreboard_update_score"]["count"], 1)
+            with self.assertRaises(ValueError):
+                metrics.write(path, fmt="xml")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+from unittest.mock import patch
+import numpy as np
+from multiplayer import NO_GUN, MultiplayerGame, PlayerTable
+from output import NullSink
+from rng import RandomService
+from shooting_game import Deer, Rifle, Shotgun
+
+class TestPlayerView(unittest.TestCase):
+    """Test cases for players backed by a row of the table."""
+    def setUp(self):
+        self.rifle, self.shotgun = Rifle(), Shotgun()
+        self.table = PlayerTable(3, [self.rifle, self.shotgun])
+
+    def test_view_reads_and_writes_its_row(self):
+        """Test that a view's gun and points live in the table."""
+        view = self.table.view(1, sink=NullSink())
+        self.assertIsNone(view.selected_gun)
+        view.choose_gun(self.shotgun)
+        view.points = 25
+        self.assertEqual(self.table.gun.tolist(), [NO_GUN, 1, NO_GUN])
+        self.assertEqual(self.table.points.tolist(), [0, 25, 0])
+        self.assertIs(self.table.view(1).selected_gun, self.shotgun, "A second view should see the same row.")
+        with self.assertRaises(ValueError):
+            view.choose_gun(Rifle())
+        with self.assertRaises(IndexError):
+            self.table.view(3)
+
+    def test_shots_are_counted(self):
+        """Test that Player.shoot and shoot_many update the row's points, shots and hits."""
+        view = self.table.view(0, sink=NullSink())
+        deer = Deer(sink=NullSink())
+        self.assertFalse(view.shoot(deer), "A player without a gun cannot shoot.")
+        self.assertEqual(view.shots, 0)
+        view.choose_gun(self.rifle)
+        with patch('random.random', return_value=0.0):
+            self.assertTrue(view.shoot(deer))
+            self.assertEqual(view.shoot_many([deer, deer]), [10, 10])
+        with patch('random.random', return_value=0.99):
+            self.assertFalse(view.shoot(deer))
+        self.assertEqual((view.points, view.shots, view.hits), (30, 4, 3))
+
+
+class TestMultiplayerGame(unittest.TestCase):
+    """Test cases for lobby-wide rounds."""
+    def test_single_player_paths_play_as_player_zero(self):
+        """Test that start_game still works, playing as the first player."""
+        commands = iter(['1', '1', '1', '2'])
+        game = MultiplayerGame(4, sink=NullSink(), rng=RandomService(3))
+        game.input_func = lambda prompt: next(commands)
+        game.start_game()
+        self.assertFalse(game.is_game_running)
+        self.assertEqual(game.players.gun.tolist(), [0, NO_GUN, NO_GUN, NO_GUN])
+        self.assertEqual(game.players.shots[0], 2)
+        self.assertEqual(game.players.points[0], game.player.points)
+
+    def test_play_round(self):
+        """Test that a round updates every armed player and leaves unarmed players alone."""
+        game = MultiplayerGame(10_000, sink=NullSink(), rng=RandomService(5))
+        choices = np.tile([0, 1, 2, 1], 2500)
+        game.choose_guns(choices)
+        for _ in range(20):
+            earned = game.play_round()
+        self.assertEqual(game.rounds, 20)
+        self.assertEqual(len(earned), 10_000)
+        unarmed = choices == 0
+        self.assertFalse(np.any(game.players.shots[unarmed]))
+        self.assertFalse(np.any(game.players.points[unarmed]))
+        self.assertTrue(np.all(game.players.shots[~unarmed] == 20))
+        self.assertTrue(np.all(game.players.hits <= game.players.shots))
+        rifle = choices == 1
+        self.assertAlmostEqual(game.players.hits[rifle].sum() / game.players.shots[rifle].sum(), 0.8, delta=0.02)
+        values = {animal.points_value for animal in game.animals}
+        self.assertTrue(set(np.unique(earned).tolist()) <= values | {0})
+
+    def test_choose_guns_validation(self):
+        """Test that choices must be one menu number or 0 per player."""
+        game = MultiplayerGame(3, sink=NullSink(), rng=RandomService(1))
+        with self.assertRaises(ValueError):
+            game.choose_guns([1, 2])
+        with self.assertRaises(ValueError):
+            game.choose_guns([1, 2, 4])
+        with self.assertRaises(ValueError):
+            MultiplayerGame(0)
+
+    def test_leaderboard(self):
+        """Test that the leaderboard lists the top players, ties broken by index."""
+        game = MultiplayerGame(6, sink=NullSink(), rng=RandomService(1))
+        game.players.points[:] = [5, 40, 10, 40, 0, 10]
+        self.assertEqual(game.leaderboard(4), [(1, 40), (3, 40), (2, 10), (5, 10)])
+        self.assertEqual(game.leaderboard(100)[-1], (4, 0))
+        self.assertEqual(game.leaderboard(0), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from optimizer import Policy, candidate_policies, optimize, play_policy
+
+class TestPolicies(unittest.TestCase):
+    """Test cases for candidate policies and single sessions."""
+    def test_candidate_grid(self):
+        """Test that every gun, shot budget and stop target is combined."""
+        policies = candidate_policies(2, [5, 10], [None, 50])
+        self.assertEqual(len(policies), 8)
+        self.assertIn(Policy(2, 10, 50), policies)
+        self.assertEqual(Policy(1, 20, 100).describe(), "gun 1, 20 shots, stop at 100")
+
+    def test_play_policy(self):
+        """Test that a session is deterministic and stops at its target score."""
+        self.assertEqual(play_policy(Policy(1, 30), 4, 2), play_policy(Policy(1, 30), 4, 2))
+        stopped = play_policy(Policy(1, 30, stop_at=1), 4, 2)
+        self.assertIn(stopped, (10, 20), "The game should end at the first hit.")
+        self.assertEqual(play_policy(Policy(1, 30), 4, 2, shot_cost=1.0), play_policy(Policy(1, 30), 4, 2) - 30)
+        self.assertEqual(play_policy(Policy(2, 0), 4, 2, shot_cost=5.0), 0)
+        with self.assertRaises(ValueError):
+            play_policy(Policy(3, 10), 4, 2)
+
+
+class TestOptimize(unittest.TestCase):
+    """Test cases for the successive halving search."""
+    def test_finds_best_policy_and_stops_early(self):
+        """Test that a clearly better policy wins without spending the whole budget on bad ones."""
+        policies = candidate_policies(2, [1, 5, 40])
+        report = optimize(policies, budget=6000, master_seed=3, workers=1)
+        self.assertEqual(report.best, Policy(1, 40))
+        self.assertLess(report.sessions, 6000, "The search should stop once one policy is left.")
+        worst = report.arms[-1]
+        self.assertEqual(worst.policy.shots, 1)
+        self.assertIsNotNone(worst.eliminated)
+        self.assertIn("Best Policy: gun 1, 40 shots", report.summary())
+
+    def test_halving_over_rounds(self):
+        """Test that close policies are cut by half each round, survivors playing more sessions."""
+        policies = [Policy(1, shots) for shots in (18, 19, 20, 21)]
+        report = optimize(policies, budget=800, master_seed=1, z=50.0, workers=1)
+        self.assertEqual(report.rounds, 2)
+        self.assertEqual(sum(arm.eliminated is None for arm in report.arms), 1)
+        self.assertEqual(sorted(arm.sessions for arm in report.arms), [100, 100, 300, 300])
+        self.assertLessEqual(report.sessions, 800)
+
+    def test_results_independent_of_workers(self):
+        """Test that the report is the same for one and several workers."""
+        policies = candidate_policies(2, [5, 10], [None, 20])
+        single = optimize(policies, budget=400, master_seed=8, workers=1)
+        pooled = optimize(policies, budget=400, master_seed=8, workers=2, chunk_size=7)
+        self.assertEqual(single.summary(), pooled.summary())
+
+    def test_invalid_arguments(self):
+        """Test that an empty search, a small budget or eta below 2 are rejected."""
+        with self.assertRaises(ValueError):
+            optimize([], budget=10)
+        with self.assertRaises(ValueError):
+            optimize(candidate_policies(2, [5]), budget=1)
+        with self.assertRaises(ValueError):
+            optimize(candidate_policies(2, [5]), budget=10, eta=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
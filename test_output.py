@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import patch
+import io # For capturing print output
+from output import ConsoleSink, NullSink, BufferedSink, EventSink
+from shooting_game import Player, ScoreBoard, Rifle, Deer
+
+class TestConsoleSink(unittest.TestCase):
+    """Test cases for the ConsoleSink class."""
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_emit_prints(self, mock_stdout):
+        """Test that emit prints the formatted message immediately."""
+        ConsoleSink().emit("shot_hit", "Hit! You earned {points} points.", points=10)
+        self.assertEqual(mock_stdout.getvalue(), "Hit! You earned 10 points.\n", "Message should be printed.")
+
+class TestNullSink(unittest.TestCase):
+    """Test cases for the NullSink class."""
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_emit_discards(self, mock_stdout):
+        """Test that a player writing to a NullSink produces no output."""
+        player = Player(sink=NullSink())
+        player.add_points(10)
+        self.assertEqual(mock_stdout.getvalue(), "", "NullSink should not produce output.")
+        self.assertEqual(player.points, 10, "Points should still be added.")
+
+class TestBufferedSink(unittest.TestCase):
+    """Test cases for the BufferedSink class."""
+    def test_flushes_in_batches(self):
+        """Test that lines are only written once the batch is full."""
+        stream = io.StringIO()
+        sink = BufferedSink(batch_size=3, stream=stream)
+        scoreboard = ScoreBoard(sink=sink)
+        scoreboard.update_score(10)
+        scoreboard.update_score(20)
+        self.assertEqual(stream.getvalue(), "", "Nothing should be written before the batch is full.")
+        scoreboard.update_score(5)
+        self.assertEqual(stream.getvalue(), "Score updated: +10 points\nScore updated: +20 points\nScore updated: +5 points\n")
+
+    def test_flush_writes_partial_batch(self):
+        """Test that flush writes the lines buffered so far."""
+        stream = io.StringIO()
+        sink = BufferedSink(batch_size=100, stream=stream)
+        Deer(sink=sink).appear()
+        sink.flush()
+        self.assertEqual(stream.getvalue(), "A Deer appears!\nThe deer looks around cautiously.\n")
+
+    def test_invalid_batch_size(self):
+        """Test that a batch size below 1 is rejected."""
+        with self.assertRaises(ValueError):
+            BufferedSink(batch_size=0)
+
+class TestEventSink(unittest.TestCase):
+    """Test cases for the EventSink class."""
+    @patch.object(Rifle, 'fire', return_value=True)
+    def test_records_shot_events(self, mock_fire):
+        """Test that a hit is recorded as structured events."""
+        sink = EventSink()
+        player = Player(sink=sink)
+        player.choose_gun(Rifle())
+        player.shoot(Deer(sink=sink))
+        names = [event["event"] for event in sink.events]
+        self.assertEqual(names, ["gun_selected", "animal_hit", "points_added", "shot_hit"])
+        self.assertEqual(sink.events[-1]["points"], 10, "The hit event should carry the points earned.")
+
+    def test_callback(self):
+        """Test that the callback receives every recorded event."""
+        received = []
+        sink = EventSink(callback=received.append)
+        sink.emit("welcome", "Welcome to the Shooting Game!")
+        self.assertEqual(received, [{"event": "welcome"}])
+        sink.clear()
+        self.assertEqual(sink.events, [], "clear should remove recorded events.")
+
+
+if __name__ == '__main__':
+    unittest.main()
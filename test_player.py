@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import Mock, patch
-from shooting_game import Player, Rifle, Deer # Import Deer or any Animal subclass for target
+from events import EventBus
+from shooting_game import Bear, Player, Rifle, Deer, ScoreBoard # Import Deer or any Animal subclass for target
 
 class TestPlayer(unittest.TestCase):
     """Test cases for the Player class."""
@@ -67,6 +68,36 @@ class TestPlayer(unittest.TestCase):
         self.player.add_points(5)
         self.assertEqual(self.player.points, initial_points + 15, "Player's points should be cumulative.")
 
+    def test_shoot_many(self):
+        """Test that a volley adds its points once and pushes each hit to the scoreboard."""
+        self.player.choose_gun(self.rifle)
+        scoreboard = ScoreBoard()
+        targets = [Deer(), Bear(), Deer(), Bear()]
+        with patch.object(Rifle, 'fire_many', return_value=[True, True, False, True]), \
+                patch.object(self.player, 'add_points', wraps=self.player.add_points) as add_points:
+            earned = self.player.shoot_many(targets, scoreboard=scoreboard)
+        self.assertEqual(earned, [10, 20, 20])
+        add_points.assert_called_once_with(50)
+        self.assertEqual(self.player.points, 50)
+        self.assertEqual(scoreboard.score_history, [10, 20, 20])
+
+    def test_shoot_many_with_bus_and_scoreboard(self):
+        """Test that a player with a bus cannot also push a volley to a scoreboard."""
+        bus = EventBus()
+        scoreboard = ScoreBoard()
+        bus.subscribe(scoreboard.handle_events)
+        player = Player(bus=bus)
+        player.choose_gun(self.rifle)
+        with self.assertRaises(ValueError):
+            player.shoot_many([Deer()], scoreboard=scoreboard)
+        self.assertEqual(player.points, 0)
+        self.assertEqual(bus.pending, 0, "Nothing should be fired before the argument is rejected.")
+
+    def test_shoot_many_without_gun(self):
+        """Test that a volley without a gun earns nothing."""
+        self.assertEqual(self.player.shoot_many([Deer()]), [])
+        self.assertEqual(self.player.points, 0)
+
 
 if __name__ == '__main__':
     unittest.main()
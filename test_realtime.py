@@ -0,0 +1,141 @@
+import unittest
+from unittest.mock import patch
+import numpy as np
+from fakes import FakeClock
+from output import NullSink
+from realtime import Field, RealTimeGame, SpatialHash, TickScheduler
+from shooting_game import Bear, Deer, Player, Rifle
+
+class TestSpatialHash(unittest.TestCase):
+    """Test cases for the uniform grid."""
+    def test_candidates_cover_every_nearby_point(self):
+        """Test that a query returns every point within the radius, and only nearby cells."""
+        rng = np.random.default_rng(0)
+        x, y = rng.random(5000) * 100, rng.random(5000) * 50
+        grid = SpatialHash(100, 50, 5.0)
+        grid.rebuild(x, y)
+        for qx, qy in rng.random((50, 2)) * [100, 50]:
+            candidates = set(grid.candidates(qx, qy, 3.0).tolist())
+            near = set(np.nonzero((np.abs(x - qx) <= 3.0) & (np.abs(y - qy) <= 3.0))[0].tolist())
+            self.assertTrue(near <= candidates)
+            self.assertLess(len(candidates), 500, "Only the cells around the query should be scanned.")
+
+    def test_invalid_grid(self):
+        """Test that non-positive sizes are rejected."""
+        with self.assertRaises(ValueError):
+            SpatialHash(10, 10, 0)
+
+
+class TestField(unittest.TestCase):
+    """Test cases for the field of moving animals."""
+    def setUp(self):
+        self.deer, self.bear = Deer(sink=NullSink()), Bear(sink=NullSink())
+        self.field = Field(100, 100, cell_size=4.0)
+
+    def test_animal_at_picks_nearest(self):
+        """Test that a shot position resolves to the nearest animal covering it."""
+        self.field.spawn(self.deer, 10, 10, radius=2.0)
+        self.field.spawn(self.bear, 11.5, 10, radius=2.0)
+        self.assertEqual(self.field.animal_at(11.0, 10.0), 1)
+        self.assertEqual(self.field.animal_at(9.0, 10.0), 0)
+        self.assertIsNone(self.field.animal_at(50.0, 50.0))
+
+    def test_step_moves_and_bounces(self):
+        """Test that animals move with their velocity and stay on the field."""
+        self.field.spawn(self.deer, 10, 10, vx=5.0, vy=0.0)
+        self.field.spawn(self.bear, 99, 1, vx=4.0, vy=-4.0)
+        self.field.step(0.5)
+        self.assertAlmostEqual(self.field.x[0], 12.5)
+        self.assertAlmostEqual(self.field.x[1], 99.0, msg="The bear should bounce off the right edge.")
+        self.assertAlmostEqual(self.field.y[1], 1.0, msg="The bear should bounce off the top edge.")
+        self.assertLess(self.field.vx[1], 0)
+        self.assertGreater(self.field.vy[1], 0)
+        self.assertEqual(self.field.animal_at(12.5, 10.0), 0, "The spatial hash should follow the animals.")
+
+    def test_shoot_removes_hit_animal(self):
+        """Test that a hit scores through Player.shoot and takes the animal off the field."""
+        self.field.spawn(self.bear, 30, 30, radius=2.0)
+        self.field.spawn(self.deer, 60, 60, radius=2.0)
+        player = Player(sink=NullSink())
+        player.choose_gun(Rifle())
+        with patch('random.random', return_value=0.0):
+            self.assertIsNone(self.field.shoot(player, 5, 5), "A shot at empty ground should miss.")
+            self.assertIs(self.field.shoot(player, 30.5, 30), self.bear)
+            self.assertIsNone(self.field.shoot(player, 30.5, 30), "A removed animal cannot be hit again.")
+        self.assertEqual(player.points, 20)
+        self.assertEqual(len(self.field), 1)
+        self.field.step(0.1)
+        self.assertEqual(self.field.animals, [self.deer])
+
+    def test_spawn_one_at_a_time(self):
+        """Test that animals spawned one by one, past the initial capacity, keep their columns and can be shot."""
+        for index in range(100):
+            self.field.spawn(self.deer, index, 50, vx=1.0, radius=0.4)
+            self.assertEqual(self.field.animal_at(index, 50), index, "A new animal should be found right away.")
+        self.assertEqual(self.field.x.tolist(), list(range(100)))
+        self.field.remove(0)
+        self.field.step(1.0)
+        self.assertEqual(len(self.field.animals), 99)
+        self.assertEqual(self.field.x[:3].tolist(), [2.0, 3.0, 4.0])
+        self.assertEqual(self.field.animal_at(3.0, 50), 1)
+
+    def test_populate_many_animals(self):
+        """Test scattering tens of thousands of animals and stepping the field."""
+        self.field = Field(1000, 1000, cell_size=8.0)
+        self.field.populate([self.deer, self.bear], 20_000, rng=3, max_speed=10.0, weights=[3.0, 1.0])
+        self.assertEqual(len(self.field), 20_000)
+        self.assertAlmostEqual(self.field.animals.count(self.deer) / 20_000, 0.75, delta=0.02)
+        for _ in range(10):
+            self.field.step(1 / 60)
+        self.assertTrue(np.all((self.field.x >= 0) & (self.field.x <= 1000)))
+        target = 1234
+        self.assertEqual(self.field.animal_at(self.field.x[target], self.field.y[target]), target)
+
+
+class TestTickScheduler(unittest.TestCase):
+    """Test cases for the fixed-timestep scheduler."""
+    def test_fixed_timestep(self):
+        """Test that slow frames run several fixed ticks and fast frames run none."""
+        clock = FakeClock(frame=0.05)
+        scheduler = TickScheduler(tick_rate=100, clock=clock, sleep=clock.sleep)
+        steps, frames = [], []
+        ticks = scheduler.run(steps.append, render=frames.append, max_ticks=20)
+        self.assertEqual(ticks, 20)
+        self.assertEqual(set(steps), {0.01})
+        self.assertTrue(all(0.0 <= alpha < 1.0 for alpha in frames))
+
+    def test_catch_up_is_capped(self):
+        """Test that a stalled frame does not run an unbounded number of ticks."""
+        clock = FakeClock(frame=10.0)
+        scheduler = TickScheduler(tick_rate=100, max_catch_up=3, clock=clock, sleep=clock.sleep)
+        per_frame = []
+        scheduler.run(lambda dt: None, render=lambda alpha: per_frame.append(scheduler.tick), max_ticks=9)
+        self.assertEqual(per_frame, [0, 3, 6])
+
+    def test_update_can_stop(self):
+        """Test that returning False from update stops the loop."""
+        clock = FakeClock(frame=0.01)
+        scheduler = TickScheduler(tick_rate=100, clock=clock, sleep=clock.sleep)
+        self.assertEqual(scheduler.run(lambda dt: scheduler.tick < 5), 5)
+
+
+class TestRealTimeGame(unittest.TestCase):
+    """Test cases for the real-time game."""
+    def test_queued_shots_resolve_on_tick(self):
+        """Test that aimed shots are resolved on the next tick and the game ends with an empty field."""
+        field = Field(50, 50)
+        field.spawn(Deer(sink=NullSink()), 10, 10)
+        game = RealTimeGame(field, Rifle(), sink=NullSink())
+        clock = FakeClock(frame=1 / 60)
+        game.scheduler = TickScheduler(60, clock=clock, sleep=clock.sleep)
+        game.aim(10, 10)
+        self.assertEqual(game.player.points, 0, "Shots should wait for the next tick.")
+        with patch('random.random', return_value=0.0):
+            ticks = game.run(max_ticks=100)
+        self.assertEqual(ticks, 1, "The game should end once the field is empty.")
+        self.assertEqual(game.player.points, 10)
+        self.assertEqual(len(game.hits), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
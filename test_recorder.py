@@ -0,0 +1,99 @@
+import io
+import unittest
+from output import EventSink, NullSink
+from recorder import EventRecorder, RecordingError, replay
+from rng import RandomService
+from shooting_game import Bear, Deer, Game, Player, ScoreBoard, Rifle, Shotgun
+
+class TestEventRecorder(unittest.TestCase):
+    """Test cases for recording and replaying sessions."""
+    def play(self, recorder, commands):
+        """Play a seeded game whose output goes to the recorder."""
+        commands = iter(commands)
+        game = Game(sink=recorder, rng=RandomService(11), input_func=lambda prompt: next(commands))
+        game.start_game()
+        return game
+
+    def test_replay_rebuilds_player(self):
+        """Test that replaying a recording rebuilds the final player state."""
+        recorder = EventRecorder()
+        game = self.play(recorder, ['2'] + ['1'] * 50 + ['2'])
+        result = replay(recorder.getvalue())
+        self.assertEqual(result.player.points, game.player.points, "Replay should rebuild the final points.")
+        self.assertIsInstance(result.player.selected_gun, Shotgun, "Replay should rebuild the selected gun.")
+        self.assertEqual(result.shots, 50)
+        self.assertEqual(sum(result.spawns.values()), 50, "Every shot should follow a spawn.")
+        self.assertTrue(result.finished, "The recording should include the end of the game.")
+
+    def test_replay_rebuilds_scoreboard(self):
+        """Test that single and bulk score updates are replayed in order."""
+        recorder = EventRecorder()
+        scoreboard = ScoreBoard(sink=recorder)
+        scoreboard.update_score(10)
+        scoreboard.update_scores([20, -5])
+        result = replay(recorder.getvalue())
+        self.assertEqual(result.scoreboard.score_history, [10, 20, -5])
+        self.assertEqual(result.scoreboard.total_score, 25)
+        self.assertEqual(result.scoreboard.stats.count, 3)
+
+    def test_replay_volley(self):
+        """Test that a volley is replayed as its individual hits and misses."""
+        recorder = EventRecorder()
+        player = Player(sink=recorder)
+        player.choose_gun(Rifle(rng=RandomService(2)))
+        scoreboard = ScoreBoard(sink=recorder)
+        earned = player.shoot_many([Deer(), Bear()] * 50, scoreboard=scoreboard)
+        result = replay(recorder.getvalue())
+        self.assertEqual(result.shots, 100)
+        self.assertEqual(result.hits, len(earned))
+        self.assertEqual(result.player.points, player.points)
+        self.assertEqual(result.scoreboard.score_history, earned)
+
+    def test_forwards_to_inner_sink(self):
+        """Test that every message also reaches the inner sink."""
+        inner = EventSink()
+        recorder = EventRecorder(inner=inner)
+        Player(sink=recorder).add_points(300)
+        self.assertEqual(inner.events[0]["total"], 300)
+        self.assertEqual(replay(recorder.getvalue()).player.points, 300)
+
+    def test_stream_output(self):
+        """Test that flushing writes the recording to the stream."""
+        stream = io.BytesIO()
+        recorder = EventRecorder(stream=stream)
+        player = Player(sink=recorder)
+        player.choose_gun(Rifle())
+        recorder.flush()
+        player.add_points(10)
+        recorder.flush()
+        self.assertEqual(stream.getvalue(), recorder.getvalue())
+        self.assertIsInstance(replay(stream.getvalue()).player.selected_gun, Rifle)
+
+    def test_rejects_bad_data(self):
+        """Test that malformed recordings are rejected."""
+        with self.assertRaises(RecordingError):
+            replay(b"nope")
+        recorder = EventRecorder()
+        Player(sink=recorder).add_points(1000)
+        with self.assertRaises(RecordingError):
+            replay(recorder.getvalue()[:-1])
+        for op in (b"\x01", b"\x02"): # A gun or spawn referring to a name that was never defined
+            with self.assertRaises(RecordingError):
+                replay(b"SGEV\x01" + op + b"\x05")
+
+    def test_replay_with_catalog(self):
+        """Test that a catalog gun is resolved through the catalog, keeping its accuracy."""
+        from catalog import parse_catalog
+        catalog = parse_catalog({"guns": [{"name": "Bow", "accuracy": 0.3}], "animals": [{"name": "Hare", "points": 5}]})
+        recorder = EventRecorder()
+        game = Game(sink=recorder, rng=RandomService(2), catalog=catalog)
+        game.begin()
+        game.handle_input('1')
+        game.handle_input('2')
+        self.assertIsNone(replay(recorder.getvalue()).player.selected_gun, "Bow is not a Gun subclass.")
+        gun = replay(recorder.getvalue(), catalog=catalog).player.selected_gun
+        self.assertEqual((gun.name, gun.accuracy), ("Bow", 0.3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from rng import RandomService
+from shooting_game import Game, Rifle
+from output import NullSink
+
+class TestRandomService(unittest.TestCase):
+    """Test cases for the RandomService class."""
+    def test_random_in_range_across_refills(self):
+        """Test that single draws stay in [0, 1) across several block refills."""
+        rng = RandomService(1, block_size=8)
+        values = [rng.random() for _ in range(50)]
+        self.assertTrue(all(0.0 <= value < 1.0 for value in values), "Values should be in [0, 1).")
+        self.assertEqual(len(set(values)), 50, "Refills should not repeat values.")
+
+    def test_block_size_does_not_change_stream(self):
+        """Test that the block size only affects buffering, not the values drawn."""
+        small = RandomService(5, block_size=3)
+        large = RandomService(5, block_size=1000)
+        self.assertEqual([small.random() for _ in range(10)], [large.random() for _ in range(10)])
+
+    def test_invalid_block_size(self):
+        """Test that a block size below 1 is rejected."""
+        with self.assertRaises(ValueError):
+            RandomService(1, block_size=0)
+
+    def test_choice(self):
+        """Test that choice returns elements of the sequence and rejects empty ones."""
+        rng = RandomService(2)
+        items = ['a', 'b', 'c']
+        self.assertTrue(all(rng.choice(items) in items for _ in range(100)))
+        with self.assertRaises(IndexError):
+            rng.choice([])
+
+    def test_substreams_independent_and_reproducible(self):
+        """Test that substreams depend only on the seed and index."""
+        root = RandomService(10)
+        root.random() # Drawing from the parent must not affect substreams
+        first = [root.substream(0).random() for _ in range(3)]
+        self.assertEqual(first, [RandomService(10).substream(0).random() for _ in range(3)])
+        self.assertNotEqual(root.substream(0).random(), root.substream(1).random(), "Substreams should differ.")
+
+    def test_random_many(self):
+        """Test that bulk draws return arrays of the requested size."""
+        rng = RandomService(3)
+        self.assertEqual(rng.random_many(100).shape, (100,))
+        integers = rng.integers_many(4, 1000)
+        self.assertTrue(((integers >= 0) & (integers < 4)).all(), "Integers should be in [0, high).")
+
+    def test_getstate_setstate(self):
+        """Test that restoring a captured state replays the same values."""
+        rng = RandomService(4, block_size=16)
+        for _ in range(10):
+            rng.random()
+        state = rng.getstate()
+        expected = [rng.random() for _ in range(40)]
+        restored = RandomService(0, block_size=16)
+        restored.setstate(state)
+        self.assertEqual([restored.random() for _ in range(40)], expected)
+
+    def test_game_uses_service(self):
+        """Test that a Game passes its RNG to its guns and spawns."""
+        rng = RandomService(6)
+        game = Game(sink=NullSink(), rng=rng)
+        self.assertIs(game.guns[0].rng, rng, "Guns should share the game's RNG.")
+        self.assertIsInstance(Rifle(rng=rng).fire(), bool)
+        self.assertIn(game.random_animal(), game.animals)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+import statistics
+from array import array
+from score_history import RunningStats, ScoreHistory
+
+class TestRunningStats(unittest.TestCase):
+    """Test cases for the RunningStats class."""
+    def test_empty(self):
+        """Test the statistics of an empty instance."""
+        stats = RunningStats()
+        self.assertEqual(stats.count, 0)
+        self.assertIsNone(stats.minimum, "Minimum should be None without values.")
+        self.assertEqual(stats.variance, 0.0)
+
+    def test_update_matches_statistics_module(self):
+        """Test that incremental statistics match a full recomputation."""
+        values = [10, 20, 0, 20, 10, 10, 0, 20]
+        stats = RunningStats()
+        for value in values:
+            stats.update(value)
+        self.assertEqual(stats.count, len(values))
+        self.assertEqual(stats.total, sum(values))
+        self.assertEqual((stats.minimum, stats.maximum), (0, 20))
+        self.assertAlmostEqual(stats.mean, statistics.mean(values))
+        self.assertAlmostEqual(stats.variance, statistics.pvariance(values))
+
+    def test_update_many(self):
+        """Test that a bulk update equals recording each value."""
+        bulk, single = RunningStats(), RunningStats()
+        bulk.update(3)
+        single.update(3)
+        bulk.update_many([10, 0, 20, 7])
+        for value in [10, 0, 20, 7]:
+            single.update(value)
+        self.assertEqual((bulk.count, bulk.total, bulk.minimum, bulk.maximum), (single.count, single.total, single.minimum, single.maximum))
+        self.assertAlmostEqual(bulk.variance, single.variance)
+
+    def test_merge(self):
+        """Test that merging two instances equals recording all values in one."""
+        left, right, combined = RunningStats(), RunningStats(), RunningStats()
+        for value in [1, 5, 9]:
+            left.update(value)
+            combined.update(value)
+        for value in [2, 40]:
+            right.update(value)
+            combined.update(value)
+        left.merge(right)
+        self.assertEqual((left.count, left.total, left.minimum, left.maximum), (5, 57, 1, 40))
+        self.assertAlmostEqual(left.mean, combined.mean)
+        self.assertAlmostEqual(left.variance, combined.variance)
+
+class TestScoreHistory(unittest.TestCase):
+    """Test cases for the ScoreHistory class."""
+    def test_unbounded(self):
+        """Test that an unbounded history keeps every score in order."""
+        history = ScoreHistory()
+        for points in [10, 20, 5]:
+            history.append(points)
+        self.assertEqual(history, [10, 20, 5], "History should compare equal to a list.")
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history[-1], 5)
+        self.assertIsInstance(history.to_array(), array, "Storage should be a typed array.")
+
+    def test_ring_buffer(self):
+        """Test that a bounded history keeps only the most recent scores."""
+        history = ScoreHistory(capacity=3)
+        for points in range(1, 8):
+            history.append(points)
+        self.assertEqual(list(history), [5, 6, 7], "Only the last three scores should remain.")
+        self.assertEqual(history[0], 5)
+        self.assertEqual(history[1:], [6, 7])
+        with self.assertRaises(IndexError):
+            history[3]
+
+    def test_extend(self):
+        """Test that extend matches repeated appends, with and without a capacity."""
+        for capacity in [None, 3, 10]:
+            extended, appended = ScoreHistory(capacity=capacity), ScoreHistory(capacity=capacity)
+            extended.append(1)
+            appended.append(1)
+            extended.extend([2, 3, 4, 5])
+            for points in [2, 3, 4, 5]:
+                appended.append(points)
+            self.assertEqual(extended, appended, f"extend should match append for capacity {capacity}.")
+
+    def test_invalid_capacity(self):
+        """Test that a capacity below 1 is rejected."""
+        with self.assertRaises(ValueError):
+            ScoreHistory(capacity=0)
+
+    def test_clear(self):
+        """Test that clear empties the history."""
+        history = ScoreHistory(capacity=2)
+        for points in [1, 2, 3]:
+            history.append(points)
+        history.clear()
+        self.assertEqual(history, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
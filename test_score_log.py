@@ -0,0 +1,129 @@
+import os
+import struct
+import tempfile
+import unittest
+from score_log import ScoreLog, ScoreLogError, GAME_RECORD, SCORE_RECORD
+from shooting_game import ScoreBoard
+from output import NullSink
+
+class TestScoreLog(unittest.TestCase):
+    """Test cases for the ScoreLog class."""
+    def setUp(self):
+        """Create a score log in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "scores.log")
+        self.log = ScoreLog(self.path)
+
+    def tearDown(self):
+        """Close the log and remove the temporary directory."""
+        self.log.close()
+        self.directory.cleanup()
+
+    def test_append_and_read(self):
+        """Test that appended records can be read back."""
+        self.log.append_score(1, 10)
+        self.log.append_game(1, 10)
+        records = self.log.read()
+        self.assertEqual(len(self.log), 2)
+        self.assertEqual(list(records["kind"]), [SCORE_RECORD, GAME_RECORD])
+        self.assertEqual(list(records["points"]), [10, 10])
+
+    def test_persists_across_reopen(self):
+        """Test that records survive closing and reopening the log."""
+        self.log.append_score(3, 20)
+        self.log.close()
+        self.log = ScoreLog(self.path)
+        self.assertEqual(list(self.log.history(3)), [20], "Scores should persist on disk.")
+
+    def test_rejects_foreign_file(self):
+        """Test that a file that is not a score log is rejected."""
+        other = os.path.join(self.directory.name, "other.log")
+        with open(other, "wb") as handle:
+            handle.write(b"not a score log")
+        with self.assertRaises(ScoreLogError):
+            ScoreLog(other)
+
+    def test_history_and_total_across_compaction(self):
+        """Test that history and totals combine indexed and newly appended records."""
+        for player_id, points in [(2, 10), (1, 20), (2, 20), (1, 10)]:
+            self.log.append_score(player_id, points)
+        self.log.compact()
+        self.assertTrue(os.path.exists(self.log.index_path), "Compaction should write an index.")
+        self.log.append_score(2, 5)
+        self.assertEqual(list(self.log.history(2)), [10, 20, 5])
+        self.assertEqual(self.log.total(2), 35)
+        self.assertEqual(self.log.total(1), 30)
+        self.assertEqual(self.log.total(99), 0, "Unknown players should have no points.")
+
+    def test_compact_groups_by_player(self):
+        """Test that compaction groups records by player and keeps their order."""
+        for player_id, points in [(2, 1), (1, 2), (2, 3)]:
+            self.log.append_score(player_id, points)
+        self.log.compact()
+        records = self.log.read()
+        self.assertEqual(list(records["player"]), [1, 2, 2])
+        self.assertEqual(list(records["points"]), [2, 1, 3])
+
+    def test_drops_partial_trailing_record(self):
+        """Test that a record cut short by a crash is dropped so later records stay aligned."""
+        self.log.append_score(1, 10)
+        self.log.close()
+        with open(self.path, "ab") as handle:
+            handle.write(b"\x00" * 7)
+        self.log = ScoreLog(self.path)
+        self.log.append_score(1, 20)
+        self.assertEqual(list(self.log.history(1)), [10, 20])
+
+    def test_ignores_index_of_another_generation(self):
+        """Test that an index left over by a compaction that crashed between its renames is not used."""
+        for points in (1, 2, 3):
+            self.log.append_score(2, points)
+        self.log.compact()
+        with open(self.log.index_path, "rb") as handle:
+            old_index = handle.read()
+        self.log.append_score(1, 50) # Sorted ahead of player 2 by the next compaction
+        self.log.compact()
+        self.log.close()
+        with open(self.log.index_path, "wb") as handle:
+            handle.write(old_index) # The new log is in place but the old index was never replaced
+        self.log = ScoreLog(self.path)
+        self.assertEqual(self.log.total(1), 50)
+        self.assertEqual(self.log.total(2), 6)
+        self.assertEqual(list(self.log.history(2)), [1, 2, 3])
+
+    def test_reads_version_1_log(self):
+        """Test that a log without a generation is read and upgraded by compaction."""
+        self.log.close()
+        with open(self.path, "wb") as handle:
+            handle.write(struct.pack("<4sHH", b"SCLG", 1, 24) + struct.pack("<BxxxIqd", SCORE_RECORD, 4, 15, 0.0))
+        self.log = ScoreLog(self.path)
+        self.log.append_score(4, 5)
+        self.assertEqual(self.log.total(4), 20)
+        self.log.compact()
+        self.log.close()
+        self.log = ScoreLog(self.path)
+        self.assertEqual(self.log.total(4), 20)
+        self.assertEqual(len(self.log), 2)
+
+    def test_leaderboard(self):
+        """Test that the leaderboard ranks players by their best final score."""
+        for player_id, final_score in [(1, 50), (2, 80), (1, 90), (3, 10)]:
+            self.log.append_game(player_id, final_score)
+        self.log.compact()
+        self.log.append_game(3, 100)
+        self.log.append_score(4, 500) # Scores without a finished game are not ranked
+        self.assertEqual(self.log.leaderboard(2), [(3, 100), (1, 90)])
+        self.assertEqual(self.log.leaderboard(10), [(3, 100), (1, 90), (2, 80)])
+
+    def test_scoreboard_appends_to_log(self):
+        """Test that a ScoreBoard with a log persists scores and finished games."""
+        scoreboard = ScoreBoard(sink=NullSink(), log=self.log, player_id=7)
+        scoreboard.update_score(10)
+        scoreboard.update_score(20)
+        scoreboard.record_game(scoreboard.total_score)
+        self.assertEqual(list(self.log.history(7)), [10, 20])
+        self.assertEqual(self.log.leaderboard(1), [(7, 30)])
+
+
+if __name__ == '__main__':
+    unittest.main()
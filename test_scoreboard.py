@@ -61,6 +61,54 @@ class TestScoreBoard(unittest.TestCase):
         expected_output = "Final Score: 100\n"
         self.assertEqual(mock_stdout.getvalue(), expected_output, "Output of display_final_score is not as expected.")
 
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_update_scores(self, mock_stdout):
+        """Test that update_scores records every score but prints one summary."""
+        self.scoreboard.update_scores([10, 20, 5])
+        self.assertEqual(self.scoreboard.total_score, 35)
+        self.assertEqual(self.scoreboard.score_history, [10, 20, 5])
+        self.assertEqual(self.scoreboard.stats.count, 3)
+        self.assertEqual(mock_stdout.getvalue(), "Score updated: +35 points from 3 scores\n")
+
+    def test_running_statistics(self):
+        """Test that update_score maintains running statistics."""
+        for points in [10, 20, 30]:
+            self.scoreboard.update_score(points)
+        self.assertEqual(self.scoreboard.stats.count, 3)
+        self.assertEqual(self.scoreboard.stats.mean, 20.0)
+        self.assertEqual((self.scoreboard.stats.minimum, self.scoreboard.stats.maximum), (10, 30))
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_bounded_history(self, mock_stdout):
+        """Test that max_history bounds the history but not the totals."""
+        scoreboard = ScoreBoard(max_history=2)
+        for points in [10, 20, 30]:
+            scoreboard.update_score(points)
+        self.assertEqual(scoreboard.score_history, [20, 30], "Only the most recent scores should be kept.")
+        self.assertEqual(scoreboard.total_score, 60, "The total should include every score.")
+        self.assertEqual(scoreboard.stats.count, 3, "Statistics should include every score.")
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_large_scores(self, mock_stdout):
+        """Test that scores beyond 32 bits are kept, and a score too large for the history changes nothing."""
+        self.scoreboard.update_score(2 ** 40)
+        self.scoreboard.update_scores([2 ** 33, 1])
+        self.assertEqual(self.scoreboard.score_history, [2 ** 40, 2 ** 33, 1])
+        for update in (lambda: self.scoreboard.update_score(2 ** 64), lambda: self.scoreboard.update_scores([5, 2 ** 64])):
+            with self.assertRaises(OverflowError):
+                update()
+        self.assertEqual(self.scoreboard.total_score, 2 ** 40 + 2 ** 33 + 1)
+        self.assertEqual(self.scoreboard.stats.count, 3)
+        self.assertEqual(len(self.scoreboard.score_history), 3)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_display_statistics(self, mock_stdout):
+        """Test that display_statistics prints the summary statistics."""
+        self.scoreboard.update_score(10)
+        self.scoreboard.update_score(20)
+        self.scoreboard.display_statistics()
+        self.assertIn("Scores: 2, Mean: 15.00, Min: 10, Max: 20, Std Dev: 5.00", mock_stdout.getvalue())
+
 # Add more tests as needed
 
 if __name__ == '__main__':
@@ -0,0 +1,136 @@
+import unittest
+from fakes import FakeClock
+from output import NullSink
+from rng import RandomService
+from screen import FrameLimiter, GameScreen, ScreenBuffer, Terminal
+from shooting_game import Game
+
+class FakeTerminal(Terminal):
+    """A terminal that records writes and plays back scripted keys."""
+    def __init__(self, keys, height=24, width=80):
+        self.keys = list(keys)
+        self.height, self.width = height, width
+        self.writes = []
+        self.cleared = 0
+
+    def size(self):
+        return self.height, self.width
+
+    def write(self, y, x, text):
+        self.writes.append((y, x, text))
+
+    def clear(self):
+        self.cleared += 1
+
+    def key_ready(self):
+        return bool(self.keys)
+
+    def read_key(self):
+        return self.keys.pop(0) if self.keys else 'q' # The player presses a key once the script is done
+
+
+class TestScreenBuffer(unittest.TestCase):
+    """Test cases for the double-buffered cell grid."""
+    def test_only_changed_cells_are_sent(self):
+        """Test that a frame sends the cells that differ, merging nearby changes."""
+        buffer = ScreenBuffer(5, 20)
+        buffer.put_line(1, "Points: 100")
+        self.assertEqual(buffer.changes(), [(1, 0, "Points: 100")])
+        buffer.put_line(1, "Points: 120")
+        buffer.put_line(3, "")
+        self.assertEqual(buffer.changes(), [(1, 9, "2")], "Unchanged cells and blank rows should not be sent.")
+        buffer.put(2, 0, "ab")
+        buffer.put(2, 4, "c")
+        buffer.put(2, 15, "d")
+        self.assertEqual(buffer.changes(), [(2, 0, "ab  c"), (2, 15, "d")])
+        self.assertEqual(buffer.changes(), [], "A frame without writes sends nothing.")
+
+    def test_writes_are_clipped(self):
+        """Test that text outside the screen is dropped."""
+        buffer = ScreenBuffer(2, 5)
+        buffer.put(0, 3, "abcdef")
+        buffer.put(0, -2, "xyz")
+        buffer.put(7, 0, "nope")
+        self.assertEqual(buffer.row(0), "z  ab")
+        self.assertEqual(buffer.changes(), [(0, 0, "z  ab")])
+
+
+class TestFrameLimiter(unittest.TestCase):
+    """Test cases for the frame rate cap."""
+    def test_due(self):
+        """Test that frames are due once per interval."""
+        clock = FakeClock()
+        limiter = FrameLimiter(max_fps=10, clock=clock)
+        self.assertTrue(limiter.due())
+        limiter.mark()
+        clock.now = 0.05
+        self.assertFalse(limiter.due())
+        clock.now = 0.1
+        self.assertTrue(limiter.due())
+        with self.assertRaises(ValueError):
+            FrameLimiter(max_fps=0)
+
+
+class TestGameScreen(unittest.TestCase):
+    """Test cases for the full-screen game front end."""
+    def play(self, keys, clock=None, **terminal_options):
+        terminal = FakeTerminal(keys, **terminal_options)
+        screen = GameScreen(terminal, max_fps=30, clock=clock or FakeClock())
+        game = Game(sink=screen, rng=RandomService(4))
+        screen.attach(game)
+        game.start_game()
+        return game, screen, terminal
+
+    def test_plays_game_and_shows_score(self):
+        """Test that keys drive the game and the screen shows the live score and messages."""
+        game, screen, terminal = self.play(['2', '1', '1', '1', '2'])
+        screen.render()
+        self.assertIn(f"Points: {game.player.points}", screen.buffer.row(0))
+        self.assertIn("Shotgun", screen.buffer.row(0))
+        self.assertIn("Game over", screen.buffer.row(2))
+        self.assertEqual(screen.shots, 3)
+        self.assertEqual(screen.buffer.row(23).strip(), "Game Over. Thank you for playing!")
+        screen_text = "\n".join(screen.buffer.row(y) for y in range(24))
+        self.assertNotIn("1. Shoot an animal", screen_text, "The options menu should not be printed as messages.")
+
+    def test_frame_rate_is_capped_while_keys_are_waiting(self):
+        """Test that held keys are played without a frame per action."""
+        game, screen, terminal = self.play(['1'] + ['1'] * 500 + ['2'])
+        self.assertEqual(screen.shots, 500)
+        self.assertEqual(screen.frames, 1, "With the clock stopped only the first frame is due.")
+        screen.read_input("")
+        self.assertEqual(screen.frames, 2, "An idle screen should be brought up to date.")
+
+    def test_frame_cost_follows_changes(self):
+        """Test that a shot on a large screen sends far fewer cells than the screen holds."""
+        game, screen, terminal = self.play(['1', '2'], height=200, width=400)
+        screen.render()
+        before = screen.cells_sent
+        game.handle_action('1')
+        sent = screen.render()
+        self.assertGreater(sent, 0)
+        self.assertEqual(screen.cells_sent - before, sent)
+        self.assertLess(sent, 200 * 400 // 20)
+
+    def test_resize_redraws(self):
+        """Test that a new terminal size clears the screen and draws every region."""
+        game, screen, terminal = self.play(['1', '2'])
+        terminal.height, terminal.width = 10, 40
+        screen.render()
+        self.assertEqual(terminal.cleared, 1)
+        self.assertEqual((screen.buffer.height, screen.buffer.width), (10, 40))
+        self.assertTrue(screen.buffer.row(0).startswith(" Shooting Game"))
+
+    def test_many_guns_are_typed(self):
+        """Test that gun numbers above 9 are typed and confirmed with Enter."""
+        terminal = FakeTerminal(['1', '2', '\b', '1', '\n', '2'])
+        screen = GameScreen(terminal, clock=FakeClock())
+        game = Game(sink=screen, rng=RandomService(4))
+        game.guns = game.guns * 6
+        screen.attach(game)
+        game.start_game()
+        self.assertIs(game.player.selected_gun, game.guns[10])
+
+
+if __name__ == '__main__':
+    unittest.main()
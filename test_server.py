@@ -0,0 +1,60 @@
+import asyncio
+import unittest
+from server import GameServer, normalize_command
+
+class TestNormalizeCommand(unittest.TestCase):
+    """Test cases for the protocol command translation."""
+    def test_aliases(self):
+        """Test that word commands map to menu numbers."""
+        self.assertEqual(normalize_command("shoot\r"), "1")
+        self.assertEqual(normalize_command("END"), "2")
+        self.assertEqual(normalize_command("gun 2"), "2")
+        self.assertEqual(normalize_command(" 1 "), "1")
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the GameServer class."""
+    async def asyncSetUp(self):
+        """Start a server on a free local port."""
+        self.game_server = GameServer(seed=1)
+        self.listener = await self.game_server.start_tcp("127.0.0.1", 0)
+        self.port = self.listener.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        """Stop the server."""
+        self.listener.close()
+        await self.listener.wait_closed()
+
+    async def play(self, commands):
+        """Connect, send all commands and return everything the server wrote."""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write("".join(command + "\n" for command in commands).encode())
+        await writer.drain()
+        output = await asyncio.wait_for(reader.read(), timeout=5)
+        writer.close()
+        return output.decode()
+
+    async def test_full_session(self):
+        """Test a session choosing a gun, shooting and ending over TCP."""
+        output = await self.play(["gun 1", "shoot", "shoot", "end"])
+        self.assertIn("Welcome to the Shooting Game!", output)
+        self.assertIn("You have selected Rifle", output)
+        self.assertEqual(output.count(" appears!"), 2, "Two animals should appear for two shots.")
+        self.assertTrue(output.rstrip().endswith("Game Over. Thank you for playing!"))
+
+    async def test_invalid_gun_shows_menu_again(self):
+        """Test that an invalid gun choice repeats the gun menu."""
+        output = await self.play(["9", "2", "end"])
+        self.assertIn("Invalid Choice for Gun. Please select a valid number.", output)
+        self.assertEqual(output.count("Choose your gun:"), 2)
+        self.assertIn("You have selected Shotgun", output)
+
+    async def test_concurrent_sessions(self):
+        """Test that many sessions run independently at the same time."""
+        outputs = await asyncio.gather(*(self.play(["1", "shoot", "end"]) for _ in range(50)))
+        self.assertTrue(all("Game Over" in output for output in outputs), "Every session should finish.")
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(self.game_server.sessions), 0, "Finished sessions should be released.")
+
+
+if __name__ == '__main__':
+    unittest.main()
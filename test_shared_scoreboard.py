@@ -0,0 +1,109 @@
+import io
+import multiprocessing
+import sys
+import unittest
+from multiprocessing import resource_tracker, shared_memory
+from unittest.mock import patch
+from output import NullSink
+from shared_scoreboard import SharedScoreBoard, SharedScores, watch
+
+def play_worker(name, slot, rounds):
+    """Publish scores from a separate process."""
+    shared = SharedScores.attach(name)
+    board = SharedScoreBoard(shared, slot, sink=NullSink())
+    for index in range(rounds):
+        board.update_score(index % 7)
+        if index % 500 == 0:
+            board.update_scores([1] * 40)
+    board.release()
+    shared.close()
+
+class TestSharedScoreBoard(unittest.TestCase):
+    """Test cases for the shared-memory scoreboard."""
+    def setUp(self):
+        self.shared = SharedScores.create(slots=3, history=4)
+
+    def tearDown(self):
+        self.shared.close()
+        self.shared.unlink()
+
+    def test_publishes_totals_and_history(self):
+        """Test that a board's totals, statistics and recent scores appear in its slot."""
+        board = SharedScoreBoard(self.shared, 1, sink=NullSink())
+        board.update_score(10)
+        board.update_scores([20, 30])
+        state = self.shared.read_slot(1)
+        self.assertTrue(state.active)
+        self.assertEqual(state.total_score, 60)
+        self.assertEqual(state.history, [10, 20, 30])
+        self.assertEqual((state.stats.count, state.stats.minimum, state.stats.maximum), (3, 10, 30))
+        board.update_scores([1, 2, 3, 4, 5, 6])
+        board.update_score(7)
+        self.assertEqual(self.shared.read_slot(1).history, [4, 5, 6, 7], "Only the latest scores should be kept, oldest first.")
+        board.release()
+        view = self.shared.view()
+        self.assertEqual([state.slot for state in view.slots], [1])
+        self.assertEqual(view.active, 0)
+        self.assertEqual(view.total_score, board.total_score)
+
+    def test_global_view(self):
+        """Test that the view merges every slot."""
+        first = SharedScoreBoard(self.shared, 0, sink=NullSink())
+        second = SharedScoreBoard(self.shared, 2, sink=NullSink())
+        first.update_scores([5, 15])
+        second.update_score(40)
+        view = self.shared.view()
+        self.assertEqual(view.total_score, 60)
+        self.assertEqual(view.stats.count, 3)
+        self.assertAlmostEqual(view.stats.mean, 20.0)
+        stream = io.StringIO()
+        watch(self.shared.name, iterations=1, stream=stream)
+        self.assertEqual(stream.getvalue(), "Workers: 2/2  Total: 60  Scores: 3  Mean: 20.00  Max: 40\n")
+
+    def test_invalid_blocks_and_slots(self):
+        """Test that foreign blocks and out-of-range slots are rejected."""
+        with self.assertRaises(IndexError):
+            SharedScoreBoard(self.shared, 3, sink=NullSink())
+        other = shared_memory.SharedMemory(create=True, size=64)
+        try:
+            with self.assertRaises(ValueError):
+                SharedScores.attach(other.name)
+        finally:
+            other.close()
+            other.unlink()
+
+    @unittest.skipIf(sys.version_info >= (3, 13), "Attaching does not register the block from Python 3.13")
+    def test_attach_without_tracker_state(self):
+        """Test that attaching still works, and leaves unlinking to the creator, if the tracker cannot be inspected."""
+        with patch.object(resource_tracker, '_resource_tracker', object()), \
+                patch.object(resource_tracker, 'unregister') as unregister:
+            shared = SharedScores.attach(self.shared.name)
+        try:
+            unregister.assert_called_once_with(shared._memory._name, "shared_memory")
+            self.assertEqual(shared.slots, 3)
+        finally:
+            shared.close()
+
+    def test_workers_in_other_processes(self):
+        """Test that a monitor reads consistent slots while worker processes write them."""
+        workers = [
+            multiprocessing.Process(target=play_worker, args=(self.shared.name, slot, 5000))
+            for slot in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        while any(worker.is_alive() for worker in workers):
+            for state in self.shared.view().slots:
+                self.assertEqual(state.total_score, state.stats.total, "A read should never mix two updates.")
+                self.assertEqual(state.stats.count, state.appended)
+        for worker in workers:
+            worker.join()
+            self.assertEqual(worker.exitcode, 0)
+        view = self.shared.view()
+        per_worker = sum(index % 7 for index in range(5000)) + 40 * 10
+        self.assertEqual(view.total_score, 3 * per_worker)
+        self.assertEqual(view.active, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
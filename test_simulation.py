@@ -0,0 +1,57 @@
+import unittest
+import numpy as np
+from shooting_game import Rifle, Shotgun, Deer, Bear, Gun
+from simulation import hit_probability, simulate_shots, simulate_sessions, simulate_session_shots
+
+class TestSimulation(unittest.TestCase):
+    """Test cases for the headless simulation engine."""
+    def setUp(self):
+        """Set up the default animals used by the game."""
+        self.animals = [Deer(), Bear()]
+
+    def test_hit_probability(self):
+        """Test that hit_probability reads each gun's accuracy."""
+        self.assertEqual(hit_probability(Rifle()), 0.8, "Rifle should hit 80% of the time.")
+        self.assertEqual(hit_probability(Shotgun()), 0.5, "Shotgun should hit 50% of the time.")
+
+    def test_hit_probability_invalid(self):
+        """Test that an accuracy outside [0, 1] is rejected."""
+        gun = Gun()
+        gun.accuracy = 1.5
+        with self.assertRaises(ValueError):
+            hit_probability(gun)
+
+    def test_simulate_shots_values(self):
+        """Test that each simulated shot scores either 0 or an animal's points value."""
+        shots = simulate_shots(Rifle(), self.animals, 10_000, seed=1)
+        self.assertEqual(shots.shape, (10_000,), "One result should be returned per shot.")
+        self.assertTrue(set(np.unique(shots)) <= {0, 10, 20}, "Shots should only score 0, 10 or 20.")
+
+    def test_simulate_sessions_reproducible(self):
+        """Test that the same seed gives the same session scores."""
+        first = simulate_sessions(Rifle(), self.animals, 1_000, 20, seed=42)
+        second = simulate_sessions(Rifle(), self.animals, 1_000, 20, seed=42)
+        np.testing.assert_array_equal(first, second)
+
+    def test_simulate_sessions_mean(self):
+        """Test that the mean session score matches the expected value."""
+        scores = simulate_sessions(Shotgun(), self.animals, 200_000, 10, seed=7)
+        # 10 shots * 0.5 hit chance * 15 average points
+        self.assertAlmostEqual(scores.mean(), 75.0, delta=0.5, msg="Mean score should be close to 75.")
+
+    def test_simulate_sessions_per_session_shots(self):
+        """Test that sessions with zero shots score zero."""
+        scores = simulate_sessions(Rifle(), self.animals, 3, [0, 5, 0], seed=3)
+        self.assertEqual(scores[0], 0, "A session without shots should score 0.")
+        self.assertEqual(scores[2], 0, "A session without shots should score 0.")
+
+    def test_simulate_session_shots_matches_sessions(self):
+        """Test that the shot-by-shot engine agrees with the multinomial engine."""
+        by_shot = simulate_session_shots(Rifle(), self.animals, 50_000, 10, seed=5, chunk_size=4_096)
+        by_count = simulate_sessions(Rifle(), self.animals, 50_000, 10, seed=6)
+        self.assertEqual(by_shot.shape, (50_000,), "One score should be returned per session.")
+        self.assertAlmostEqual(by_shot.mean(), by_count.mean(), delta=1.0, msg="Both engines should have the same mean.")
+
+
+if __name__ == '__main__':
+    unittest.main()
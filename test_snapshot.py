@@ -0,0 +1,95 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+from catalog import AnimalSpec, Catalog, GunSpec
+from output import NullSink
+from rng import RandomService
+from score_history import ScoreHistory
+from shooting_game import Game
+from snapshot import SnapshotError, load_snapshot, restore, save_snapshot, snapshot, write_snapshot
+
+class TestSnapshot(unittest.TestCase):
+    """Test cases for game snapshots."""
+    def play(self, rng, shots=200):
+        """Start a game with the shotgun and fire some shots."""
+        game = Game(sink=NullSink(), rng=rng)
+        game.begin()
+        game.handle_input('2')
+        for _ in range(shots):
+            game.handle_input('1')
+        return game
+
+    def assertSameGame(self, restored, original):
+        """Assert that two games are in the same state."""
+        self.assertEqual(restored.is_game_running, original.is_game_running)
+        self.assertIs(restored.player.selected_gun, restored.guns[1])
+        self.assertEqual(restored.player.points, original.player.points)
+        self.assertEqual(restored.scoreboard.total_score, original.scoreboard.total_score)
+        self.assertEqual(restored.scoreboard.score_history, original.scoreboard.score_history)
+        self.assertEqual(restored.scoreboard.stats.count, original.scoreboard.stats.count)
+        self.assertAlmostEqual(restored.scoreboard.stats.variance, original.scoreboard.stats.variance)
+
+    def continue_both(self, restored, original):
+        """Play both games further and assert they stay identical."""
+        for _ in range(100):
+            original.handle_input('1')
+            restored.handle_input('1')
+        self.assertEqual(restored.player.points, original.player.points, "The restored RNG should draw the same shots.")
+
+    def test_round_trip_random_service(self):
+        """Test that a game using a RandomService resumes exactly where it was saved."""
+        original = self.play(RandomService(21).substream(3))
+        original.scoreboard.update_scores([5, -3, 40])
+        restored = restore(snapshot(original), sink=NullSink())
+        self.assertSameGame(restored, original)
+        self.assertEqual(restored.rng.spawn_key, (3,))
+        self.continue_both(restored, original)
+
+    def test_round_trip_mersenne_twister(self):
+        """Test that a game using random.Random resumes with the same draws."""
+        original = self.play(random.Random(5))
+        restored = restore(snapshot(original), sink=NullSink())
+        self.assertSameGame(restored, original)
+        self.continue_both(restored, original)
+
+    def test_bounded_history_wraps(self):
+        """Test that a wrapped ring buffer history is saved oldest first."""
+        game = Game(sink=NullSink(), rng=RandomService(1))
+        game.scoreboard.score_history = ScoreHistory(capacity=4)
+        game.scoreboard.update_scores(list(range(10)))
+        game.scoreboard.update_score(99)
+        restored = restore(snapshot(game), sink=NullSink())
+        self.assertEqual(restored.scoreboard.score_history, [7, 8, 9, 99])
+        self.assertEqual(restored.scoreboard.score_history.capacity, 4)
+
+    def test_save_and_load_file(self):
+        """Test writing a snapshot file and loading it back."""
+        original = self.play(RandomService(9), shots=50)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "game.snap")
+            save_snapshot(original, path)
+            self.assertEqual(os.listdir(directory), ["game.snap"], "No temporary file should be left behind.")
+            restored = load_snapshot(path, sink=NullSink())
+        self.assertSameGame(restored, original)
+        stream = io.BytesIO()
+        self.assertEqual(write_snapshot(original, stream), len(stream.getvalue()))
+        self.assertEqual(stream.getvalue(), snapshot(original))
+
+    def test_rejects_bad_snapshots(self):
+        """Test that malformed, truncated or mismatched snapshots are rejected."""
+        data = snapshot(self.play(RandomService(2), shots=5))
+        with self.assertRaises(SnapshotError):
+            restore(b"nope")
+        with self.assertRaises(SnapshotError):
+            restore(data[:4] + b"\x09\x00" + data[6:])
+        with self.assertRaises(SnapshotError):
+            restore(data[:-8])
+        one_gun = Catalog([GunSpec("Rifle", 0.8)], [AnimalSpec("Deer", 10)])
+        with self.assertRaises(SnapshotError):
+            restore(data, sink=NullSink(), catalog=one_gun)
+
+
+if __name__ == '__main__':
+    unittest.main()
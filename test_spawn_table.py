@@ -0,0 +1,62 @@
+import random
+import unittest
+import numpy as np
+from output import NullSink
+from rng import RandomService
+from shooting_game import Animal, Bear, Deer, Game
+from spawn_table import SpawnTable
+
+class TestSpawnTable(unittest.TestCase):
+    """Test cases for the SpawnTable class."""
+    def test_invalid_tables(self):
+        """Test that invalid animals or weights are rejected."""
+        with self.assertRaises(ValueError):
+            SpawnTable([])
+        with self.assertRaises(ValueError):
+            SpawnTable([Deer()], [1.0, 2.0])
+        with self.assertRaises(ValueError):
+            SpawnTable([Deer(), Bear()], [1.0, -1.0])
+        with self.assertRaises(ValueError):
+            SpawnTable([Deer(), Bear()], [0.0, 0.0])
+
+    def test_alias_columns_preserve_weights(self):
+        """Test that the alias table reproduces the weights exactly."""
+        weights = [5.0, 1.0, 0.0, 2.0, 12.0]
+        table = SpawnTable([Animal(points) for points in range(5)], weights)
+        n = len(weights)
+        implied = [0.0] * n
+        for column in range(n):
+            implied[column] += table._probability[column] / n
+            implied[table._alias[column]] += (1.0 - table._probability[column]) / n
+        for got, expected in zip(implied, table.weights):
+            self.assertAlmostEqual(got, expected)
+
+    def test_choose_frequencies(self):
+        """Test that single draws follow the weights."""
+        deer, bear = Deer(), Bear()
+        table = SpawnTable.from_weights({deer: 3.0, bear: 1.0})
+        rng = random.Random(1)
+        draws = [table.choose(rng) for _ in range(40_000)]
+        self.assertAlmostEqual(draws.count(deer) / len(draws), 0.75, delta=0.01)
+
+    def test_sample_vectorized(self):
+        """Test that batched samples follow the weights across many species."""
+        weights = np.arange(1, 301, dtype=float)
+        table = SpawnTable([Animal(i) for i in range(300)], weights)
+        indices = table.sample(600_000, rng=RandomService(2))
+        self.assertEqual(indices.shape, (600_000,))
+        counts = np.bincount(indices, minlength=300) / len(indices)
+        np.testing.assert_allclose(counts, weights / weights.sum(), atol=0.001)
+        self.assertEqual(len(table.sample_animals(5, rng=3)), 5)
+
+    def test_game_uses_spawn_table(self):
+        """Test that a Game with a spawn table draws from it."""
+        bear = Bear(sink=NullSink())
+        table = SpawnTable([Deer(sink=NullSink()), bear], [0.0, 1.0])
+        game = Game(sink=NullSink(), rng=RandomService(4), spawn_table=table)
+        self.assertEqual(game.animals, table.animals)
+        self.assertTrue(all(game.random_animal() is bear for _ in range(100)), "Only the bear has a weight.")
+
+
+if __name__ == '__main__':
+    unittest.main()
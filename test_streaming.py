@@ -0,0 +1,158 @@
+import unittest
+import numpy as np
+from output import NullSink
+from rng import RandomService
+from shooting_game import Animal, Game
+from streaming import GunHitRates, KLLSketch, PointsHistogram, ScoreSummary, StatsSink, SummaryError
+
+class TestKLLSketch(unittest.TestCase):
+    """Test cases for the quantile sketch."""
+    def setUp(self):
+        self.data = np.random.default_rng(1).normal(100.0, 30.0, 200_000)
+
+    def assertRanksClose(self, sketch, data, tolerance=0.01):
+        """Assert that the sketch's ranks are within tolerance of the exact ones."""
+        for q in (0.01, 0.1, 0.5, 0.9, 0.99):
+            self.assertAlmostEqual(sketch.rank(np.quantile(data, q)), q, delta=tolerance)
+
+    def test_quantiles_in_constant_memory(self):
+        """Test that a long stream is summarized accurately by a few hundred items."""
+        sketch = KLLSketch()
+        sketch.update_many(self.data)
+        self.assertEqual(sketch.count, len(self.data))
+        self.assertLess(sketch.retained, 3 * sketch.k)
+        self.assertRanksClose(sketch, self.data)
+        self.assertEqual(sketch.quantiles([0.0, 1.0]), [self.data.min(), self.data.max()])
+
+    def test_merge_in_any_grouping(self):
+        """Test that sketches built from parts and merged in different groupings agree with the stream."""
+        parts = []
+        for chunk in np.array_split(self.data, 8):
+            sketch = KLLSketch()
+            for value in chunk[:2000].tolist():
+                sketch.update(value)
+            sketch.update_many(chunk[2000:])
+            parts.append(sketch)
+        left = KLLSketch()
+        for sketch in parts:
+            left.merge(sketch)
+        pairs = [KLLSketch() for _ in range(4)]
+        for index, sketch in enumerate(parts):
+            pairs[index // 2].merge(sketch)
+        right = KLLSketch()
+        for sketch in reversed(pairs):
+            right.merge(sketch)
+        for merged in (left, right):
+            self.assertEqual(merged.count, len(self.data))
+            self.assertLess(merged.retained, 3 * merged.k)
+            self.assertRanksClose(merged, self.data)
+        with self.assertRaises(ValueError):
+            left.merge(KLLSketch(k=100))
+
+    def test_serialization(self):
+        """Test that a sketch round-trips through a few KB."""
+        sketch = KLLSketch()
+        sketch.update_many(self.data)
+        sketch.update(5.0)
+        data = sketch.to_bytes()
+        self.assertLess(len(data), 8192)
+        restored = KLLSketch.from_bytes(data)
+        self.assertEqual(restored.count, sketch.count)
+        self.assertEqual(restored.quantiles([0.5, 0.99]), sketch.quantiles([0.5, 0.99]))
+        with self.assertRaises(SummaryError):
+            KLLSketch.from_bytes(data[:-8])
+        with self.assertRaises(SummaryError):
+            KLLSketch.from_bytes(b"nope" + data[4:])
+
+    def test_empty(self):
+        """Test that an empty sketch has no quantiles."""
+        with self.assertRaises(ValueError):
+            KLLSketch().quantile(0.5)
+        self.assertEqual(KLLSketch().rank(3), 0.0)
+
+
+class TestCounters(unittest.TestCase):
+    """Test cases for the points histogram and hit rates."""
+    def test_points_histogram(self):
+        """Test exact per-shot counts, quantiles and merging."""
+        histogram = PointsHistogram()
+        histogram.update_many([0, 10, 10, 20])
+        other = PointsHistogram()
+        other.update(0, count=6)
+        histogram.merge(other)
+        self.assertEqual(histogram.counts, {0: 7, 10: 2, 20: 1})
+        self.assertEqual(histogram.shots, 10)
+        self.assertAlmostEqual(histogram.mean, 4.0)
+        self.assertEqual(histogram.quantile(0.5), 0)
+        self.assertEqual(histogram.quantile(0.9), 10)
+        self.assertEqual(histogram.quantile(1.0), 20)
+
+    def test_gun_hit_rates(self):
+        """Test that hit rates are counted per gun and merged."""
+        rates = GunHitRates()
+        rates.update("Rifle", 10, 8)
+        other = GunHitRates()
+        other.update("Rifle", 10, 6)
+        other.update("Shotgun", 4, 1)
+        rates.merge(other)
+        self.assertEqual(rates.rates(), {"Rifle": 0.7, "Shotgun": 0.25})
+        self.assertEqual(rates.rate("Pistol"), 0.0)
+
+
+class TestScoreSummary(unittest.TestCase):
+    """Test cases for whole-game summaries."""
+    def play(self, seed, gun):
+        """Play a game with a StatsSink and return the sink and game."""
+        sink = StatsSink()
+        game = Game(sink=sink, rng=RandomService(seed))
+        game.begin()
+        game.handle_input(gun)
+        for _ in range(50):
+            game.handle_input('1')
+        game.player.shoot_many(game.animals * 5)
+        game.handle_input('2')
+        return sink, game
+
+    def test_sink_records_games(self):
+        """Test that a game's shots, volleys and final score are summarized."""
+        sink, game = self.play(1, '1')
+        summary = sink.summary
+        self.assertEqual(summary.final_stats.count, 1)
+        self.assertEqual(summary.final_stats.total, game.player.points)
+        self.assertEqual(summary.shot_points.shots, 60)
+        self.assertEqual(summary.guns.guns["Rifle"][0], 60)
+        self.assertEqual(sum(points * count for points, count in summary.shot_points.counts.items()), game.player.points)
+
+    def test_zero_point_hits(self):
+        """Test that a hit on an animal worth no points still counts as a hit."""
+        sink = StatsSink()
+        game = Game(sink=sink, rng=RandomService(1))
+        game.animals = [Animal(0, sink=sink, name="Decoy")]
+        game.begin()
+        game.handle_input('1')
+        for _ in range(20):
+            game.handle_input('1')
+        game.handle_input('2')
+        shots, hits = sink.summary.guns.guns["Rifle"]
+        self.assertEqual(shots, 20)
+        self.assertGreater(hits, 0)
+        self.assertEqual(sink.summary.shot_points.counts, {0: 20})
+
+    def test_merge_and_serialize(self):
+        """Test that summaries of separate games merge and survive serialization."""
+        summaries = [self.play(seed, gun)[0].summary for seed, gun in [(1, '1'), (2, '2'), (3, '1')]]
+        merged = ScoreSummary()
+        for summary in summaries:
+            merged.merge(summary)
+        merged.record_games(np.array([0, 10_000]))
+        restored = ScoreSummary.from_bytes(merged.to_bytes())
+        self.assertEqual(restored.final_stats.count, 5)
+        self.assertEqual(restored.shot_points.counts, merged.shot_points.counts)
+        self.assertEqual(restored.guns.guns, merged.guns.guns)
+        self.assertEqual(restored.final_scores.quantile(1.0), 10_000)
+        self.assertEqual(restored.report(), merged.report())
+        self.assertIn("Final Score p50:", merged.report())
+
+
+if __name__ == '__main__':
+    unittest.main()
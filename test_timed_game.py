@@ -0,0 +1,95 @@
+import unittest
+from unittest.mock import patch
+from fakes import FakeClock
+from output import EventSink, NullSink
+from shooting_game import Bear, Deer, Rifle, Shotgun
+from timed_game import TimedGame
+from timers import TimerScheduler
+
+class TestTimedGame(unittest.TestCase):
+    """Test cases for reloads, visibility windows and timed spawns."""
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = TimerScheduler(self.clock)
+        self.sink = EventSink()
+        self.game = TimedGame(self.scheduler, spawn_interval=1.0, sink=self.sink)
+        self.game.animals = [Deer(sink=self.sink)]
+        self.game.begin()
+        self.game.handle_input('1') # Rifle
+
+    def events(self, name):
+        return [event for event in self.sink.events if event["event"] == name]
+
+    def test_timing_attributes(self):
+        """Test the magazine, reload and visibility defaults of the gun and animal subclasses."""
+        self.assertEqual((Rifle.magazine_size, Rifle.reload_time), (5, 2.0))
+        self.assertEqual((Shotgun.magazine_size, Shotgun.reload_time), (2, 1.5))
+        self.assertLess(Deer.visible_for, Bear.visible_for)
+
+    def test_animals_spawn_and_leave_on_time(self):
+        """Test that animals appear every interval and leave when their window ends."""
+        self.clock.now = 2.5
+        self.scheduler.run_due()
+        self.assertEqual(len(self.game.in_sight), 2)
+        self.clock.now = 4.0
+        self.scheduler.run_due()
+        self.assertEqual(len(self.events("animal_left")), 1, "The first deer should leave 3 seconds after appearing.")
+        self.assertEqual(len(self.game.in_sight), 3)
+
+    def test_shooting_hits_oldest_animal_in_sight(self):
+        """Test that a hit removes the animal and cancels its window, and empty shots find nothing."""
+        with patch('random.random', return_value=0.0):
+            self.game.handle_input('1')
+            self.assertEqual(self.events("nothing_in_sight")[-1]["event"], "nothing_in_sight")
+            self.clock.now = 1.0
+            self.game.handle_input('1')
+        self.assertEqual(self.game.player.points, 10)
+        self.assertEqual(self.game.in_sight, [])
+        self.clock.now = 10.0
+        self.scheduler.run_due()
+        self.assertEqual(len(self.events("animal_appear")), 10)
+        self.assertEqual(len(self.events("animal_left")), 6, "Deer that appeared at 2 to 7 seconds leave; the hit one never does.")
+
+    def test_reload(self):
+        """Test that an empty magazine blocks shots until the reload time has passed."""
+        with patch('random.random', return_value=0.99):
+            for _ in range(5):
+                self.game.handle_input('1')
+            self.assertTrue(self.game.magazine.reloading)
+            self.game.handle_input('1')
+            self.assertEqual(len(self.events("reloading")), 1)
+            self.clock.now = 2.0
+            self.game.handle_input('1')
+        self.assertEqual(len(self.events("reloaded")), 1)
+        self.assertEqual(self.game.magazine.rounds, 4)
+        self.assertEqual(len(self.events("shot_miss")), 6, "The blocked shot should not be fired.")
+
+    def test_end_game_cancels_timers(self):
+        """Test that ending the game leaves no timers behind."""
+        with patch('random.random', return_value=0.99):
+            for _ in range(5):
+                self.game.handle_input('1')
+        self.clock.now = 1.5
+        self.game.handle_input('2')
+        self.assertFalse(self.game.is_game_running)
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_many_games_share_a_scheduler(self):
+        """Test that thousands of games run their timers off one scheduler."""
+        games = [TimedGame(self.scheduler, spawn_interval=0.5 + index % 3, sink=NullSink()) for index in range(2000)]
+        for game in games:
+            game.begin()
+            game.handle_input('2') # Shotgun
+        for step in range(1, 41):
+            self.clock.now = step * 0.25
+            self.scheduler.run_due()
+        self.assertGreater(len(self.scheduler), 2000)
+        self.assertTrue(all(len(game.in_sight) <= 12 for game in games))
+        for game in games:
+            game.handle_input('2')
+        self.game.handle_input('2')
+        self.assertEqual(len(self.scheduler), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
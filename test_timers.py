@@ -0,0 +1,94 @@
+import unittest
+from fakes import FakeClock
+from timers import TimerScheduler
+
+class TestTimerScheduler(unittest.TestCase):
+    """Test cases for the heap-based timer scheduler."""
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = TimerScheduler(self.clock)
+        self.fired = []
+
+    def test_runs_due_timers_in_deadline_order(self):
+        """Test that only due timers run, earliest first and ties in scheduling order."""
+        self.scheduler.call_later(3, self.fired.append, 'c')
+        self.scheduler.call_later(1, self.fired.append, 'a')
+        self.scheduler.call_later(1, self.fired.append, 'b')
+        self.assertEqual(self.scheduler.run_due(), 0)
+        self.clock.now = 2
+        self.assertEqual(self.scheduler.run_due(), 2)
+        self.assertEqual(self.fired, ['a', 'b'])
+        self.assertEqual(len(self.scheduler), 1)
+        self.assertEqual(self.scheduler.next_deadline(), 3)
+
+    def test_cancel(self):
+        """Test that cancelled timers never run and cancelling twice or after running is harmless."""
+        timers = [self.scheduler.call_later(index, self.fired.append, index) for index in range(1, 201)]
+        for timer in timers[::2]:
+            timer.cancel()
+            timer.cancel()
+        self.assertEqual(len(self.scheduler), 100)
+        self.assertLessEqual(len(self.scheduler._heap), 200, "Cancelled entries should be dropped once they dominate.")
+        self.clock.now = 1000
+        self.scheduler.run_due()
+        self.assertEqual(self.fired, list(range(2, 201, 2)))
+        timers[1].cancel()
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertIsNone(self.scheduler.next_deadline())
+
+    def test_cancel_from_callback(self):
+        """Test that a callback cancelling enough timers to compact the heap leaves later timers intact."""
+        doomed = [self.scheduler.call_at(50, self.fired.append, 'doomed') for _ in range(100)]
+        self.scheduler.call_at(1, lambda: [timer.cancel() for timer in doomed])
+        tick = self.scheduler.call_every(1, self.fired.append, 'tick', first=1)
+        for now, expected in ((1, 2), (1.5, 0), (2.5, 1)):
+            self.clock.now = now
+            self.assertEqual(self.scheduler.run_due(), expected, f"Wrong number of timers run at {now}.")
+        self.assertEqual(self.fired, ['tick', 'tick'], "The repeating timer should run at 1 and 2 only.")
+        self.assertEqual(tick.deadline, 3)
+        self.assertEqual(len(self.scheduler), 1)
+        tick.cancel()
+        self.clock.now = 100
+        self.assertEqual(self.scheduler.run_due(), 0)
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_repeating_timer_keeps_its_period(self):
+        """Test that a repeating timer runs once per period, catching up without drifting."""
+        timer = self.scheduler.call_every(2, self.fired.append, 'tick', first=1)
+        self.clock.now = 6.5
+        self.assertEqual(self.scheduler.run_due(), 3, "Runs at 1, 3 and 5 should all happen.")
+        self.assertEqual(timer.deadline, 7)
+        timer.cancel()
+        self.clock.now = 100
+        self.assertEqual(self.scheduler.run_due(), 0)
+        with self.assertRaises(ValueError):
+            self.scheduler.call_every(0, print)
+
+    def test_callbacks_can_schedule(self):
+        """Test that timers scheduled by a callback run in the same pass when they are due."""
+        self.scheduler.call_later(1, lambda: self.scheduler.call_later(0, self.fired.append, 'chained'))
+        self.clock.now = 1
+        self.assertEqual(self.scheduler.run_due(), 2)
+        self.assertEqual(self.fired, ['chained'])
+
+    def test_run_sleeps_until_each_deadline(self):
+        """Test that run() waits for each timer in turn and stops when none are left or asked to."""
+        for delay in (5, 1, 3):
+            self.scheduler.call_later(delay, lambda: self.fired.append(self.clock.now))
+        self.assertEqual(self.scheduler.run(sleep=self.clock.sleep), 3)
+        self.assertEqual(self.fired, [1, 3, 5])
+        self.scheduler.call_every(1, self.fired.append, 'tick')
+        self.scheduler.run(stop=lambda: len(self.fired) >= 6, sleep=self.clock.sleep)
+        self.assertEqual(len(self.fired), 6)
+
+    def test_many_timers(self):
+        """Test that a hundred thousand timers run in deadline order."""
+        for index in range(100_000):
+            self.scheduler.call_at((index * 7919) % 100_000, self.fired.append, (index * 7919) % 100_000)
+        self.clock.now = 100_000
+        self.scheduler.run_due()
+        self.assertEqual(self.fired, list(range(100_000)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import patch
+import io # For capturing print output
+import shooting_game
+from tournament import BotStrategy, ScriptedStrategy, StrategyError, TournamentReport, SessionResult, play_session, run_tournament
+
+class TestStrategies(unittest.TestCase):
+    """Test cases for the scripted and bot strategies."""
+    def test_bot_commands(self):
+        """Test that the bot chooses a gun, shoots and ends the game."""
+        self.assertEqual(list(BotStrategy(gun_choice=2, shots=3).commands()), ['2', '1', '1', '1', '2'])
+
+    def test_scripted_input_ends_when_exhausted(self):
+        """Test that a scripted input answers '2' once the script runs out."""
+        read = ScriptedStrategy(['1']).make_input()
+        self.assertEqual(read("Enter your choice: "), '1')
+        self.assertEqual(read("Enter your action: "), '2', "An exhausted script should end the game.")
+
+    def test_exhausted_script_cannot_stall_gun_choice(self):
+        """Test that a script running out while '2' is not a valid gun raises instead of looping."""
+        from catalog import parse_catalog
+        from output import NullSink
+        catalog = parse_catalog({"guns": [{"name": "Bow", "accuracy": 0.5}], "animals": [{"name": "Hare", "points": 5}]})
+        game = shooting_game.Game(sink=NullSink(), catalog=catalog, input_func=ScriptedStrategy(['7']).make_input())
+        with self.assertRaises(StrategyError):
+            game.start_game()
+
+class TestTournament(unittest.TestCase):
+    """Test cases for the tournament runner."""
+    def test_play_session_deterministic(self):
+        """Test that a session depends only on the master seed and its index."""
+        strategy = BotStrategy(gun_choice=2, shots=30)
+        self.assertEqual(play_session(strategy, 7, 3), play_session(strategy, 7, 3))
+        self.assertNotEqual(play_session(strategy, 7, 3).points, play_session(strategy, 7, 4).points, "Sessions should use different streams.")
+
+    def test_play_session(self):
+        """Test that a bot session records its gun, shots and points."""
+        result = play_session(BotStrategy(gun_choice=1, shots=20), master_seed=1, index=0)
+        self.assertEqual(result.gun, "Rifle", "The bot should have chosen the first gun.")
+        self.assertEqual(result.shots, 20, "Every scripted shot should be fired.")
+        self.assertLessEqual(result.hits, 20)
+        self.assertEqual(result.points % 10, 0, "Points should be a multiple of the animal values.")
+
+    def test_results_independent_of_workers(self):
+        """Test that one worker and several workers give identical reports."""
+        strategy = BotStrategy(gun_choice=2, shots=15)
+        single = run_tournament(40, strategy, master_seed=123, workers=1)
+        pooled = run_tournament(40, strategy, master_seed=123, workers=3, chunk_size=7)
+        self.assertEqual(single.results, pooled.results, "Results should not depend on the number of workers.")
+        self.assertEqual(single.summary(), pooled.summary())
+
+    def test_report_aggregates(self):
+        """Test the aggregate statistics of a report."""
+        report = TournamentReport([
+            SessionResult(1, "Shotgun", 20, 4, 2),
+            SessionResult(0, "Rifle", 30, 4, 3),
+        ])
+        self.assertEqual([result.index for result in report.results], [0, 1], "Results should be ordered by index.")
+        self.assertEqual(report.total_points, 50)
+        self.assertEqual(report.mean_points, 25.0)
+        self.assertEqual(report.hit_rate, 5 / 8)
+        self.assertEqual(report.points_by_gun(), {"Rifle": 30.0, "Shotgun": 20.0})
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_main_tournament_command(self, mock_stdout):
+        """Test that main() runs a tournament from command-line arguments."""
+        shooting_game.main(["tournament", "--sessions", "5", "--workers", "1", "--shots", "3"])
+        self.assertIn("Sessions: 5", mock_stdout.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
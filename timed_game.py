@@ -0,0 +1,215 @@
+"""
+A Game with reloads, visibility windows and timed spawns.
+
+In a TimedGame animals no longer appear only when the player shoots: a
+repeating timer spawns one every spawn_interval seconds, and each stays in
+sight for its species' visible_for seconds before it gets away. Shooting hits
+at the animal that has been in sight longest, and uses a round of the gun's
+magazine; once the magazine is empty the gun reloads for its reload_time.
+
+All of this runs on a TimerScheduler, which many TimedGames can share. Due
+timers run before every action, so a game driven by input() or by a server
+behaves as if the timers had fired on time, without a thread or sleep loop of
+its own; a server may also call scheduler.run() to fire them as they come due.
+"""
+from typing import Any, List, Optional
+
+from output import OutputSink
+from shooting_game import Animal, Game, Gun
+from timers import Timer, TimerScheduler
+
+
+class Magazine:
+    """
+    The rounds left in a gun and its reload timer.
+
+    Attributes:
+        gun (Gun): The gun the magazine belongs to.
+        rounds (Optional[int]): The rounds left, or None for a gun without a magazine.
+    """
+    def __init__(self, gun: Gun, scheduler: TimerScheduler, sink: OutputSink):
+        """
+        Initializes a full Magazine instance.
+
+        Args:
+            gun: The gun, whose magazine_size and reload_time are used.
+            scheduler: Runs the reload timer.
+            sink: Where reload messages are written.
+        """
+        self.gun: Gun = gun
+        self.rounds: Optional[int] = gun.magazine_size
+        self._scheduler: TimerScheduler = scheduler
+        self._sink: OutputSink = sink
+        self._reload: Optional[Timer] = None
+
+    @property
+    def reloading(self) -> bool:
+        """Whether the gun is being reloaded."""
+        return self._reload is not None
+
+    def take(self) -> bool:
+        """
+        Uses a round, starting a reload once the magazine is empty.
+
+        Returns:
+            False if the gun is being reloaded and cannot fire, True otherwise.
+        """
+        if self.rounds is None:
+            return True
+        if self._reload is not None:
+            remaining: float = self._reload.deadline - self._scheduler.clock()
+            self._sink.emit("reloading", "Still reloading, {seconds:.1f}s left.", seconds=max(0.0, remaining))
+            return False
+        self.rounds -= 1
+        if self.rounds == 0:
+            self._reload = self._scheduler.call_later(self.gun.reload_time, self._refill)
+            self._sink.emit("reload_started", "Out of ammo! Reloading the {gun}.", gun=self.gun.name, seconds=self.gun.reload_time)
+        return True
+
+    def _refill(self) -> None:
+        """Ends the reload."""
+        self.rounds = self.gun.magazine_size
+        self._reload = None
+        self._sink.emit("reloaded", "The {gun} is reloaded.", gun=self.gun.name)
+
+    def cancel(self) -> None:
+        """Stops a reload in progress."""
+        if self._reload is not None:
+            self._reload.cancel()
+            self._reload = None
+
+
+class Sighting:
+    """
+    An animal in sight and the timer that makes it leave.
+
+    Attributes:
+        animal (Animal): The animal.
+        timer (Timer): Runs when the animal's visibility window ends.
+    """
+    __slots__ = ("animal", "timer")
+
+    def __init__(self, animal: Animal, timer: Timer):
+        self.animal: Animal = animal
+        self.timer: Timer = timer
+
+
+class TimedGame(Game):
+    """
+    A Game whose animals appear and leave on timers and whose guns need reloading.
+
+    Attributes:
+        scheduler (TimerScheduler): Runs the game's timers; may be shared between games.
+        spawn_interval (float): Seconds between two animals appearing.
+        in_sight (List[Sighting]): The animals in sight, longest in sight first.
+        magazine (Optional[Magazine]): The selected gun's magazine, once a gun is chosen.
+    """
+    def __init__(self, scheduler: TimerScheduler, spawn_interval: float = 2.0, **game_options: Any):
+        """
+        Initializes a TimedGame instance.
+
+        Args:
+            scheduler: Runs the game's timers.
+            spawn_interval: Seconds between two animals appearing.
+            **game_options: Game arguments, such as sink, rng or catalog.
+
+        Raises:
+            ValueError: If spawn_interval is not positive.
+        """
+        if spawn_interval <= 0:
+            raise ValueError("spawn_interval must be positive.")
+        super().__init__(**game_options)
+        self.scheduler: TimerScheduler = scheduler
+        self.spawn_interval: float = spawn_interval
+        self.in_sight: List[Sighting] = []
+        self.magazine: Optional[Magazine] = None
+        self._spawner: Optional[Timer] = None
+
+    def start_game(self) -> None:
+        """Starts the spawn timer, then plays like Game.start_game."""
+        self._start_timers()
+        super().start_game()
+
+    def begin(self) -> None:
+        """Starts the spawn timer, then starts like Game.begin."""
+        self._start_timers()
+        super().begin()
+
+    def _start_timers(self) -> None:
+        """Starts spawning animals."""
+        if self._spawner is None:
+            self._spawner = self.scheduler.call_every(self.spawn_interval, self._spawn)
+
+    def _spawn(self) -> None:
+        """Brings a random animal into sight for its visibility window."""
+        appeared: float = self._spawner.deadline - self.spawn_interval # When it was due, even if the timers ran late
+        animal: Animal = self.random_animal()
+        animal.appear()
+        sighting = Sighting(animal, None)
+        sighting.timer = self.scheduler.call_at(appeared + animal.visible_for, self._leave, sighting)
+        self.in_sight.append(sighting)
+
+    def _leave(self, sighting: Sighting) -> None:
+        """Ends an animal's visibility window."""
+        self.in_sight.remove(sighting)
+        self.sink.emit("animal_left", "The {animal} got away.", animal=sighting.animal.name)
+
+    def handle_action(self, choice: str) -> None:
+        """
+        Runs the timers that are due, then performs one action.
+
+        Args:
+            choice: '1' to shoot at the animal in sight longest, '2' to end the game.
+        """
+        self.scheduler.run_due()
+        if choice == '1':
+            self.shoot()
+        else:
+            super().handle_action(choice)
+
+    def shoot(self) -> bool:
+        """
+        Fires at the animal that has been in sight longest.
+
+        A hit animal leaves the field; a missed one stays until its window ends.
+
+        Returns:
+            True if an animal was hit.
+        """
+        gun: Optional[Gun] = self.player.selected_gun
+        if gun is None:
+            return self.player.shoot(None)
+        if self.magazine is None or self.magazine.gun is not gun:
+            self.magazine = Magazine(gun, self.scheduler, self.sink)
+        if not self.magazine.take():
+            return False
+        if not self.in_sight:
+            self.sink.emit("nothing_in_sight", "There is nothing in sight.")
+            return self.player.shoot(None)
+        sighting: Sighting = self.in_sight[0]
+        hit: bool = self.player.shoot(sighting.animal)
+        if hit:
+            sighting.timer.cancel()
+            self.in_sight.pop(0)
+        return hit
+
+    def display_options(self) -> None:
+        """Shows the animals in sight and the rounds left above the options menu."""
+        names: str = ", ".join(sighting.animal.name for sighting in self.in_sight) or "nothing"
+        rounds: str = "unlimited" if self.magazine is None or self.magazine.rounds is None else str(self.magazine.rounds)
+        if self.magazine is not None and self.magazine.reloading:
+            rounds = "reloading"
+        self.sink.emit("status", "In sight: {animals} | Ammo: {rounds}", animals=names, rounds=rounds)
+        super().display_options()
+
+    def end_game(self) -> None:
+        """Stops every timer of the game, then ends it like Game.end_game."""
+        if self._spawner is not None:
+            self._spawner.cancel()
+            self._spawner = None
+        for sighting in self.in_sight:
+            sighting.timer.cancel()
+        self.in_sight.clear()
+        if self.magazine is not None:
+            self.magazine.cancel()
+        super().end_game()
@@ -0,0 +1,180 @@
+"""
+A single-threaded timer scheduler backed by a binary heap.
+
+Every timer of every session lives in one heap ordered by deadline, so
+scheduling a timer costs O(log n) and running one costs O(log n), however many
+timers are pending. Nothing sleeps or spawns a thread per timer: whoever owns the
+scheduler calls run_due() (e.g. before handling a command) or run() to wait for
+the next deadline itself, and every timer that has come due runs then, in
+deadline order.
+
+Cancelling a timer only marks it; cancelled entries are skipped when they reach
+the top of the heap, and the heap is rebuilt without them once they make up
+more than half of it, so cancellation is amortized O(1).
+"""
+import heapq
+import itertools
+import time
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+
+class Timer:
+    """
+    A callback scheduled to run at a deadline, optionally repeating.
+
+    Attributes:
+        deadline (float): When the timer runs next, on the scheduler's clock.
+        interval (Optional[float]): The period of a repeating timer, or None.
+        cancelled (bool): Whether the timer was cancelled.
+    """
+    __slots__ = ("deadline", "interval", "cancelled", "_callback", "_args", "_scheduler")
+
+    def __init__(self, scheduler: "TimerScheduler", deadline: float, interval: Optional[float], callback: Callable[..., Any], args: Tuple[Any, ...]):
+        """Initializes a Timer instance; use the scheduler's call_* methods instead."""
+        self.deadline: float = deadline
+        self.interval: Optional[float] = interval
+        self.cancelled: bool = False
+        self._callback: Callable[..., Any] = callback
+        self._args: Tuple[Any, ...] = args
+        self._scheduler: "TimerScheduler" = scheduler
+
+    def cancel(self) -> None:
+        """Stops the timer from running; does nothing if it already ran or was cancelled."""
+        if not self.cancelled:
+            self.cancelled = True
+            self._scheduler._cancelled_one()
+
+
+class TimerScheduler:
+    """
+    Runs timers from many sessions off one heap.
+
+    Attributes:
+        clock (Callable[[], float]): Returns the current time in seconds.
+    """
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initializes an empty TimerScheduler instance.
+
+        Args:
+            clock: Returns the current time in seconds.
+        """
+        self.clock: Callable[[], float] = clock
+        self._heap: List[Tuple[float, int, Timer]] = []
+        self._order: Iterator[int] = itertools.count() # Breaks ties so timers due together run in scheduling order
+        self._cancelled: int = 0
+
+    def __len__(self) -> int:
+        """Returns the number of pending timers."""
+        return len(self._heap) - self._cancelled
+
+    def call_at(self, deadline: float, callback: Callable[..., Any], *args: Any) -> Timer:
+        """
+        Schedules a callback at a point in time.
+
+        Args:
+            deadline: When to run, on the scheduler's clock.
+            callback: Called with args when the timer runs.
+
+        Returns:
+            The timer, which can be cancelled.
+        """
+        return self._push(Timer(self, deadline, None, callback, args))
+
+    def call_later(self, delay: float, callback: Callable[..., Any], *args: Any) -> Timer:
+        """Schedules a callback delay seconds from now, see call_at()."""
+        return self.call_at(self.clock() + delay, callback, *args)
+
+    def call_every(self, interval: float, callback: Callable[..., Any], *args: Any, first: Optional[float] = None) -> Timer:
+        """
+        Schedules a callback to run every interval seconds until cancelled.
+
+        Each run is scheduled from the previous deadline, not from when it ran,
+        so a late run does not push back the ones after it.
+
+        Args:
+            interval: Seconds between two runs.
+            callback: Called with args on every run.
+            first: Seconds until the first run. Defaults to interval.
+
+        Raises:
+            ValueError: If interval is not positive.
+
+        Returns:
+            The timer, which can be cancelled.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive.")
+        deadline: float = self.clock() + (interval if first is None else first)
+        return self._push(Timer(self, deadline, interval, callback, args))
+
+    def _push(self, timer: Timer) -> Timer:
+        """Adds a timer to the heap."""
+        heapq.heappush(self._heap, (timer.deadline, next(self._order), timer))
+        return timer
+
+    def _cancelled_one(self) -> None:
+        """Counts a cancelled timer and drops cancelled entries once they are most of the heap."""
+        self._cancelled += 1
+        if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+            # Rebuilt in place, as run_due() may be iterating over the heap when a callback cancels
+            self._heap[:] = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def next_deadline(self) -> Optional[float]:
+        """Returns when the next pending timer runs, or None if there is none."""
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+            self._cancelled -= 1
+        return heap[0][0] if heap else None
+
+    def run_due(self, now: Optional[float] = None) -> int:
+        """
+        Runs every timer whose deadline has passed, earliest first.
+
+        Timers scheduled by the callbacks run in the same call if they are due too.
+
+        Args:
+            now: The current time. Defaults to the clock.
+
+        Returns:
+            The number of timers run.
+        """
+        now = self.clock() if now is None else now
+        heap = self._heap
+        ran: int = 0
+        while heap and heap[0][0] <= now:
+            _, _, timer = heapq.heappop(heap)
+            if timer.cancelled:
+                self._cancelled -= 1
+                continue
+            if timer.interval is not None:
+                timer.deadline += timer.interval
+                heapq.heappush(heap, (timer.deadline, next(self._order), timer))
+            else:
+                timer.cancelled = True # Already off the heap, so cancelling it later must not be counted
+            timer._callback(*timer._args)
+            ran += 1
+        return ran
+
+    def run(self, stop: Callable[[], bool] = lambda: False, sleep: Callable[[float], None] = time.sleep) -> int:
+        """
+        Waits for and runs timers until none are left or stop() returns True.
+
+        Args:
+            stop: Checked after every batch of timers.
+            sleep: Waits for a number of seconds.
+
+        Returns:
+            The number of timers run.
+        """
+        ran: int = 0
+        while not stop():
+            deadline: Optional[float] = self.next_deadline()
+            if deadline is None:
+                break
+            sleep(max(0.0, deadline - self.clock()))
+            ran += self.run_due()
+        return ran
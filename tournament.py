@@ -0,0 +1,264 @@
+"""
+Parallel tournament runner for bot-driven Game sessions.
+
+Each session plays a full Game with a strategy answering the prompts in place of
+``input()``. Every session draws from its own substream of the master seed,
+identified by the session's index alone, so the merged report does not depend on
+how many worker processes played the sessions.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from output import NullSink
+from rng import RandomService
+from shooting_game import Game
+
+
+class StrategyError(Exception):
+    """Raised when a strategy runs out of commands before its game has ended."""
+
+
+class Strategy:
+    """Supplies the commands a Game would otherwise read with input()."""
+    def commands(self) -> Iterator[str]:
+        """
+        Yields the commands for one session, starting with the gun choice.
+
+        This method should be implemented by subclasses.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement this method.
+        """
+        raise NotImplementedError("Subclass must implement this method")
+
+    def make_input(self) -> Callable[[str], str]:
+        """
+        Creates an input function for a single session.
+
+        Once the commands run out the game is ended by answering "2". If the game
+        asks again, e.g. because "2" was not a valid gun, the function raises
+        instead of letting the game prompt forever.
+
+        Returns:
+            A function that ignores the prompt and returns the next command.
+        """
+        commands: Iterator[str] = self.commands()
+        exhausted: bool = False
+
+        def read(prompt: str) -> str:
+            nonlocal exhausted
+            command: Optional[str] = next(commands, None)
+            if command is not None:
+                return command
+            if exhausted:
+                raise StrategyError("The strategy ran out of commands before the game ended.")
+            exhausted = True
+            return "2"
+        return read
+
+
+class ScriptedStrategy(Strategy):
+    """
+    Plays a fixed list of commands.
+
+    Attributes:
+        script (List[str]): The commands, starting with the gun choice.
+    """
+    def __init__(self, script: Sequence[str]):
+        """
+        Initializes a ScriptedStrategy instance.
+
+        Args:
+            script: The commands, starting with the gun choice.
+        """
+        self.script: List[str] = list(script)
+
+    def commands(self) -> Iterator[str]:
+        """Yields the scripted commands in order."""
+        return iter(self.script)
+
+
+class BotStrategy(Strategy):
+    """
+    Chooses a gun, shoots a fixed number of times and then ends the game.
+
+    Attributes:
+        gun_choice (int): The menu number of the gun to choose.
+        shots (int): The number of shots fired before ending the game.
+    """
+    def __init__(self, gun_choice: int = 1, shots: int = 10):
+        """
+        Initializes a BotStrategy instance.
+
+        Args:
+            gun_choice: The menu number of the gun to choose.
+            shots: The number of shots fired before ending the game.
+        """
+        self.gun_choice: int = gun_choice
+        self.shots: int = shots
+
+    def commands(self) -> Iterator[str]:
+        """Yields the gun choice, one "1" per shot and a final "2"."""
+        yield str(self.gun_choice)
+        for _ in range(self.shots):
+            yield "1"
+        yield "2"
+
+
+class _ShotCounter(NullSink):
+    """Discards output but counts the shots fired and hit."""
+    def __init__(self):
+        """Initializes a _ShotCounter instance with no shots counted."""
+        self.shots: int = 0
+        self.hits: int = 0
+
+    def emit(self, event: str, template: str, **fields) -> None:
+        """Counts the shots and hits of single shots and volleys, discarding every message."""
+        if event == "shot_hit":
+            self.shots += 1
+            self.hits += 1
+        elif event == "shot_miss":
+            self.shots += 1
+        elif event == "volley":
+            self.shots += fields["shots"]
+            self.hits += fields["hits"]
+
+
+class SessionResult(NamedTuple):
+    """The outcome of one tournament session."""
+    index: int
+    gun: str
+    points: int
+    shots: int
+    hits: int
+
+
+def play_session(strategy: Strategy, master_seed: int, index: int) -> SessionResult:
+    """
+    Plays one headless session.
+
+    Args:
+        strategy: Supplies the session's commands.
+        master_seed: The non-negative seed of the whole tournament.
+        index: The index of the session within the tournament.
+
+    Returns:
+        The outcome of the session.
+    """
+    counter = _ShotCounter()
+    rng = RandomService(master_seed).substream(index)
+    game = Game(sink=counter, rng=rng, input_func=strategy.make_input())
+    game.start_game()
+    return SessionResult(index, game.player.selected_gun.name, game.player.points, counter.shots, counter.hits)
+
+
+def _play_block(strategy: Strategy, master_seed: int, start: int, stop: int) -> List[SessionResult]:
+    """Plays the sessions with indices in [start, stop) in the calling process."""
+    return [play_session(strategy, master_seed, index) for index in range(start, stop)]
+
+
+class TournamentReport:
+    """
+    The merged outcome of a tournament.
+
+    Attributes:
+        results (List[SessionResult]): The outcome of every session, ordered by index.
+    """
+    def __init__(self, results: Sequence[SessionResult]):
+        """
+        Initializes a TournamentReport instance.
+
+        Args:
+            results: The outcome of every session, in any order.
+        """
+        self.results: List[SessionResult] = sorted(results, key=lambda result: result.index)
+
+    @property
+    def sessions(self) -> int:
+        """The number of sessions played."""
+        return len(self.results)
+
+    @property
+    def total_points(self) -> int:
+        """The sum of the final scores of all sessions."""
+        return sum(result.points for result in self.results)
+
+    @property
+    def mean_points(self) -> float:
+        """The average final score, or 0.0 without sessions."""
+        return self.total_points / self.sessions if self.results else 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of all shots that hit, or 0.0 without shots."""
+        shots: int = sum(result.shots for result in self.results)
+        return sum(result.hits for result in self.results) / shots if shots else 0.0
+
+    def points_by_gun(self) -> Dict[str, float]:
+        """
+        Averages the final score per gun.
+
+        Returns:
+            A mapping from gun name to the average final score of sessions using it.
+        """
+        totals: Dict[str, List[int]] = {}
+        for result in self.results:
+            totals.setdefault(result.gun, []).append(result.points)
+        return {gun: sum(points) / len(points) for gun, points in sorted(totals.items())}
+
+    def summary(self) -> str:
+        """
+        Formats the report for the console.
+
+        Returns:
+            A multi-line, human-readable summary.
+        """
+        points: List[int] = [result.points for result in self.results]
+        lines: List[str] = [
+            f"Sessions: {self.sessions}",
+            f"Total Points: {self.total_points}",
+            f"Mean Points: {self.mean_points:.2f}",
+            f"Min/Max Points: {min(points, default=0)}/{max(points, default=0)}",
+            f"Hit Rate: {self.hit_rate:.2%}",
+        ]
+        for gun, mean in self.points_by_gun().items():
+            lines.append(f"  {gun}: {mean:.2f} points on average")
+        return "\n".join(lines)
+
+
+def run_tournament(
+    n_sessions: int,
+    strategy: Strategy,
+    master_seed: int = 0,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> TournamentReport:
+    """
+    Plays n_sessions independent sessions across a pool of worker processes.
+
+    Args:
+        n_sessions: The number of sessions to play.
+        strategy: Supplies the commands of every session. Must be picklable.
+        master_seed: The non-negative seed every session's substream is derived from.
+        workers: The number of worker processes. Defaults to the number of cores;
+            1 plays every session in the calling process.
+        chunk_size: The number of sessions handed to a worker at a time.
+
+    Returns:
+        The merged report, identical for any number of workers.
+    """
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    if workers <= 1 or n_sessions <= 1:
+        return TournamentReport(_play_block(strategy, master_seed, 0, n_sessions))
+
+    if chunk_size is None:
+        # A few chunks per worker keeps the pool balanced without much overhead
+        chunk_size = max(1, -(-n_sessions // (workers * 4)))
+    starts: List[int] = list(range(0, n_sessions, chunk_size))
+    stops: List[int] = [min(start + chunk_size, n_sessions) for start in starts]
+    results: List[SessionResult] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for block in pool.map(_play_block, [strategy] * len(starts), [master_seed] * len(starts), starts, stops):
+            results.extend(block)
+    return TournamentReport(results)